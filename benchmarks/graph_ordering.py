@@ -0,0 +1,119 @@
+"""
+Processor block time with the graph orders of the H3 models.
+
+The message passing gathers the sender and receiver features of every edge and scatters the
+messages to the receivers, hence its memory accesses follow the order of the edges and of the
+nodes. The measurements are the forward and backward times, median of --repeats runs, of:
+- the gathers and scatter of the message passing alone, and of one processor block, on the
+  latent graph of --resolution with the edges as built (by sender), in a random order, and
+  sorted by receiver then sender (reorder=True).
+- the encoder and decoder of a 2 degree grid whose points are given in a random order, e.g. as
+  gathered from several sources, with and without reorder.
+
+Usage:
+    python benchmarks/graph_ordering.py --resolution 3 --dim 64
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+from torch_scatter import scatter_sum
+
+from graph_weather.models import Decoder, Encoder
+from graph_weather.models.layers.graph_net_block import GraphProcessor, sort_edges
+
+
+def median_time(function, repeats):
+    """Return the median time of the forward and backward of function, in ms."""
+    function().sum().backward()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function().sum().backward()
+        timings.append(time.perf_counter() - start)
+    return 1e3 * np.median(timings)
+
+
+def processor_block(args):
+    """Time one processor block on the latent graph with the three edge orders."""
+    lat_lons = [(lat, lon) for lat in range(-90, 90, 5) for lon in range(0, 360, 5)]
+    latent_graph = Encoder(lat_lons, resolution=args.resolution).latent_graph
+    num_nodes = int(latent_graph.edge_index.max()) + 1
+    shuffle = torch.from_numpy(np.random.default_rng(0).permutation(latent_graph.num_edges))
+    graphs = {
+        "as built": latent_graph,
+        "random": latent_graph.__class__(
+            edge_index=latent_graph.edge_index[:, shuffle],
+            edge_attr=latent_graph.edge_attr[shuffle],
+        ),
+        "sorted": sort_edges(latent_graph),
+    }
+    block = GraphProcessor(1, args.dim, args.dim, args.dim, args.dim)
+    x = torch.randn((num_nodes, args.dim), requires_grad=True)
+    print(f"processor block, {num_nodes} nodes, {latent_graph.num_edges} edges, dim {args.dim}")
+    for name, graph in graphs.items():
+        senders, receivers = graph.edge_index
+        edge_attr = torch.randn((graph.num_edges, args.dim), requires_grad=True)
+        messages = median_time(
+            lambda: scatter_sum(x[senders] * x[receivers], receivers, dim=0, dim_size=num_nodes),
+            args.repeats,
+        )
+        elapsed = median_time(lambda: block(x, graph.edge_index, edge_attr)[0], args.repeats)
+        print(f"  {name:>9}: gather/scatter {messages:7.1f} ms, block {elapsed:7.1f} ms")
+
+
+def encoder_decoder(args):
+    """Time the encoder and decoder of a shuffled 2 degree grid, with and without reorder."""
+    lat_lons = [(lat, lon) for lat in range(-90, 90, 2) for lon in range(0, 360, 2)]
+    lat_lons = [lat_lons[i] for i in np.random.default_rng(0).permutation(len(lat_lons))]
+    features = torch.randn((1, len(lat_lons), args.features))
+    print(f"encoder and decoder, {len(lat_lons)} shuffled points, resolution {args.resolution}")
+    for reorder in (False, True):
+        torch.manual_seed(0)
+        kwargs = dict(resolution=args.resolution, reorder=reorder)
+        dims = dict(hidden_dim_processor_node=args.dim, hidden_dim_processor_edge=args.dim)
+        encoder = Encoder(
+            lat_lons,
+            input_dim=args.features,
+            output_dim=args.dim,
+            output_edge_dim=args.dim,
+            **kwargs,
+            **dims,
+        )
+        decoder = Decoder(
+            lat_lons,
+            input_dim=args.dim,
+            output_dim=args.features,
+            output_edge_dim=args.dim,
+            **kwargs,
+            **dims,
+        )
+
+        def forward():
+            x, _, _ = encoder(features)
+            return decoder(x, features)
+
+        elapsed = median_time(forward, args.repeats)
+        print(f"  reorder={reorder!s:>5}: {elapsed:8.1f} ms")
+
+
+def main():
+    """Command line interface of the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resolution", type=int, default=3)
+    parser.add_argument("--dim", type=int, default=64)
+    parser.add_argument("--features", type=int, default=16)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=None)
+    args = parser.parse_args()
+    if args.threads is not None:
+        torch.set_num_threads(args.threads)
+
+    processor_block(args)
+    encoder_decoder(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Throughput of the IFSAnalisysDataset on a synthetic local Zarr store.
+
+A sequential pass over the dataset is timed, with and without prefetching, against the previous
+reader which loaded, normalized and converted one timestep at a time. A training step is simulated
+by a sleep after every item, during which the prefetching threads read the next chunks.
+
+Usage:
+    python benchmarks/ifs_dataloader.py --num-times 64 --num-lat 91 --num-lon 180
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import torch
+import xarray as xr
+
+from graph_weather.data.IFSAnalysis_dataloader import IFS_MEAN, IFS_STD, IFSAnalisysDataset
+
+FEATURES = list(IFS_MEAN)
+
+
+def write_store(path, num_times, num_levels, num_lat, num_lon, chunk_size):
+    """Write a random store with the IFS features, chunked along the time dimension."""
+    rng = np.random.default_rng(0)
+    shape = (num_times, num_levels, num_lat, num_lon)
+    ds = xr.Dataset(
+        {
+            var: (
+                ("time", "level", "latitude", "longitude"),
+                (IFS_MEAN[var] + IFS_STD[var] * rng.normal(size=shape)).astype(np.float32),
+            )
+            for var in FEATURES
+        },
+        coords={"time": pd.date_range("2016-01-01", periods=num_times, freq="6h")},
+    )
+    ds.chunk({"time": chunk_size}).to_zarr(path)
+
+
+def legacy_item(data, idx):
+    """The previous reader: one timestep at a time, normalized variable by variable."""
+
+    def extract(ds):
+        cube = np.stack(
+            [(ds[var].values - IFS_MEAN[var]) / (IFS_STD[var] + 1e-6) for var in FEATURES],
+            axis=-1,
+        ).astype(np.float32)
+        num_layers, num_lat, num_lon, num_vars = cube.shape
+        cube = cube.reshape(num_lat, num_lon, num_vars * num_layers)
+        tensor = torch.from_numpy(cube.transpose(2, 0, 1).copy())  # ToTensor
+        return tensor.view(-1, cube.shape[-1])
+
+    return extract(data.isel(time=idx)), extract(data.isel(time=idx + 1))
+
+
+def throughput(get_item, num_items, step_time):
+    """Return the number of items per second of a sequential pass."""
+    start = time.perf_counter()
+    for idx in range(num_items):
+        get_item(idx)
+        time.sleep(step_time)
+    return num_items / (time.perf_counter() - start)
+
+
+def main():
+    """Command line interface of the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-times", type=int, default=64)
+    parser.add_argument("--num-levels", type=int, default=13)
+    parser.add_argument("--num-lat", type=int, default=91)
+    parser.add_argument("--num-lon", type=int, default=180)
+    parser.add_argument("--chunk-size", type=int, default=8)
+    parser.add_argument("--step-time", type=float, default=0.02, help="simulated step, in s.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ifs.zarr")
+        write_store(
+            path, args.num_times, args.num_levels, args.num_lat, args.num_lon, args.chunk_size
+        )
+        num_items = args.num_times - 1
+        data = xr.open_zarr(path)
+        legacy = throughput(lambda i: legacy_item(data, i), num_items, args.step_time)
+        print(f"legacy reader: {legacy:.1f} items/s")
+        for prefetch in (0, 2):
+            dataset = IFSAnalisysDataset(
+                path, FEATURES, chunk_size=args.chunk_size, prefetch=prefetch
+            )
+            print(
+                f"chunked reader, prefetch={prefetch}: "
+                f"{throughput(dataset.__getitem__, num_items, args.step_time):.1f} items/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
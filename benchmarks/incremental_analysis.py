@@ -0,0 +1,84 @@
+"""
+Latency and accuracy of the incremental assimilation.
+
+A stream of regional observation batches is assimilated by a GraphWeatherAssimilator, recomputing
+the analysis of all the observations at every update, and by IncrementalAssimilator, with the full
+processor or restricted to the k-hop neighborhoods of the changed cells. The error is the RMSE of
+the analysis relative to the full recomputation, normalized by its standard deviation.
+
+Usage:
+    python benchmarks/incremental_analysis.py --num-updates 8 --k-hops 1 2 4
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from graph_weather import GraphWeatherAssimilator, IncrementalAssimilator
+
+
+def observation_stream(num_updates, batch_size, rng):
+    """Return batches of observations, each one in a random 10 x 10 degree region."""
+    batches = []
+    for _ in range(num_updates):
+        lat, lon = rng.uniform(-60, 50), rng.uniform(0, 350)
+        lat_lon_heights = np.stack(
+            [
+                rng.uniform(lat, lat + 10, batch_size),
+                rng.uniform(lon, lon + 10, batch_size),
+                np.zeros(batch_size),
+            ],
+            axis=-1,
+        )
+        batches.append(
+            (torch.randn((1, batch_size, 2)), torch.tensor(lat_lon_heights, dtype=torch.float))
+        )
+    return batches
+
+
+def main():
+    """Command line interface of the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-updates", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--k-hops", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--num-blocks", type=int, default=9)
+    args = parser.parse_args()
+
+    output_lat_lons = [(lat, lon) for lat in range(-90, 90, 2) for lon in range(0, 360, 2)]
+    model = GraphWeatherAssimilator(
+        output_lat_lons=output_lat_lons, analysis_dim=78, num_blocks=args.num_blocks
+    ).eval()
+    stream = observation_stream(args.num_updates, args.batch_size, np.random.default_rng(0))
+
+    # reference: the whole analysis is recomputed with all the observations at every update
+    references, seconds = [], []
+    with torch.no_grad():
+        for i in range(1, len(stream) + 1):
+            features = torch.cat([batch[0] for batch in stream[:i]], dim=1)
+            lat_lon_heights = torch.cat([batch[1] for batch in stream[:i]])
+            start = time.perf_counter()
+            references.append(model(features, lat_lon_heights))
+            seconds.append(time.perf_counter() - start)
+    print(f"full recomputation: {np.mean(seconds[1:]):.2f} s per update")
+
+    for k_hops in [None] + args.k_hops:
+        incremental = IncrementalAssimilator(model, k_hops=k_hops)
+        seconds, errors = [], []
+        for (features, lat_lon_heights), reference in zip(stream, references):
+            start = time.perf_counter()
+            analysis = incremental.update(features, lat_lon_heights)
+            seconds.append(time.perf_counter() - start)
+            errors.append(((analysis - reference).pow(2).mean().sqrt() / reference.std()).item())
+        name = "full processor" if k_hops is None else f"k_hops={k_hops}"
+        # the first update is always a full analysis
+        print(
+            f"incremental, {name}: {np.mean(seconds[1:]):.2f} s per update, "
+            f"relative RMSE {np.mean(errors[1:]):.2e} (max {np.max(errors):.2e})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Processor blocks versus reach versus skill versus time, with and without the multi-mesh.
+
+Every processor block moves the information one edge further in the latent graph. The reach of a
+number of blocks is the fraction of the pairs of latent nodes closer than --radius degrees that
+are at most that many edges apart, computed exactly from the hop distances of a sample of nodes.
+The time is the median forward time of a GraphWeatherForecaster on a batch of 8 inputs.
+
+With --steps > 0 the forecasters are also trained on a long-range task, and the skill is reported:
+the inputs are 8 random unit spikes, the increment predicted by the decoder is the number of spikes
+closer than --radius degrees, halved. The skill is the MSE of the increments on held-out inputs
+relative to their variance, i.e. 1 without skill.
+
+Usage:
+    python benchmarks/multi_mesh.py --blocks 2 4 8 16 --levels 0 1 2 --radius 30
+"""
+
+import argparse
+import time
+
+import numpy as np
+import scipy.sparse
+import torch
+from scipy.sparse.csgraph import shortest_path
+
+from graph_weather import GraphWeatherForecaster
+from graph_weather.data.h3_grid import great_circle_distance, h3_cell_centers
+
+LATITUDES = np.arange(-90, 90, 5)
+LONGITUDES = np.arange(0, 360, 5)
+
+
+def reach(model, radius, blocks, num_sources=300):
+    """Return the fraction of the node pairs closer than radius reached by the numbers of blocks."""
+    edge_index = model.encoder.latent_graph.edge_index.numpy()
+    num_nodes = model.encoder.h3_nodes.shape[0]
+    adjacency = scipy.sparse.csr_matrix(
+        (np.ones(edge_index.shape[1]), (edge_index[1], edge_index[0])), shape=(num_nodes, num_nodes)
+    )
+    sources = np.random.default_rng(0).choice(num_nodes, num_sources, replace=False)
+    hops = shortest_path(adjacency, unweighted=True, indices=sources)
+    lat, lon = h3_cell_centers(model.encoder.resolution)
+    distance = great_circle_distance(lat[sources, None], lon[sources, None], lat[None], lon[None])
+    hops = hops[distance <= np.radians(radius)]
+    return [(hops <= num_blocks).mean() for num_blocks in blocks], int(hops.max())
+
+
+def spikes(batch_size, num_points, rng):
+    """Return inputs with 8 unit spikes, with shape [batch, points, 1]."""
+    inputs = np.zeros((batch_size, num_points, 1))
+    for i in range(batch_size):
+        inputs[i, rng.choice(num_points, 8, replace=False)] = 1.0
+    return torch.tensor(inputs, dtype=torch.float)
+
+
+def skill(model, radius, args):
+    """Train the forecaster on the spike counts and return its relative MSE on held-out inputs."""
+    lat, lon = (x.ravel() for x in np.meshgrid(LATITUDES, LONGITUDES, indexing="ij"))
+    distance = great_circle_distance(lat[:, None], lon[:, None], lat[None], lon[None])
+    counts = torch.tensor(distance <= np.radians(radius), dtype=torch.float) / 2
+    rng = np.random.default_rng(0)
+    optimizer = torch.optim.Adam(model.parameters(), lr=args.lr)
+    model.train()
+    for _ in range(args.steps):
+        inputs = spikes(args.batch_size, len(lat), rng)
+        loss = torch.nn.functional.mse_loss(model(inputs), inputs + counts @ inputs)
+        optimizer.zero_grad()
+        loss.backward()
+        optimizer.step()
+    model.eval()
+    inputs = spikes(32, len(lat), np.random.default_rng(1))
+    increment = counts @ inputs
+    with torch.no_grad():
+        output = model(inputs)
+    return (torch.mean((output - inputs - increment) ** 2) / torch.var(increment)).item()
+
+
+def main():
+    """Command line interface of the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--blocks", type=int, nargs="+", default=[2, 4, 8, 16])
+    parser.add_argument("--levels", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--resolution", type=int, default=2)
+    parser.add_argument("--radius", type=float, default=30.0, help="degrees")
+    parser.add_argument("--steps", type=int, default=0, help="training steps, 0 skips the skill")
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--dim", type=int, default=32)
+    parser.add_argument("--lr", type=float, default=1e-3)
+    args = parser.parse_args()
+
+    lat_lons = [(lat, lon) for lat in LATITUDES for lon in LONGITUDES]
+    inputs = torch.randn((8, len(lat_lons), 1))
+    print(f"{'levels':>6} {'edges':>7} {'blocks':>6} {'reach':>6} {'forward':>9} {'rel. MSE':>9}")
+    for levels in args.levels:
+        for num_blocks in args.blocks:
+            torch.manual_seed(0)
+            model = GraphWeatherForecaster(
+                lat_lons,
+                resolution=args.resolution,
+                feature_dim=1,
+                aux_dim=0,
+                node_dim=args.dim,
+                edge_dim=args.dim,
+                num_blocks=num_blocks,
+                hidden_dim_processor_node=args.dim,
+                hidden_dim_processor_edge=args.dim,
+                hidden_dim_decoder=args.dim,
+                apply_constraints=False,
+                multi_mesh_levels=levels,
+            ).eval()
+            if num_blocks == args.blocks[0]:
+                fractions, max_hops = reach(model, args.radius, args.blocks)
+                edges = model.encoder.latent_graph.edge_index.shape[1]
+                print(f"{levels:>6} {edges:>7} blocks to reach all the pairs: {max_hops}")
+            timings = []
+            with torch.no_grad():
+                model(inputs)
+                for _ in range(3):
+                    start = time.perf_counter()
+                    model(inputs)
+                    timings.append(time.perf_counter() - start)
+            elapsed = np.median(timings)
+            error = f"{skill(model, args.radius, args):>9.3f}" if args.steps > 0 else f"{'-':>9}"
+            fraction = fractions[args.blocks.index(num_blocks)]
+            print(
+                f"{levels:>6} {edges:>7} {num_blocks:>6} {fraction:>6.3f} "
+                f"{elapsed * 1e3:>7.0f}ms {error}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Reduction of the assimilator input graph with super-observations.
+
+Synthetic satellite swaths are assimilated by an AssimilatorEncoder with and without thinning
+them into super-observations, and the number of input edges and the encoder time are reported.
+
+Usage:
+    python benchmarks/superobservations.py --num-observations 50000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from graph_weather.data.observations import ObservationBucketer, superobservations
+from graph_weather.models import AssimilatorEncoder
+
+
+def swaths(num_observations, num_channels, rng):
+    """Return observations along a few polar-orbiting swaths, 1 hour apart."""
+    num_tracks = 4
+    track = rng.integers(0, num_tracks, num_observations)
+    along = rng.uniform(-np.pi / 2, np.pi / 2, num_observations)
+    across = rng.uniform(-12.0, 12.0, num_observations)
+    return {
+        "timestamp": track * 3600.0 + rng.uniform(0, 600, num_observations),
+        "latitude": np.degrees(along) * 0.95,
+        "longitude": track * 25.0 + across,
+        "metadata": rng.normal(size=(num_observations, num_channels)),
+    }
+
+
+def encode(encoder, window):
+    """Return the number of input edges and the encoder time in seconds of a window."""
+    with torch.no_grad():
+        start = time.perf_counter()
+        graph = encoder.create_input_graph(
+            window["features"], window["lat_lon_heights"], window["mask"]
+        )
+        encoder(window["features"], window["lat_lon_heights"], window["mask"])
+        return graph.edge_index.shape[1], time.perf_counter() - start
+
+
+def main():
+    """Command line interface of the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-observations", type=int, default=50000)
+    parser.add_argument("--num-channels", type=int, default=4)
+    parser.add_argument("--resolution", type=int, default=2)
+    args = parser.parse_args()
+
+    observations = swaths(args.num_observations, args.num_channels, np.random.default_rng(0))
+    bucketer = ObservationBucketer(resolution=args.resolution)
+    start = time.perf_counter()
+    thinned = superobservations(observations, resolution=args.resolution)
+    print(f"superobservations: {time.perf_counter() - start:.3f} s")
+
+    for name, columns, input_dim in [
+        ("raw", observations, args.num_channels + 1),
+        ("super-observations", thinned, 3 * args.num_channels + 1),
+    ]:
+        encoder = AssimilatorEncoder(resolution=args.resolution, input_dim=input_dim).eval()
+        window = bucketer(columns)[0]
+        edges, seconds = encode(encoder, window)
+        print(
+            f"{name}: {window['num_observations']} observations, {edges} input edges, "
+            f"encoder {seconds:.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
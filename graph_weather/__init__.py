@@ -1,5 +1,18 @@
-"""Main import for the complete models"""
+"""Main import for the complete models
 
-from .data.nnja_ai import AMSUDataset, collate_fn
-from .models.analysis import GraphWeatherAssimilator
-from .models.forecast import GraphWeatherForecaster
+The public names are imported lazily on first access, so that importing a subpackage, e.g.
+graph_weather.models.gencast, does not import the other models and their dependencies.
+"""
+
+from graph_weather._lazy import lazy_imports
+
+_LAZY_IMPORTS = {
+    "AMSUDataset": ".data.nnja_ai",
+    "collate_fn": ".data.nnja_ai",
+    "GraphWeatherAssimilator": ".models.analysis",
+    "IncrementalAssimilator": ".models.analysis",
+    "GraphWeatherForecaster": ".models.forecast",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+__getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS)
@@ -0,0 +1,31 @@
+"""Lazy imports of the public names of the packages"""
+
+import importlib
+import sys
+
+
+def lazy_imports(package: str, imports: dict):
+    """
+    Return the module __getattr__ and __dir__ of a package with lazily imported names
+
+    A name is imported from its module on first access, then cached in the package globals.
+
+    Args:
+        package: Name of the package, i.e. its __name__
+        imports: Mapping of the public names to their modules, relative to the package
+
+    Returns:
+        The __getattr__ and __dir__ functions of the package
+    """
+
+    def __getattr__(name):
+        if name in imports:
+            value = getattr(importlib.import_module(imports[name], package), name)
+            setattr(sys.modules[package], name, value)
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(imports))
+
+    return __getattr__, __dir__
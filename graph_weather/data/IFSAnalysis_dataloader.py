@@ -1,9 +1,17 @@
 """
 The dataloader for IFS analysis.
+
+The timesteps are read from the Zarr store by chunks of consecutive timesteps, normalized at once,
+and the upcoming chunks can be read ahead in a background thread pool, so that a sequential pass
+over the dataset overlaps the I/O and decompression with the training step. The chunks are only read
+ahead while the items are accessed in order, a shuffled access reads the chunks it needs only.
 """
 
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import numpy as np
-import torchvision.transforms as transforms
+import torch
 import xarray as xr
 from torch.utils.data import Dataset
 
@@ -30,14 +38,29 @@ class IFSAnalisysDataset(Dataset):
     """
     Dataset for IFSAnalysis.
 
+    Every item is a pair of consecutive timesteps, as float32 tensors with shape
+    [num_lat * num_lon, num_features * num_levels]: the nodes are ordered latitude-major and the
+    channels feature-major, i.e. every feature contributes its levels in order.
+
     Args:
             filepath: path of the dataset.
             features: list of features.
             start_year: initial year. Defaults to 2016.
             end_year: ending year. Defaults to 2022.
+            chunk_size: number of timesteps read at once. Defaults to 1.
+            prefetch: number of chunks read ahead in the background during a sequential access.
+                Defaults to 0, which disables the prefetching.
     """
 
-    def __init__(self, filepath: str, features: list, start_year: int = 2016, end_year: int = 2022):
+    def __init__(
+        self,
+        filepath: str,
+        features: list,
+        start_year: int = 2016,
+        end_year: int = 2022,
+        chunk_size: int = 1,
+        prefetch: int = 0,
+    ):
         """
         Initialize the dataset object.
         """
@@ -54,34 +77,82 @@ class IFSAnalisysDataset(Dataset):
         )  # Filter data by start and end years
 
         self.NWP_features = features
+        self.chunk_size = chunk_size
+        self.prefetch = prefetch
+        # [feature, 1, 1, 1] statistics, broadcast over [feature, level, lat, lon] fields
+        self.mean = np.array([IFS_MEAN[var] for var in features], dtype=np.float32)[
+            :, None, None, None
+        ]
+        self.std = np.array([IFS_STD[var] + 1e-6 for var in features], dtype=np.float32)[
+            :, None, None, None
+        ]
+        self._chunks = {}
+        self._executor = None
+        self._pid = os.getpid()
+        self._last_item = -1
 
     def __len__(self):
-        return len(self.data["time"])
-
-    def __getitem__(self, idx):
-        start = self.data.isel(time=idx)
-        end = self.data.isel(time=idx + 1)
-
-        # Extract NWP features
-        input_data = self._nwp_features_extraction(start)
-        output_data = self._nwp_features_extraction(end)
-
-        return (
-            (transforms).ToTensor()(input_data).view(-1, input_data.shape[-1]),
-            (transforms).ToTensor()(output_data).view(-1, output_data.shape[-1]),
-        )
-
-    def _nwp_features_extraction(self, data):
+        # the last timestep is only a target
+        return len(self.data["time"]) - 1
+
+    def __getstate__(self):
+        # every DataLoader worker starts its own prefetching threads
+        state = self.__dict__.copy()
+        state["_chunks"] = {}
+        state["_executor"] = None
+        return state
+
+    def _read_chunk(self, chunk: int) -> np.ndarray:
+        """Read and normalize the timesteps of a chunk, as a [time, node, channel] array."""
+        time = slice(chunk * self.chunk_size, (chunk + 1) * self.chunk_size)
+        # computed in the calling thread: the thread pool of dask, once started by the main process,
+        # is not usable by the forked DataLoader workers, and the prefetching has its own threads
+        data = self.data[self.NWP_features].isel(time=time).compute(scheduler="synchronous")
+        # [feature, time, level, lat, lon], normalized in place in a single op
         data_cube = np.stack(
-            [
-                (data[f"{var}"].values - IFS_MEAN[f"{var}"]) / (IFS_STD[f"{var}"] + 1e-6)
-                for var in self.NWP_features
-            ],
-            axis=-1,
-        ).astype(np.float32)
+            [data[var].transpose("time", ...).values for var in self.NWP_features]
+        ).astype(np.float32, copy=False)
+        data_cube -= self.mean[:, None]
+        data_cube /= self.std[:, None]
+        assert not np.isnan(data_cube).any()
 
-        num_layers, num_lat, num_lon, num_vars = data_cube.shape
-        data_cube = data_cube.reshape(num_lat, num_lon, num_vars * num_layers)
+        num_vars, num_times, num_layers, num_lat, num_lon = data_cube.shape
+        data_cube = np.ascontiguousarray(data_cube.transpose(1, 3, 4, 0, 2))
+        return data_cube.reshape(num_times, num_lat * num_lon, num_vars * num_layers)
+
+    def _get_chunk(self, chunk: int, sequential: bool) -> np.ndarray:
+        if self._pid != os.getpid():
+            # the threads of the pool are not inherited by forked DataLoader workers
+            self._chunks, self._executor, self._pid = {}, None, os.getpid()
+        num_chunks = (len(self.data["time"]) + self.chunk_size - 1) // self.chunk_size
+        upcoming = range(chunk, min(chunk + max(self.prefetch, 1) + 1, num_chunks))
+        # the previous and next chunks are kept, an item can span the boundary of two chunks
+        for stale in [c for c in self._chunks if c != chunk - 1 and c not in upcoming]:
+            value = self._chunks.pop(stale)
+            if isinstance(value, Future):
+                value.cancel()
+
+        if self.prefetch > 0 and sequential:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.prefetch)
+            for c in upcoming[: self.prefetch + 1]:
+                if c not in self._chunks:
+                    self._chunks[c] = self._executor.submit(self._read_chunk, c)
+        elif chunk not in self._chunks:
+            self._chunks[chunk] = self._read_chunk(chunk)
+        value = self._chunks[chunk]
+        return value.result() if isinstance(value, Future) else value
+
+    def _timestep(self, idx: int, sequential: bool) -> torch.Tensor:
+        chunk = self._get_chunk(idx // self.chunk_size, sequential)
+        return torch.from_numpy(chunk[idx % self.chunk_size])
 
-        assert not np.isnan(data_cube).any()
-        return data_cube
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"Index {idx} out of range for {len(self)} items.")
+        # the chunks are read ahead only when the items follow each other, e.g. not when shuffled
+        sequential = idx == self._last_item + 1
+        self._last_item = idx
+        return self._timestep(idx, sequential), self._timestep(idx + 1, sequential)
@@ -1,3 +1,14 @@
-"""Dataloaders and data processing utilities"""
+"""Dataloaders and data processing utilities
 
-from .nnja_ai import AMSUDataset, collate_fn
+The public names are imported lazily on first access, see graph_weather/_lazy.py.
+"""
+
+from graph_weather._lazy import lazy_imports
+
+_LAZY_IMPORTS = {
+    "AMSUDataset": ".nnja_ai",
+    "collate_fn": ".nnja_ai",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+__getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS)
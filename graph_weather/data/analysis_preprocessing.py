@@ -0,0 +1,87 @@
+"""
+Coarsen the analysis Zarr stores of AnalysisDataset once, offline.
+
+AnalysisDataset can coarsen every store on the fly, for every sample. This module does it once and
+writes the coarsened stores, with the same file names, in an output directory. Every variable is
+written as a single chunk, hence reading a variable of a coarsened store reads exactly one chunk.
+The coarsened stores are then read with AnalysisDataset(..., coarsen=1).
+
+Usage:
+    python -m graph_weather.data.analysis_preprocessing output_dir analysis_*.zarr --coarsen 8
+"""
+
+import argparse
+import os
+
+import xarray as xr
+
+
+def coarsen_store(ds: xr.Dataset, coarsen: int) -> xr.Dataset:
+    """
+    Coarsen the latitudes and longitudes of a store, as AnalysisDataset does.
+
+    Args:
+        ds: dataset with latitude and longitude dimensions.
+        coarsen: coarsening factor.
+    """
+    return ds.coarsen(latitude=coarsen, boundary="pad").mean().coarsen(longitude=coarsen).mean()
+
+
+def coarsen_analysis_stores(
+    filepaths: list[str],
+    output_path: str,
+    coarsen: int = 8,
+    variables: list[str] | None = None,
+    overwrite: bool = False,
+) -> list[str]:
+    """
+    Write the coarsened analysis stores.
+
+    Args:
+        filepaths: paths of the analysis stores.
+        output_path: directory where the coarsened stores are written.
+        coarsen: coarsening factor. Defaults to 8.
+        variables: variables to keep. Defaults to None, i.e. all the variables.
+        overwrite: if false the stores already written are skipped. Defaults to False.
+
+    Returns:
+        list[str]: paths of the coarsened stores, in the order of filepaths.
+    """
+    os.makedirs(output_path, exist_ok=True)
+    output_paths = []
+    for path in filepaths:
+        output = os.path.join(output_path, os.path.basename(os.path.normpath(path)))
+        output_paths.append(output)
+        if os.path.exists(output) and not overwrite:
+            continue
+        ds = xr.open_zarr(path, consolidated=True, chunks=None)
+        if variables is not None:
+            ds = ds[variables]
+        ds = coarsen_store(ds.compute(), coarsen) if coarsen > 1 else ds.compute()
+        for var in ds.data_vars:
+            ds[var].encoding = {"chunks": ds[var].shape}
+        ds.to_zarr(output, mode="w", consolidated=True)
+    return output_paths
+
+
+def main():
+    """Command line interface of coarsen_analysis_stores."""
+    parser = argparse.ArgumentParser(description="Coarsen the analysis Zarr stores.")
+    parser.add_argument("output_path", help="directory where the coarsened stores are written.")
+    parser.add_argument("filepaths", nargs="+", help="paths of the analysis stores.")
+    parser.add_argument("--coarsen", type=int, default=8)
+    parser.add_argument("--variables", nargs="+", default=None)
+    parser.add_argument("--overwrite", action="store_true")
+    args = parser.parse_args()
+
+    coarsen_analysis_stores(
+        filepaths=args.filepaths,
+        output_path=args.output_path,
+        coarsen=args.coarsen,
+        variables=args.variables,
+        overwrite=args.overwrite,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Bounded in-memory caches for the data pipelines."""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+
+import numpy as np
+
+
+class LRUCache:
+    """
+    Least recently used cache of arrays, bounded by the total size in bytes.
+
+    When a DataLoader uses several workers, every worker holds its own copy of the cache.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: max total size of the cached arrays, in bytes. If 0 the cache is disabled.
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable):
+        return key in self._entries
+
+    def get(self, key: Hashable) -> np.ndarray | None:
+        """
+        Return the cached array, or None if the key is not cached.
+
+        Args:
+            key: key of the array.
+        """
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, value: np.ndarray):
+        """
+        Add an array to the cache, evicting the least recently used ones if needed.
+
+        Arrays larger than max_bytes are not cached.
+
+        Args:
+            key: key of the array.
+            value: array to cache.
+        """
+        if value.nbytes > self.max_bytes:
+            return
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key).nbytes
+        self._entries[key] = value
+        self.nbytes += value.nbytes
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def clear(self):
+        """Remove all the entries and reset the counters."""
+        self._entries.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the lookups that found the key in the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
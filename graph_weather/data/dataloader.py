@@ -13,13 +13,16 @@ fcurrent time and 10 other
 
 """
 
-import const
+from collections import OrderedDict
+
 import numpy as np
-import pandas as pd
 import xarray as xr
-from pysolar.util import extraterrestrial_irrad
 from torch.utils.data import Dataset
 
+from graph_weather.data import const
+from graph_weather.data.analysis_preprocessing import coarsen_store
+from graph_weather.data.solar import SolarIrradianceCache
+
 
 class AnalysisDataset(Dataset):
     """
@@ -31,6 +34,14 @@ class AnalysisDataset(Dataset):
         mean: Mean value.
         std  Standard deviation value.
         coarsen : Coarsening factor. Defaults to 8.
+        solar_cache: Cache of the solar irradiance windows of the (coarsened) grid, e.g. with a
+            memory-mapped table precomputed over the dates of the files. Defaults to None, i.e.
+            every worker lazily builds an on-demand cache.
+        variables: Variables to read. Defaults to None, i.e. all the variables.
+        max_open_stores: Number of stores kept open, per worker. Defaults to 8.
+
+    The stores can be coarsened once with graph_weather.data.analysis_preprocessing, then read with
+    coarsen=1.
 
     Methods:
         __init__: Initialize the AnalysisDataset object.
@@ -38,7 +49,17 @@ class AnalysisDataset(Dataset):
         __getitem__: Get an item from the dataset.
     """
 
-    def __init__(self, filepaths, invariant_path, mean, std, coarsen: int = 8):
+    def __init__(
+        self,
+        filepaths,
+        invariant_path,
+        mean,
+        std,
+        coarsen: int = 8,
+        solar_cache: SolarIrradianceCache | None = None,
+        variables: list[str] | None = None,
+        max_open_stores: int = 8,
+    ):
         """
         Initialize the AnalysisDataset object.
         """
@@ -48,76 +69,98 @@ class AnalysisDataset(Dataset):
         self.coarsen = coarsen
         self.mean = mean
         self.std = std
+        self.solar_cache = solar_cache
+        self.variables = variables
+        self.max_open_stores = max_open_stores
+        self._stores = OrderedDict()
+        self._grid = None
 
     def __len__(self):
         return len(self.filepaths) - 1
 
-    def __getitem__(self, item):
-        if self.coarsen <= 1:  # Don't coarsen, so don't even call it
-            start = xr.open_zarr(self.filepaths[item], consolidated=True)
-            end = xr.open_zarr(self.filepaths[item + 1], consolidated=True)
-        else:
-            start = (
-                xr.open_zarr(self.filepaths[item], consolidated=True)
-                .coarsen(latitude=self.coarsen, boundary="pad")
-                .mean()
-                .coarsen(longitude=self.coarsen)
-                .mean()
+    def _grid_features(self, latitudes, longitudes):
+        """
+        Return the invariant fields and the lat/lon features of the grid.
+
+        They only depend on the grid, hence they are computed for the first item and reused by the
+        next ones, lazily in every DataLoader worker.
+        """
+        grid = self._grid
+        if (
+            grid is None
+            or not np.array_equal(grid["latitudes"], latitudes)
+            or not np.array_equal(grid["longitudes"], longitudes)
+        ):
+            # Land-sea mask data, resampled to the same as the physical variables
+            landsea = (
+                xr.open_zarr(self.invariant_path, consolidated=True)
+                .interp(latitude=latitudes)
+                .interp(longitude=longitudes)
             )
-            end = (
-                xr.open_zarr(self.filepaths[item + 1], consolidated=True)
-                .coarsen(latitude=self.coarsen, boundary="pad")
-                .mean()
-                .coarsen(longitude=self.coarsen)
-                .mean()
+            landsea = np.stack(
+                [
+                    (landsea[f"{var}"].values - const.LANDSEA_MEAN[var]) / const.LANDSEA_STD[var]
+                    for var in landsea.data_vars
+                    if not np.isnan(landsea[f"{var}"].values).any()
+                ],
+                axis=-1,
             )
+            landsea = landsea.T.reshape((-1, landsea.shape[-1]))
+            lat_lons = np.array(np.meshgrid(latitudes, longitudes)).T.reshape((-1, 2))
+            grid = self._grid = {
+                "latitudes": latitudes,
+                "longitudes": longitudes,
+                "landsea": landsea,
+                "lat_lons": lat_lons,
+                "sin_lat_lons": np.sin(lat_lons),
+                "cos_lat_lons": np.cos(lat_lons),
+            }
+        return grid["landsea"], grid["lat_lons"], grid["sin_lat_lons"], grid["cos_lat_lons"]
+
+    def __getstate__(self):
+        # the store handles are not shared, every DataLoader worker opens its own.
+        state = self.__dict__.copy()
+        state["_stores"] = OrderedDict()
+        return state
+
+    def _open(self, path):
+        """Return the lazily opened store of a file, keeping the last max_open_stores open."""
+        if path in self._stores:
+            self._stores.move_to_end(path)
+            return self._stores[path]
+        store = xr.open_zarr(path, consolidated=True, chunks=None)
+        if self.variables is not None:
+            store = store[self.variables]
+        self._stores[path] = store
+        if len(self._stores) > self.max_open_stores:
+            self._stores.popitem(last=False)
+        return store
+
+    def _load(self, path):
+        # Read whole chunks of the selected variables at once, then coarsen the in-memory arrays.
+        ds = self._open(path).compute()
+        if self.coarsen <= 1:  # Don't coarsen, so don't even call it
+            return ds
+        return coarsen_store(ds, self.coarsen)
+
+    def __getitem__(self, item):
+        start = self._load(self.filepaths[item])
+        end = self._load(self.filepaths[item + 1])
 
-        # Land-sea mask data, resampled to the same as the physical variables
-        landsea = (
-            xr.open_zarr(self.invariant_path, consolidated=True)
-            .interp(latitude=start.latitude.values)
-            .interp(longitude=start.longitude.values)
-        )
         # Calculate sin,cos, day of year, solar irradiance here before stacking
-        landsea = np.stack(
-            [
-                (landsea[f"{var}"].values - const.LANDSEA_MEAN[var]) / const.LANDSEA_STD[var]
-                for var in landsea.data_vars
-                if not np.isnan(landsea[f"{var}"].values).any()
-            ],
-            axis=-1,
+        landsea, lat_lons, sin_lat_lons, cos_lat_lons = self._grid_features(
+            start.latitude.values, start.longitude.values
         )
-        landsea = landsea.T.reshape((-1, landsea.shape[-1]))
-        lat_lons = np.array(np.meshgrid(start.latitude.values, start.longitude.values)).T.reshape(
-            (-1, 2)
-        )
-        sin_lat_lons = np.sin(lat_lons)
-        cos_lat_lons = np.cos(lat_lons)
-        date = start.time.dt.values
-        day_of_year = start.time.dayofyear.values / 365.0
+        day_of_year = start.time.dt.dayofyear.values / 365.0
         np.sin(day_of_year)
         np.cos(day_of_year)
-        solar_times = [np.array([extraterrestrial_irrad(date, lat, lon) for lat, lon in lat_lons])]
-        for when in pd.date_range(
-            date - pd.Timedelta("12 hours"), date + pd.Timedelta("12 hours"), freq="1H"
-        ):
-            solar_times.append(
-                np.array([extraterrestrial_irrad(when, lat, lon) for lat, lon in lat_lons])
-            )
-        solar_times = np.array(solar_times)
+        # [lat * lon, 26]: irradiance at the time and at every hour of the +-12 hours window
+        if self.solar_cache is None:
+            self.solar_cache = SolarIrradianceCache(lat_lons[:, 0], lat_lons[:, 1])
+        solar_times = self.solar_cache.window(np.ravel(start.time.values)[0]).T
 
         # End time solar radiation too
-        end_date = end.time.dt.values
-        end_solar_times = [
-            np.array([extraterrestrial_irrad(end_date, lat, lon) for lat, lon in lat_lons])
-        ]
-        for when in pd.date_range(
-            end_date - pd.Timedelta("12 hours"), end_date + pd.Timedelta("12 hours"), freq="1H"
-        ):
-            end_solar_times.append(
-                np.array([extraterrestrial_irrad(when, lat, lon) for lat, lon in lat_lons])
-            )
-        end_solar_times = np.array(solar_times)
+        end_solar_times = self.solar_cache.window(np.ravel(end.time.values)[0]).T
 
         # Normalize to between -1 and 1
         solar_times -= const.SOLAR_MEAN
@@ -173,27 +216,28 @@ class AnalysisDataset(Dataset):
         return input_data, output_data
 
 
-obs_data = xr.open_zarr(
-    "/home/jacob/Development/prepbufr.gdas.20160101.t00z.nr.48h.raw.zarr", consolidated=True
-)
-
-# TODO Embedding? These should stay consistent across all of the inputs, so can just load the values
-#  not the strings?
-# Should only take in the quality markers, observations, reported observation time relative to start
-# point
-# Observation errors, and background values, lat/lon/height/speed of observing thing
-
-print(obs_data)
-print(obs_data.hdr_inst_typ.values)
-print(obs_data.hdr_irpt_typ.values)
-print(obs_data.obs_qty_table.values)
-print(obs_data.hdr_prpt_typ.values)
-print(obs_data.hdr_sid_table.values)
-print(obs_data.hdr_typ_table.values)
-print(obs_data.obs_desc.values)
-print(obs_data.data_vars.keys())
-exit()
-analysis_data = xr.open_zarr(
-    "/home/jacob/Development/gdas1.fnl0p25.2016010100.f00.zarr", consolidated=True
-)
-print(analysis_data)
+if __name__ == "__main__":
+    obs_data = xr.open_zarr(
+        "/home/jacob/Development/prepbufr.gdas.20160101.t00z.nr.48h.raw.zarr", consolidated=True
+    )
+
+    # TODO Embedding? These should stay consistent across all of the inputs, so can just load the
+    #  values not the strings?
+    # Should only take in the quality markers, observations, reported observation time relative to
+    # start point
+    # Observation errors, and background values, lat/lon/height/speed of observing thing
+
+    print(obs_data)
+    print(obs_data.hdr_inst_typ.values)
+    print(obs_data.hdr_irpt_typ.values)
+    print(obs_data.obs_qty_table.values)
+    print(obs_data.hdr_prpt_typ.values)
+    print(obs_data.hdr_sid_table.values)
+    print(obs_data.hdr_typ_table.values)
+    print(obs_data.obs_desc.values)
+    print(obs_data.data_vars.keys())
+    exit()
+    analysis_data = xr.open_zarr(
+        "/home/jacob/Development/gdas1.fnl0p25.2016010100.f00.zarr", consolidated=True
+    )
+    print(analysis_data)
@@ -6,8 +6,14 @@ It has to:
 - load and normalize the residual between timesteps 2 and 1.
 - sample a noise level.
 - corrupt the residual with noise generated at the given noise level.
+
+The last two steps can be skipped by setting corrupt=False: the datasets then return only the
+clean inputs and residuals, and the corruption is applied on the training device for the whole
+batch with graph_weather.models.gencast.utils.noise.NoiseCorruption.
 """
 
+import json
+import os
 import warnings
 
 import einops
@@ -15,8 +21,40 @@ import numpy as np
 import xarray as xr
 from torch.utils.data import Dataset
 
-from graph_weather.data import const
+from graph_weather.data import normalization
+from graph_weather.data.cache import LRUCache
+from graph_weather.models.gencast.utils.clock import ClockFeatures
 from graph_weather.models.gencast.utils.noise import generate_isotropic_noise, sample_noise_level
+from graph_weather.models.gencast.utils.statistics import load_statistics
+
+
+def _load_raw_inputs(ds, atmospheric_features, single_features, static_features):
+    # Load atmospheric, single and static features as [time, lon, lat, channel]
+    ds_atm = (
+        ds[atmospheric_features]
+        .to_array()
+        .transpose("time", "longitude", "latitude", "level", "variable")
+        .values
+    )
+    ds_atm = einops.rearrange(ds_atm, "t lon lat lev var -> t lon lat (var lev)")
+    ds_single = (
+        ds[single_features].to_array().transpose("time", "longitude", "latitude", "variable").values
+    )
+    ds_static = ds[static_features].to_array().transpose("longitude", "latitude", "variable").values
+    ds_static = np.stack([ds_static] * len(ds.time), axis=0)
+
+    return np.concatenate([ds_atm, ds_single, ds_static], axis=-1)
+
+
+def _load_era5_statistics(stats_path):
+    # Return the (means, stds, diff_means, diff_stds) dicts, from the registry or from a file.
+    if stats_path is None:
+        return tuple(
+            normalization.get_table(name)
+            for name in ("ERA5_MEANS", "ERA5_STD", "ERA5_DIFF_MEAN", "ERA5_DIFF_STD")
+        )
+    stats = load_statistics(stats_path)
+    return stats["means"], stats["stds"], stats["diff_means"], stats["diff_stds"]
 
 
 class GenCastDataset(Dataset):
@@ -32,6 +70,8 @@ class GenCastDataset(Dataset):
         static_features: list[str],
         max_year: int = 2018,
         time_step: int = 2,
+        corrupt: bool = True,
+        stats_path: str | None = None,
     ):
         """
         Initialize the GenCast dataset object.
@@ -44,16 +84,24 @@ class GenCastDataset(Dataset):
             max_year: max year to include in training set. Defaults to 2018.
             time_step: time step between predictions.
                         E.g. 12h steps correspond to time_step = 2 in a 6h dataset. Defaults to 2.
+            corrupt: if true sample a noise level and corrupt the target residuals, otherwise
+                return only (prev_inputs, target_residuals). Defaults to True.
+            stats_path: statistics file written by
+                graph_weather.models.gencast.utils.statistics. Defaults to None, i.e. the ERA5
+                statistics of graph_weather.data.normalization.
         """
         super().__init__()
         self.data = xr.open_zarr(obs_path, chunks={})
         self.max_year = max_year
+        self.corrupt = corrupt
+        self.stats_path = stats_path
 
         self.grid_lon = self.data["longitude"].values
         self.grid_lat = self.data["latitude"].values
         self.num_lon = len(self.grid_lon)
         self.num_lat = len(self.grid_lat)
         self.num_vars = len(self.data.keys())
+        self.clock = ClockFeatures(self.grid_lon, self.num_lat)
         self.pressure_levels = np.array(self.data["level"].values).astype(
             np.float32
         )  # Need them for loss weighting
@@ -86,22 +134,25 @@ class GenCastDataset(Dataset):
         stds = []
         diff_means = []
         diff_stds = []
+        era5_means, era5_stds, era5_diff_means, era5_diff_stds = _load_era5_statistics(
+            self.stats_path
+        )
 
         for var in self.atmospheric_features:
-            means.extend(const.ERA5_MEANS[var])
-            stds.extend(const.ERA5_STD[var])
-            diff_means.extend(const.ERA5_DIFF_MEAN[var])
-            diff_stds.extend(const.ERA5_DIFF_STD[var])
+            means.extend(era5_means[var])
+            stds.extend(era5_stds[var])
+            diff_means.extend(era5_diff_means[var])
+            diff_stds.extend(era5_diff_stds[var])
 
         for var in self.single_features:
-            means.append(const.ERA5_MEANS[var])
-            stds.append(const.ERA5_STD[var])
-            diff_means.append(const.ERA5_DIFF_MEAN[var])
-            diff_stds.append(const.ERA5_DIFF_STD[var])
+            means.append(era5_means[var])
+            stds.append(era5_stds[var])
+            diff_means.append(era5_diff_means[var])
+            diff_stds.append(era5_diff_stds[var])
 
         for var in self.static_features:
-            means.append(const.ERA5_MEANS[var])
-            stds.append(const.ERA5_STD[var])
+            means.append(era5_means[var])
+            stds.append(era5_stds[var])
 
         return (
             np.array(means).astype(np.float32),
@@ -113,31 +164,13 @@ class GenCastDataset(Dataset):
     def _normalize(self, data, means, stds):
         return (data - means) / (stds + 0.0001)
 
-    def _sin_cos_emb(self, x):
-        return np.sin(2 * np.pi * x), np.cos(2 * np.pi * x)
-
     def _generate_clock_features(self, ds):
-        # Compute sin/cos embedding for day of the year
-        day_of_year = ds.time.dt.dayofyear.values
-        day_of_year_grid = einops.repeat(
-            day_of_year, "t -> t lon lat", lon=self.num_lon, lat=self.num_lat
-        )
-        sin_day_of_year, cos_day_of_year = self._sin_cos_emb(day_of_year_grid / 365.0)
+        return self.clock(ds.time.values)
 
-        # Compute sin/cos embedding for local mean time
-        hour_of_day = ds.time.dt.hour.values
-        hour_of_day_grid = einops.repeat(
-            hour_of_day, "t -> t lon lat", lon=self.num_lon, lat=self.num_lat
+    def _load_raw_inputs(self, ds):
+        return _load_raw_inputs(
+            ds, self.atmospheric_features, self.single_features, self.static_features
         )
-        local_mean_time = hour_of_day_grid + ds["longitude"].values[None, :, None] * 4 / 60.0
-        sin_local_mean_time, cos_local_mean_time = self._sin_cos_emb(local_mean_time / 24.0)
-
-        # Stack clock features
-        clock_input_data = np.stack(
-            [sin_day_of_year, cos_day_of_year, sin_local_mean_time, cos_local_mean_time], axis=-1
-        ).astype(np.float32)
-
-        return clock_input_data
 
     def __len__(self):
         return sum(self.data["time.year"].values < self.max_year) - 2 * self.time_step
@@ -147,28 +180,7 @@ class GenCastDataset(Dataset):
         ds_target = self.data.isel(time=item + 2 * self.time_step)
 
         # Load inputs data
-        ds_inputs_atm = (
-            ds_inputs[self.atmospheric_features]
-            .to_array()
-            .transpose("time", "longitude", "latitude", "level", "variable")
-            .values
-        )
-        ds_inputs_atm = einops.rearrange(ds_inputs_atm, "t lon lat lev var -> t lon lat (var lev)")
-        ds_inputs_single = (
-            ds_inputs[self.single_features]
-            .to_array()
-            .transpose("time", "longitude", "latitude", "variable")
-            .values
-        )
-        ds_inputs_static = (
-            ds_inputs[self.static_features]
-            .to_array()
-            .transpose("longitude", "latitude", "variable")
-            .values
-        )
-        ds_inputs_static = np.stack([ds_inputs_static] * 2, axis=0)
-
-        raw_inputs = np.concatenate([ds_inputs_atm, ds_inputs_single, ds_inputs_static], axis=-1)
+        raw_inputs = self._load_raw_inputs(ds_inputs)
 
         # Normalize inputs
         inputs_norm = self._normalize(raw_inputs, self.means, self.stds)
@@ -203,6 +215,9 @@ class GenCastDataset(Dataset):
         target_residuals = self._normalize(raw_target_residuals, self.diff_means, self.diff_stds)
         target_residuals = np.nan_to_num(target_residuals).astype(np.float32)
 
+        if not self.corrupt:
+            return prev_inputs, target_residuals
+
         # Corrupt targets with noise
         noise_levels = np.array([sample_noise_level()]).astype(np.float32)
         noise = generate_isotropic_noise(
@@ -236,6 +251,15 @@ class BatchedGenCastDataset(Dataset):
         time_step (optional): Time step between predictions.
                     E.g. 12h steps correspond to time_step = 2 in a 6h dataset. Defaults to 2.
         batch_size (optional): Size of the batch. Defaults to 32.
+        corrupt (optional): If true sample noise levels and corrupt the target residuals,
+                    otherwise return only (prev_inputs, target_residuals). Defaults to True.
+        cache_size (optional): Max size in bytes of the LRU cache of decoded timesteps. Successive
+                    batches overlap on their boundary timesteps, so with sequential or chunk-local
+                    sampling each timestep is read once per epoch. Every DataLoader worker holds
+                    its own cache. Defaults to 0, i.e. no cache.
+        stats_path (optional): Statistics file written by
+                    graph_weather.models.gencast.utils.statistics. Defaults to None, i.e. the ERA5
+                    statistics of graph_weather.data.normalization.
     """
 
     def __init__(
@@ -247,6 +271,9 @@ class BatchedGenCastDataset(Dataset):
         max_year: int = 2018,
         time_step: int = 2,
         batch_size: int = 32,  # maybe make optional?
+        corrupt: bool = True,
+        cache_size: int = 0,
+        stats_path: str | None = None,
     ):
         """
         Initialize the GenCast dataset object.
@@ -254,12 +281,16 @@ class BatchedGenCastDataset(Dataset):
         super().__init__()
         self.data = xr.open_zarr(obs_path, chunks={})
         self.max_year = max_year
+        self.corrupt = corrupt
+        self.stats_path = stats_path
+        self.cache = LRUCache(max_bytes=cache_size)
 
         self.grid_lon = self.data["longitude"].values
         self.grid_lat = self.data["latitude"].values
         self.num_lon = len(self.data["longitude"].values)
         self.num_lat = len(self.data["latitude"].values)
         self.num_vars = len(self.data.keys())
+        self.clock = ClockFeatures(self.grid_lon, self.num_lat)
         self.pressure_levels = np.array(self.data["level"].values).astype(
             np.float32
         )  # Need them for loss weighting
@@ -291,22 +322,25 @@ class BatchedGenCastDataset(Dataset):
         stds = []
         diff_means = []
         diff_stds = []
+        era5_means, era5_stds, era5_diff_means, era5_diff_stds = _load_era5_statistics(
+            self.stats_path
+        )
 
         for var in self.atmospheric_features:
-            means.extend(const.ERA5_MEANS[var])
-            stds.extend(const.ERA5_STD[var])
-            diff_means.extend(const.ERA5_DIFF_MEAN[var])
-            diff_stds.extend(const.ERA5_DIFF_STD[var])
+            means.extend(era5_means[var])
+            stds.extend(era5_stds[var])
+            diff_means.extend(era5_diff_means[var])
+            diff_stds.extend(era5_diff_stds[var])
 
         for var in self.single_features:
-            means.append(const.ERA5_MEANS[var])
-            stds.append(const.ERA5_STD[var])
-            diff_means.append(const.ERA5_DIFF_MEAN[var])
-            diff_stds.append(const.ERA5_DIFF_STD[var])
+            means.append(era5_means[var])
+            stds.append(era5_stds[var])
+            diff_means.append(era5_diff_means[var])
+            diff_stds.append(era5_diff_stds[var])
 
         for var in self.static_features:
-            means.append(const.ERA5_MEANS[var])
-            stds.append(const.ERA5_STD[var])
+            means.append(era5_means[var])
+            stds.append(era5_stds[var])
 
         return (
             np.array(means).astype(np.float32),
@@ -332,29 +366,33 @@ class BatchedGenCastDataset(Dataset):
             target_idx.append(i + 2 * self.time_step)
         return data[target_idx] - data[prev_idx]
 
-    def _generate_clock_features(self, ds):
-        day_of_year = ds.time.dt.dayofyear.values / 365.0
-        sin_day_of_year = (
-            np.sin(2 * np.pi * day_of_year)[:, None, None]
-            * np.ones((self.num_lon, self.num_lat))[None, :, :]
-        )
-        cos_day_of_year = (
-            np.cos(2 * np.pi * day_of_year)[:, None, None]
-            * np.ones((self.num_lon, self.num_lat))[None, :, :]
-        )
-
-        local_mean_time = (
-            np.ones((self.num_lon, self.num_lat))[None, :, :]
-            * (ds.time.dt.hour.values[:, None, None])
-            + ds["longitude"].values[None, :, None] * 4 / 60.0
-        )
-        sin_local_mean_time = np.sin(2 * np.pi * local_mean_time / 24.0)
-        cos_local_mean_time = np.cos(2 * np.pi * local_mean_time / 24.0)
-
-        clock_input_data = np.stack(
-            [sin_day_of_year, cos_day_of_year, sin_local_mean_time, cos_local_mean_time], axis=-1
-        ).astype(np.float32)
-        return clock_input_data
+    def _generate_clock_features(self, times):
+        return self.clock(times)
+
+    def _load_timesteps(self, time_idx):
+        # Load the raw [time, lon, lat, channel] fields, reading only the timesteps not cached.
+        if self.cache.max_bytes == 0:
+            return _load_raw_inputs(
+                self.data.isel(time=time_idx),
+                self.atmospheric_features,
+                self.single_features,
+                self.static_features,
+            )
+        fields = {t: self.cache.get(t) for t in time_idx}
+        missing = [t for t, value in fields.items() if value is None]
+        if missing:
+            raw_inputs = _load_raw_inputs(
+                self.data.isel(time=missing),
+                self.atmospheric_features,
+                self.single_features,
+                self.static_features,
+            )
+            for t, value in zip(missing, raw_inputs):
+                fields[t] = value
+                # the copy releases the chunk array, only copy the fields that are cached.
+                if value.nbytes <= self.cache.max_bytes:
+                    self.cache.put(t, value.copy())
+        return np.stack([fields[t] for t in time_idx])
 
     def __len__(self):
         return sum(self.data["time.year"].values < self.max_year) - (
@@ -367,46 +405,30 @@ class BatchedGenCastDataset(Dataset):
         ending_point = starting_point + 3 * self.time_step + self.batch_size - 2
 
         # Load data
-        ds = self.data.isel(time=np.arange(starting_point, ending_point))
-        ds_atm = (
-            ds[self.atmospheric_features]
-            .to_array()
-            .transpose("time", "longitude", "latitude", "level", "variable")
-            .values
-        )
-        ds_atm = einops.rearrange(ds_atm, "t lon lat lev var -> t lon lat (var lev)")
-        ds_single = (
-            ds[self.single_features]
-            .to_array()
-            .transpose("time", "longitude", "latitude", "variable")
-            .values
-        )
-        ds_static = (
-            ds[self.static_features]
-            .to_array()
-            .transpose("longitude", "latitude", "variable")
-            .values
-        )
-        ds_static = np.stack([ds_static] * (ending_point - starting_point), axis=0)
+        time_idx = np.arange(starting_point, ending_point)
+        raw_inputs = self._load_timesteps(time_idx)
 
         # Compute inputs
-        raw_inputs = np.concatenate([ds_atm, ds_single, ds_static], axis=-1)
         batched_inputs = self._batchify_inputs(raw_inputs)
         batched_inputs_norm = self._normalize(batched_inputs, self.means, self.stds)
 
         # Add time features
-        ds_clock = self._batchify_inputs(self._generate_clock_features(ds))
+        times = self.data["time"].values[time_idx]
+        ds_clock = self._batchify_inputs(self._generate_clock_features(times))
         inputs = np.concatenate([batched_inputs_norm, ds_clock], axis=-1)
         # Concatenate timesteps
         inputs = np.concatenate([inputs[:, 0, :, :, :], inputs[:, 1, :, :, :]], axis=-1)
         prev_inputs = np.nan_to_num(inputs).astype(np.float32)
 
         # Compute targets residuals
-        raw_targets = np.concatenate([ds_atm, ds_single], axis=-1)
+        raw_targets = raw_inputs[..., : len(self.diff_means)]
         batched_residuals = self._batchify_diffs(raw_targets)
         target_residuals = self._normalize(batched_residuals, self.diff_means, self.diff_stds)
         target_residuals = np.nan_to_num(target_residuals).astype(np.float32)
 
+        if not self.corrupt:
+            return prev_inputs, target_residuals
+
         # Corrupt targets with noise
         noise_levels = np.zeros((self.batch_size, 1), dtype=np.float32)
         corrupted_targets = np.zeros_like(target_residuals, dtype=np.float32)
@@ -422,3 +444,93 @@ class BatchedGenCastDataset(Dataset):
             noise_levels[b] = noise_level
 
         return (corrupted_targets, prev_inputs, noise_levels, target_residuals)
+
+
+class PreprocessedGenCastDataset(Dataset):
+    """
+    Dataset class for GenCast training data preprocessed with convert_gencast_dataset.
+
+    The store contains normalized inputs and target residuals as float32 arrays with layout
+    [time, lon, lat, channel], which are memory-mapped, so that every sample is read with
+    contiguous slices and without transposes. The samples are identical to the ones of
+    GenCastDataset built with the same arguments.
+    """
+
+    def __init__(self, store_path: str, corrupt: bool = True):
+        """
+        Initialize the preprocessed GenCast dataset object.
+
+        Args:
+            store_path: path of the directory written by convert_gencast_dataset.
+            corrupt: if true sample a noise level and corrupt the target residuals, otherwise
+                return only (prev_inputs, target_residuals). Defaults to True.
+        """
+        super().__init__()
+        self.corrupt = corrupt
+        with open(os.path.join(store_path, "metadata.json")) as f:
+            metadata = json.load(f)
+
+        self.inputs = np.load(os.path.join(store_path, "inputs.npy"), mmap_mode="r")
+        self.residuals = np.load(os.path.join(store_path, "residuals.npy"), mmap_mode="r")
+        self.times = np.load(os.path.join(store_path, "times.npy"))
+
+        self.grid_lon = np.array(metadata["longitude"])
+        self.grid_lat = np.array(metadata["latitude"])
+        self.num_lon = len(self.grid_lon)
+        self.num_lat = len(self.grid_lat)
+        self.clock = ClockFeatures(self.grid_lon, self.num_lat)
+        self.pressure_levels = np.array(metadata["pressure_levels"]).astype(np.float32)
+        self.atmospheric_features = metadata["atmospheric_features"]
+        self.single_features = metadata["single_features"]
+        self.static_features = metadata["static_features"]
+        self.max_year = metadata["max_year"]
+        self.time_step = metadata["time_step"]
+
+        self.output_features_dim = self.residuals.shape[-1]
+        self.input_features_dim = self.inputs.shape[-1] + 4
+
+        # check if fast isotropic noise generation is possible
+        if (self.num_lon == 2 * self.num_lat) or (self.num_lon == 2 * (self.num_lat - 1)):
+            self.use_isotropic_noise = True
+        else:
+            self.use_isotropic_noise = False
+            warnings.warn(
+                "Isotropic noise requires grid's shape to be 2N x N or 2N x (N+1): "
+                f"got {self.num_lon} x {self.num_lat}: falling back to flat normal random noise"
+            )
+
+    def __len__(self):
+        return len(self.times) - 2 * self.time_step
+
+    def __getitem__(self, item):
+        input_idx = [item, item + self.time_step]
+
+        # Load normalized inputs and add time features
+        clock_features = self.clock(self.times[input_idx])
+        inputs = np.concatenate([self.inputs[input_idx], clock_features], axis=-1)
+
+        # Concatenate timesteps
+        prev_inputs = np.concatenate([inputs[0], inputs[1]], axis=-1)
+
+        # Load normalized target residuals
+        target_residuals = np.array(self.residuals[item + 2 * self.time_step])
+
+        if not self.corrupt:
+            return prev_inputs, target_residuals
+
+        # Corrupt targets with noise
+        noise_levels = np.array([sample_noise_level()]).astype(np.float32)
+        noise = generate_isotropic_noise(
+            num_lon=self.num_lon,
+            num_lat=self.num_lat,
+            num_samples=target_residuals.shape[-1],
+            isotropic=self.use_isotropic_noise,
+        )
+        corrupted_targets = target_residuals + noise_levels * noise
+
+        return (
+            corrupted_targets,
+            prev_inputs,
+            noise_levels,
+            target_residuals,
+        )
@@ -0,0 +1,147 @@
+"""
+Convert a GenCast Zarr dataset into a training-ready store.
+
+GenCastDataset reads, transposes and normalizes lazily opened Zarr data for every sample. This
+module does it once and writes a store that PreprocessedGenCastDataset reads with memory-mapped,
+contiguous slices. The store is a directory containing:
+- inputs.npy: normalized input features (atmospheric, single and static), [time, lon, lat, channel].
+- residuals.npy: normalized residuals between timesteps t and t - time_step, with the same layout
+  (the first time_step entries are zeros).
+- times.npy: the timestamps.
+- metadata.json: grid, features and the arguments used for the conversion.
+
+Usage:
+    python -m graph_weather.data.gencast_preprocessing dataset.zarr preprocessed \
+        --atmospheric-features geopotential temperature \
+        --single-features 2m_temperature --static-features land_sea_mask
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+from graph_weather.data.gencast_dataloader import GenCastDataset
+
+
+def convert_gencast_dataset(
+    obs_path: str,
+    output_path: str,
+    atmospheric_features: list[str],
+    single_features: list[str],
+    static_features: list[str],
+    max_year: int = 2018,
+    time_step: int = 2,
+    chunk_size: int = 32,
+    stats_path: str | None = None,
+):
+    """
+    Write the preprocessed store of a GenCast dataset.
+
+    Args:
+        obs_path: dataset path.
+        output_path: directory where the store is written.
+        atmospheric_features: list of features depending on pressure levels.
+        single_features: list of features not depending on pressure levels.
+        static_features: list of features not depending on time.
+        max_year: max year to include in the store. Defaults to 2018.
+        time_step: time step between predictions.
+                    E.g. 12h steps correspond to time_step = 2 in a 6h dataset. Defaults to 2.
+        chunk_size: number of timesteps loaded at once. Defaults to 32.
+        stats_path: statistics file used for the normalization, see GenCastDataset.
+            Defaults to None.
+    """
+    dataset = GenCastDataset(
+        obs_path=obs_path,
+        atmospheric_features=atmospheric_features,
+        single_features=single_features,
+        static_features=static_features,
+        max_year=max_year,
+        time_step=time_step,
+        stats_path=stats_path,
+    )
+    num_times = int(sum(dataset.data["time.year"].values < max_year))
+    grid_shape = (num_times, dataset.num_lon, dataset.num_lat)
+
+    os.makedirs(output_path, exist_ok=True)
+    inputs = np.lib.format.open_memmap(
+        os.path.join(output_path, "inputs.npy"),
+        mode="w+",
+        dtype=np.float32,
+        shape=(*grid_shape, len(dataset.means)),
+    )
+    residuals = np.lib.format.open_memmap(
+        os.path.join(output_path, "residuals.npy"),
+        mode="w+",
+        dtype=np.float32,
+        shape=(*grid_shape, dataset.output_features_dim),
+    )
+
+    # the residuals of a chunk need the raw targets of the last time_step timesteps before it.
+    window = None
+    for start in range(0, num_times, chunk_size):
+        stop = min(start + chunk_size, num_times)
+        raw_inputs = dataset._load_raw_inputs(dataset.data.isel(time=np.arange(start, stop)))
+        inputs_norm = dataset._normalize(raw_inputs, dataset.means, dataset.stds)
+        inputs[start:stop] = np.nan_to_num(inputs_norm).astype(np.float32)
+
+        # window covers the timesteps [stop - len(window), stop)
+        raw_targets = raw_inputs[..., : dataset.output_features_dim]
+        if window is None:
+            window = raw_targets
+        else:
+            window = np.concatenate([window[-time_step:], raw_targets])
+        target_idx = np.arange(max(start, time_step), stop)
+        window_idx = target_idx - (stop - len(window))
+        raw_residuals = window[window_idx] - window[window_idx - time_step]
+        residuals_norm = dataset._normalize(raw_residuals, dataset.diff_means, dataset.diff_stds)
+        residuals[target_idx] = np.nan_to_num(residuals_norm).astype(np.float32)
+
+    inputs.flush()
+    residuals.flush()
+    np.save(os.path.join(output_path, "times.npy"), dataset.data["time"].values[:num_times])
+
+    metadata = {
+        "longitude": dataset.grid_lon.tolist(),
+        "latitude": dataset.grid_lat.tolist(),
+        "pressure_levels": dataset.pressure_levels.tolist(),
+        "atmospheric_features": atmospheric_features,
+        "single_features": single_features,
+        "static_features": static_features,
+        "max_year": max_year,
+        "time_step": time_step,
+    }
+    with open(os.path.join(output_path, "metadata.json"), "w") as f:
+        json.dump(metadata, f)
+
+
+def main():
+    """Command line interface of convert_gencast_dataset."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("obs_path", help="path of the Zarr dataset.")
+    parser.add_argument("output_path", help="directory where the store is written.")
+    parser.add_argument("--atmospheric-features", nargs="+", required=True)
+    parser.add_argument("--single-features", nargs="+", required=True)
+    parser.add_argument("--static-features", nargs="+", required=True)
+    parser.add_argument("--max-year", type=int, default=2018)
+    parser.add_argument("--time-step", type=int, default=2)
+    parser.add_argument("--chunk-size", type=int, default=32)
+    parser.add_argument("--stats-path", default=None)
+    args = parser.parse_args()
+
+    convert_gencast_dataset(
+        obs_path=args.obs_path,
+        output_path=args.output_path,
+        atmospheric_features=args.atmospheric_features,
+        single_features=args.single_features,
+        static_features=args.static_features,
+        max_year=args.max_year,
+        time_step=args.time_step,
+        chunk_size=args.chunk_size,
+        stats_path=args.stats_path,
+    )
+
+
+if __name__ == "__main__":
+    main()
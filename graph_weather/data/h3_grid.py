@@ -0,0 +1,187 @@
+"""
+Vectorized lookups on the H3 grids.
+
+The H3 nodes of the models are the cells of a resolution sorted by their index, see h3_cells. The
+lookups of this module work on arrays of points: the cells of the points are computed with the
+vectorized h3.unstable.vect API and mapped to their position in the sorted cells with a binary
+search, instead of one h3.geo_to_h3 call and dict lookup per point.
+"""
+
+import functools
+import warnings
+
+import h3
+import numpy as np
+
+with warnings.catch_warnings():
+    # the vectorized API is only exposed as unstable in h3 v3
+    warnings.simplefilter("ignore", UserWarning)
+    from h3.unstable import vect
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+@functools.cache
+def h3_cells(resolution: int) -> tuple[str, ...]:
+    """Return the sorted H3 cells of a resolution, the node order of the H3 encoders."""
+    return tuple(sorted(h3.uncompact(h3.get_res0_indexes(), resolution)))
+
+
+@functools.cache
+def h3_cell_ids(resolution: int) -> np.ndarray:
+    """Return the sorted H3 cells of a resolution as uint64 ids."""
+    # the cells of a resolution have fixed-length hex strings, the orders are the same
+    ids = np.array([h3.string_to_h3(cell) for cell in h3_cells(resolution)], dtype=np.uint64)
+    ids.flags.writeable = False
+    return ids
+
+
+@functools.cache
+def h3_cell_centers(resolution: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the latitudes and longitudes in degrees of the centers of the sorted cells."""
+    centers = np.array([h3.h3_to_geo(cell) for cell in h3_cells(resolution)], dtype=np.float64)
+    latitudes, longitudes = np.ascontiguousarray(centers[:, 0]), np.ascontiguousarray(centers[:, 1])
+    latitudes.flags.writeable = False
+    longitudes.flags.writeable = False
+    return latitudes, longitudes
+
+
+def cell_indices(latitudes, longitudes, resolution: int) -> np.ndarray:
+    """
+    Return the position in h3_cells(resolution) of the cell of every point.
+
+    Args:
+        latitudes: latitudes of the points in degrees, with shape [n].
+        longitudes: longitudes of the points in degrees, with shape [n].
+        resolution: H3 resolution.
+
+    Returns:
+        np.ndarray: int64 cell indices with shape [n].
+    """
+    latitudes = np.ascontiguousarray(latitudes, dtype=np.float64).ravel()
+    longitudes = np.ascontiguousarray(longitudes, dtype=np.float64).ravel()
+    ids = vect.geo_to_h3(latitudes, longitudes, resolution)
+    return np.searchsorted(h3_cell_ids(resolution), ids).astype(np.int64)
+
+
+def spatial_order(latitudes, longitudes, resolution: int) -> np.ndarray:
+    """
+    Return the permutation sorting points along the H3 space-filling order.
+
+    The points are sorted by their cell at resolution, i.e. the points of an H3 node are contiguous
+    and the nodes are in the order of h3_cells, then within a cell by the index of their cell at
+    the finest resolution. The H3 indices are hierarchical, hence nearby points are nearby in the
+    order.
+
+    Args:
+        latitudes: latitudes of the points in degrees, with shape [n].
+        longitudes: longitudes of the points in degrees, with shape [n].
+        resolution: H3 resolution of the nodes.
+
+    Returns:
+        np.ndarray: int64 permutation with shape [n].
+    """
+    latitudes = np.ascontiguousarray(latitudes, dtype=np.float64).ravel()
+    longitudes = np.ascontiguousarray(longitudes, dtype=np.float64).ravel()
+    # the cell of a point is not always the ancestor of its finest cell, both keys are needed
+    cells = vect.geo_to_h3(latitudes, longitudes, resolution)
+    return np.lexsort((vect.geo_to_h3(latitudes, longitudes, 15), cells)).astype(np.int64)
+
+
+def parent_indices(resolution: int, parent_resolution: int) -> np.ndarray:
+    """
+    Return the position in h3_cells(parent_resolution) of the parent of every cell of resolution.
+
+    Args:
+        resolution: H3 resolution of the cells.
+        parent_resolution: H3 resolution of the parents, at most resolution.
+
+    Returns:
+        np.ndarray: int64 parent indices with shape [num_cells].
+    """
+    parents = vect.h3_to_parent(h3_cell_ids(resolution), parent_resolution)
+    return np.searchsorted(h3_cell_ids(parent_resolution), parents).astype(np.int64)
+
+
+def region_cells(latitudes, longitudes, resolution: int, halo: int = 1):
+    """
+    Return the cells of a limited area: the cells of the points and halo rings of cells around them.
+
+    Args:
+        latitudes: latitudes of the points in degrees, with shape [n].
+        longitudes: longitudes of the points in degrees, with shape [n].
+        resolution: H3 resolution.
+        halo: number of rings of neighbors added around the cells of the points. Defaults to 1.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: the sorted int64 positions of the cells in
+            h3_cells(resolution), and a bool mask of the cells of the halo, i.e. without points.
+    """
+    if halo < 0:
+        raise ValueError(f"halo must be non-negative, got {halo}.")
+    cells = h3_cells(resolution)
+    covered = np.unique(cell_indices(latitudes, longitudes, resolution))
+    region = {cells[i] for i in covered}
+    frontier = region
+    for _ in range(halo):
+        frontier = {h for cell in frontier for h in h3.k_ring(cell, 1)} - region
+        region |= frontier
+    ids = np.sort(np.array([h3.string_to_h3(cell) for cell in region], dtype=np.uint64))
+    indices = np.searchsorted(h3_cell_ids(resolution), ids).astype(np.int64)
+    return indices, ~np.isin(indices, covered)
+
+
+def multi_mesh_edges(cells, resolution: int, levels: int) -> np.ndarray:
+    """
+    Return the edges of the coarser meshes of a multi-mesh, between cells of a resolution.
+
+    As in the multi-mesh of GraphCast, the nodes of the coarser meshes are a subset of the cells:
+    every cell of resolution - level is represented by its center child, and the center children
+    of neighboring coarse cells are connected. The edges of all the levels are merged, hence the
+    information travels 7^(level / 2) times further along the edges of a level.
+
+    Args:
+        cells: H3 cells of resolution, e.g. h3_cells(resolution) or the cells of a region.
+        resolution: H3 resolution of the cells.
+        levels: number of coarser resolutions, resolution - 1 to resolution - levels.
+
+    Returns:
+        np.ndarray: int64 edges with shape [2, E], the positions of the sender and receiver in
+            cells, without self-loops and duplicates.
+    """
+    index = {cell: i for i, cell in enumerate(cells)}
+    ids = np.array([h3.string_to_h3(cell) for cell in cells], dtype=np.uint64)
+    edges = []
+    for coarse_resolution in range(resolution - 1, max(resolution - levels, 0) - 1, -1):
+        for parent in np.unique(vect.h3_to_parent(ids, coarse_resolution)):
+            parent = h3.h3_to_string(int(parent))
+            center = index.get(h3.h3_to_center_child(parent, resolution))
+            if center is None:
+                continue
+            for neighbor in h3.k_ring(parent, 1):
+                other = index.get(h3.h3_to_center_child(neighbor, resolution))
+                if other is not None and other != center:
+                    edges.append((center, other))
+    if not edges:
+        return np.empty((2, 0), dtype=np.int64)
+    return np.unique(np.array(edges, dtype=np.int64), axis=0).T
+
+
+def great_circle_distance(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Return the great circle distance in radians between points, with the haversine formula.
+
+    Args:
+        lat1: latitudes of the first points in degrees.
+        lon1: longitudes of the first points in degrees.
+        lat2: latitudes of the second points in degrees.
+        lon2: longitudes of the second points in degrees.
+    """
+    lat1, lon1, lat2, lon2 = (
+        np.radians(np.asarray(x, dtype=np.float64)) for x in (lat1, lon1, lat2, lon2)
+    )
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
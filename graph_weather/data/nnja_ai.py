@@ -4,9 +4,14 @@ A custom PyTorch Dataset implementation for AMSU datasets.
 This script defines a custom PyTorch Dataset (`AMSUDataset`) for working with AMSU datasets.
 The dataset is loaded via the nnja library's `DataCatalog` and filtered for specific times and
 variables. Each data point consists of a timestamp, latitude, longitude, and associated metadata.
+
+The dataframe is converted once to contiguous columns, so that batches of observations are sliced
+from the columns at once: the DataLoader calls `__getitems__` with the indices of a whole batch,
+and `collate_fn` passes the batched dictionary through.
 """
 
 import numpy as np
+import pandas as pd
 import torch
 from torch.utils.data import Dataset
 
@@ -58,9 +63,25 @@ class AMSUDataset(Dataset):
             col for col in self.dataframe.columns if col not in self.primary_descriptors
         ]
 
+        # Columnar float32 tensors, the rows of a batch are sliced from them at once
+        timestamps = pd.to_datetime(self.dataframe["OBS_TIMESTAMP"], utc=True)
+        seconds = (timestamps - pd.Timestamp(0, tz="UTC")) / pd.Timedelta(seconds=1)
+        self.columns = {
+            "timestamp": torch.from_numpy(seconds.to_numpy(dtype=np.float32)),
+            "latitude": torch.from_numpy(self.dataframe["LAT"].to_numpy(dtype=np.float32)),
+            "longitude": torch.from_numpy(self.dataframe["LON"].to_numpy(dtype=np.float32)),
+            "metadata": torch.from_numpy(
+                np.ascontiguousarray(
+                    self.dataframe[self.metadata_columns].to_numpy(dtype=np.float32)
+                ).reshape(len(self.dataframe), len(self.metadata_columns))
+            ),
+        }
+        # the columns hold all the data, the dataframe is not kept, e.g. copied to the workers
+        self.dataframe = None
+
     def __len__(self):
         """Return the total number of samples in the dataset."""
-        return len(self.dataframe)
+        return len(self.columns["timestamp"])
 
     def __getitem__(self, index):
         """Return the observation and metadata for a given index.
@@ -71,27 +92,39 @@ class AMSUDataset(Dataset):
         Returns:
             A dictionary containing timestamp, latitude, longitude, and metadata.
         """
-        row = self.dataframe.iloc[index]
-        time = row["OBS_TIMESTAMP"].timestamp()
-        latitude = row["LAT"]
-        longitude = row["LON"]
-        metadata = np.array([row[col] for col in self.metadata_columns], dtype=np.float32)
-
-        return {
-            "timestamp": torch.tensor(time, dtype=torch.float32),
-            "latitude": torch.tensor(latitude, dtype=torch.float32),
-            "longitude": torch.tensor(longitude, dtype=torch.float32),
-            "metadata": torch.from_numpy(metadata),
-        }
+        return {key: column[index] for key, column in self.columns.items()}
+
+    def __getitems__(self, indices):
+        """Return the observations and metadata of a batch of indices.
+
+        Consecutive indices, e.g. from a DataLoader without shuffling, are sliced from the columns
+        without copies, other indices are gathered in a single op per column.
+
+        Args:
+            indices: Indices of the observations to retrieve.
+
+        Returns:
+            A dictionary of batched tensors, as returned by collate_fn.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        indices = np.where(indices < 0, indices + len(self), indices)
+        if len(indices) > 0 and np.all(np.diff(indices) == 1):
+            index = slice(indices[0], indices[-1] + 1)
+        else:
+            index = torch.from_numpy(indices)
+        return {key: column[index] for key, column in self.columns.items()}
 
 
 def collate_fn(batch):
     """Custom collate function to handle batching of dictionary data.
 
     Args:
-        batch: List of dictionaries from __getitem__
+        batch: List of dictionaries from __getitem__, or the dictionary of batched tensors from
+            __getitems__, which is returned as is.
 
     Returns:
         Single dictionary with batched tensors
     """
+    if isinstance(batch, dict):
+        return batch
     return {key: torch.stack([item[key] for item in batch]) for key in batch[0].keys()}
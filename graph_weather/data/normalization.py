@@ -0,0 +1,88 @@
+"""
+Registry of the normalization statistics.
+
+The statistics are shipped in normalization_stats.json and only loaded the first time a table is
+requested, then cached for the lifetime of the process. The tables are:
+- ANALYSIS_* and REANALYSIS_*: placeholders, empty lists.
+- LANDSEA_MEAN and LANDSEA_STD: statistics of the land-sea mask and orography fields.
+- SOLAR_MEAN, SOLAR_STD, SOLAR_MAX and SOLAR_MIN: statistics of the TOA solar irradiance.
+- FORECAST_*: statistics of the GFS forecast fields, keyed by "VARIABLE.level".
+- FORECAST_GROUPED_MEANS and FORECAST_GROUPED_STD: the FORECAST_MEANS and FORECAST_STD statistics
+  grouped by variable, averaged over pressure levels for the "_mb" variables and stacked for the
+  "max_wind" and "m_above_ground" groups, as used by the training scripts.
+- ERA5_MEANS, ERA5_STD, ERA5_DIFF_MEAN and ERA5_DIFF_STD: means and stds computed from
+  gs://weatherbench2/datasets/era5/1959-2022-6h-64x32_equiangular_conservative.zarr. The
+  atmospheric variables have 13 values, at the pressure levels of the WeatherBench (Rasp et al.,
+  2020) benchmark: 50, 100, 150, 200, 250, 300, 400, 500, 600, 700, 850, 925, and 1000 hPa.
+  ERA5_DIFF_MEAN and ERA5_DIFF_STD are the means and stds of 12h timesteps differences.
+
+New ERA5-like statistics can be computed with graph_weather.models.gencast.utils.statistics.
+"""
+
+import functools
+import json
+import os
+
+import numpy as np
+
+STATS_PATH = os.path.join(os.path.dirname(__file__), "normalization_stats.json")
+
+
+@functools.cache
+def _load_tables() -> dict:
+    with open(STATS_PATH) as f:
+        return json.load(f)
+
+
+def _to_array(value):
+    return np.array(value, dtype=np.float32) if isinstance(value, list) else value
+
+
+@functools.cache
+def get_table(name: str):
+    """
+    Return a table of statistics.
+
+    Tables mapping variables to statistics are returned as dicts, with the per-level statistics as
+    float32 arrays and the scalar statistics as floats. The returned objects are cached, they must
+    not be modified in place.
+
+    Args:
+        name: name of the table, e.g. "ERA5_MEANS" or "SOLAR_MEAN".
+    """
+    tables = _load_tables()
+    if name not in tables:
+        raise KeyError(f"Unknown statistics table {name}, available: {sorted(tables)}")
+    table = tables[name]
+    if isinstance(table, dict):
+        return {var: _to_array(value) for var, value in table.items()}
+    return table
+
+
+def get_stats(
+    name: str, variables: list[str], dtype=np.float32, as_tensor: bool = False
+) -> "np.ndarray | torch.Tensor":  # noqa: F821
+    """
+    Return the statistics of a list of variables, concatenated in a 1D array.
+
+    Per-level statistics contribute one value per level, scalar statistics a single value.
+
+    Args:
+        name: name of the table, e.g. "ERA5_MEANS".
+        variables: list of variables.
+        dtype: dtype of the output. Defaults to np.float32.
+        as_tensor: if true return a torch tensor. Defaults to False.
+    """
+    table = get_table(name)
+    stats = np.concatenate([np.atleast_1d(table[var]) for var in variables]).astype(dtype)
+    if as_tensor:
+        # torch is only imported when needed, to keep the registry cheap to import.
+        import torch
+
+        return torch.from_numpy(stats)
+    return stats
+
+
+def available_tables() -> list[str]:
+    """Return the names of the tables."""
+    return list(_load_tables())
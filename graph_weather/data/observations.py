@@ -0,0 +1,265 @@
+"""
+Observation pipeline of the assimilator.
+
+Raw observations, e.g. the batches of AMSUDataset, are binned into assimilation windows and
+converted to the inputs of GraphWeatherAssimilator: the features [1, P, C + 1] are the C channels
+of the observations and their relative time in the window, and lat_lon_heights is [P, 3]. The H3
+cells of the observations are computed vectorially, and the observations of a window are sorted by
+cell. The number of observations varies from window to window, hence every window is padded to the
+smallest of a few canonical sizes: the assimilator only sees a handful of shapes, and the padded
+observations are nodes without edges of the input graph. The cells are passed along as
+"cell_index", the assimilator does not recompute them.
+
+Dense satellite swaths have many observations per H3 cell, superobservations optionally thins them
+beforehand: the observations of every H3 cell and time bin are averaged into a super-observation,
+with the number of averaged values and their variance as additional channels.
+"""
+
+import numpy as np
+import scipy.sparse
+import torch
+
+from graph_weather.data.h3_grid import cell_indices
+
+DEFAULT_BUCKET_SIZES = (1024, 4096, 16384, 65536)
+
+
+def _to_numpy(array, dtype) -> np.ndarray:
+    if isinstance(array, torch.Tensor):
+        array = array.detach().cpu().numpy()
+    return np.asarray(array, dtype=dtype)
+
+
+def time_windows(timestamps, window_seconds: float, origin: float = 0.0) -> np.ndarray:
+    """
+    Return the assimilation window of every observation.
+
+    Args:
+        timestamps: observation times in seconds since the epoch, with shape [n].
+        window_seconds: length of the windows in seconds.
+        origin: start of the first window, in seconds since the epoch. Defaults to 0.
+
+    Returns:
+        np.ndarray: int64 window indices with shape [n], the window i starts at
+            origin + i * window_seconds.
+    """
+    timestamps = _to_numpy(timestamps, np.float64)
+    return np.floor((timestamps - origin) / window_seconds).astype(np.int64)
+
+
+def superobservations(
+    observations: dict,
+    resolution: int = 2,
+    bin_seconds: float = 3600,
+    origin: float = 0.0,
+    append_statistics: bool = True,
+) -> dict:
+    """
+    Aggregate the observations of every H3 cell and time bin into super-observations.
+
+    Every channel is averaged over its non-NaN values, the counts and variances are per channel.
+    The position is the mean of the unit vectors of the observations and the time and height are
+    averaged. The group-by is computed at once with a sparse [groups, observations] matrix.
+
+    Args:
+        observations: dictionary of columns, see ObservationBucketer.
+        resolution: H3 resolution of the cells. Defaults to 2.
+        bin_seconds: length of the time bins in seconds. The bins should divide the assimilation
+            windows. Defaults to 1 hour.
+        origin: start of the first bin, in seconds since the epoch. Defaults to 0.
+        append_statistics: if true the log(1 + count) and the variance of the channels are
+            appended to the channels of "metadata", i.e. it has 3 * C columns. Defaults to True.
+
+    Returns:
+        dict: columns of the super-observations, "timestamp", "latitude", "longitude", "height"
+            and "metadata" as float64 NumPy arrays, and "count" and "variance" [m, C].
+    """
+    timestamps = _to_numpy(observations["timestamp"], np.float64)
+    latitudes = _to_numpy(observations["latitude"], np.float64)
+    longitudes = _to_numpy(observations["longitude"], np.float64)
+    channels = _to_numpy(observations["metadata"], np.float64).reshape(len(timestamps), -1)
+    if "height" in observations:
+        heights = _to_numpy(observations["height"], np.float64)
+    else:
+        heights = np.zeros(len(timestamps))
+
+    cells = cell_indices(latitudes, longitudes, resolution)
+    bins = time_windows(timestamps, bin_seconds, origin)
+    _, groups = np.unique(np.stack([bins, cells]), axis=1, return_inverse=True)
+    groups = groups.ravel()
+    num_groups = int(groups.max()) + 1 if len(groups) else 0
+    # [groups, observations] indicator matrix, the sums over the groups are matrix products
+    members = scipy.sparse.csr_matrix(
+        (np.ones(len(groups)), (groups, np.arange(len(groups)))), shape=(num_groups, len(groups))
+    )
+    group_sizes = np.asarray(members.sum(axis=1)).ravel()
+
+    valid = ~np.isnan(channels)
+    values = np.where(valid, channels, 0.0)
+    count = members @ valid.astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = (members @ values) / count
+        variance = np.clip((members @ np.square(values)) / count - np.square(mean), 0.0, None)
+
+    lat, lon = np.radians(latitudes), np.radians(longitudes)
+    vectors = members @ np.stack(
+        [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1
+    )
+    output = {
+        "timestamp": (members @ timestamps) / group_sizes,
+        "latitude": np.degrees(np.arctan2(vectors[:, 2], np.hypot(vectors[:, 0], vectors[:, 1]))),
+        "longitude": np.degrees(np.arctan2(vectors[:, 1], vectors[:, 0])),
+        "height": (members @ heights) / group_sizes,
+        "count": count,
+        "variance": variance,
+    }
+    if append_statistics:
+        output["metadata"] = np.concatenate([mean, np.log1p(count), variance], axis=1)
+    else:
+        output["metadata"] = mean
+    return output
+
+
+def bucket_size(num_observations: int, bucket_sizes=DEFAULT_BUCKET_SIZES) -> int:
+    """
+    Return the padded size of a number of observations.
+
+    Args:
+        num_observations: number of observations.
+        bucket_sizes: increasing canonical sizes. Larger numbers of observations are padded to a
+            multiple of the largest size.
+    """
+    for size in bucket_sizes:
+        if num_observations <= size:
+            return size
+    largest = bucket_sizes[-1]
+    return -(-num_observations // largest) * largest
+
+
+class ObservationBucketer:
+    """
+    Convert raw observations to padded assimilator inputs, one per assimilation window.
+
+    The observations are given as a dictionary of columns, with the keys of the AMSUDataset batches:
+    "timestamp" [n] in seconds since the epoch, "latitude" [n], "longitude" [n] in degrees and
+    "metadata" [n, C] the observed channels. An optional "height" [n] column is used as the height
+    of the observations, otherwise it is 0.
+    """
+
+    def __init__(
+        self,
+        resolution: int = 2,
+        window_seconds: float = 6 * 3600,
+        bucket_sizes=DEFAULT_BUCKET_SIZES,
+        origin: float = 0.0,
+    ):
+        """
+        Initialize the bucketer.
+
+        Args:
+            resolution: H3 resolution of the assimilator. Defaults to 2.
+            window_seconds: length of the assimilation windows in seconds. Defaults to 6 hours.
+            bucket_sizes: increasing canonical sizes the windows are padded to.
+                Defaults to DEFAULT_BUCKET_SIZES.
+            origin: start of the first window, in seconds since the epoch. Defaults to 0.
+        """
+        if list(bucket_sizes) != sorted(bucket_sizes) or len(bucket_sizes) == 0:
+            raise ValueError(f"bucket_sizes must be non-empty and increasing, got {bucket_sizes}.")
+        self.resolution = resolution
+        self.window_seconds = window_seconds
+        self.bucket_sizes = tuple(bucket_sizes)
+        self.origin = origin
+
+    def __call__(self, observations: dict) -> list[dict]:
+        """
+        Bin, sort and pad the observations.
+
+        Args:
+            observations: dictionary of columns, see the class docstring.
+
+        Returns:
+            list[dict]: one dictionary per non-empty window, in time order, with
+                - "window_start": start of the window in seconds since the epoch.
+                - "features": float32 tensor [1, P, C + 1], the channels and the time since the
+                  start of the window as a fraction of the window.
+                - "lat_lon_heights": float32 tensor [P, 3].
+                - "cell_index": int64 tensor [P], position of the H3 cell of the observations in the
+                  sorted cells at the resolution of the bucketer, 0 for the padding.
+                - "mask": bool tensor [P], false for the padding.
+                - "num_observations": number of observations before padding.
+        """
+        timestamps = _to_numpy(observations["timestamp"], np.float64)
+        latitudes = _to_numpy(observations["latitude"], np.float64)
+        longitudes = _to_numpy(observations["longitude"], np.float64)
+        channels = _to_numpy(observations["metadata"], np.float32).reshape(len(timestamps), -1)
+        if "height" in observations:
+            heights = _to_numpy(observations["height"], np.float32)
+        else:
+            heights = np.zeros(len(timestamps), dtype=np.float32)
+
+        windows = time_windows(timestamps, self.window_seconds, self.origin)
+        cells = cell_indices(latitudes, longitudes, self.resolution)
+        relative_time = (timestamps - self.origin) / self.window_seconds - windows
+        # group by window then by cell, the observations of a cell are contiguous
+        order = np.lexsort((cells, windows))
+        window_ids, starts = np.unique(windows[order], return_index=True)
+        stops = np.append(starts[1:], len(order))
+
+        outputs = []
+        for window, start, stop in zip(window_ids, starts, stops):
+            index = order[start:stop]
+            num_observations = len(index)
+            size = bucket_size(num_observations, self.bucket_sizes)
+            features = np.zeros((size, channels.shape[1] + 1), dtype=np.float32)
+            features[:num_observations, :-1] = channels[index]
+            features[:num_observations, -1] = relative_time[index]
+            lat_lon_heights = np.zeros((size, 3), dtype=np.float32)
+            lat_lon_heights[:num_observations, 0] = latitudes[index]
+            lat_lon_heights[:num_observations, 1] = longitudes[index]
+            lat_lon_heights[:num_observations, 2] = heights[index]
+            cell_index = np.zeros(size, dtype=np.int64)
+            cell_index[:num_observations] = cells[index]
+            mask = np.arange(size) < num_observations
+            outputs.append(
+                {
+                    "window_start": self.origin + float(window) * self.window_seconds,
+                    "features": torch.from_numpy(features)[None],
+                    "lat_lon_heights": torch.from_numpy(lat_lon_heights),
+                    "cell_index": torch.from_numpy(cell_index),
+                    "mask": torch.from_numpy(mask),
+                    "num_observations": num_observations,
+                }
+            )
+        return outputs
+
+
+def collate_windows(windows: list[dict]) -> dict:
+    """
+    Stack windows of ObservationBucketer into a batch, e.g. several cycles or ensemble members.
+
+    The windows are padded to the largest of their sizes, the batch is the input of
+    GraphWeatherAssimilator: features [B, P, C + 1], lat_lon_heights [B, P, 3], mask [B, P] and
+    cell_index [B, P].
+
+    Args:
+        windows: windows returned by ObservationBucketer.
+
+    Returns:
+        dict: the stacked "features", "lat_lon_heights", "cell_index" and "mask", the list of
+            "window_start" and the "num_observations" tensor [B].
+    """
+    size = max(window["mask"].shape[0] for window in windows)
+
+    def pad(tensor):
+        return torch.nn.functional.pad(
+            tensor, [0, 0] * (tensor.dim() - 1) + [0, size - len(tensor)]
+        )
+
+    return {
+        "features": torch.stack([pad(window["features"][0]) for window in windows]),
+        "lat_lon_heights": torch.stack([pad(window["lat_lon_heights"]) for window in windows]),
+        "cell_index": torch.stack([pad(window["cell_index"]) for window in windows]),
+        "mask": torch.stack([pad(window["mask"]) for window in windows]),
+        "window_start": [window["window_start"] for window in windows],
+        "num_observations": torch.tensor([window["num_observations"] for window in windows]),
+    }
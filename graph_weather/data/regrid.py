@@ -0,0 +1,319 @@
+"""
+Regridding with precomputed sparse remap weights.
+
+A regridding between two grids is a linear map, i.e. a sparse matrix W with shape [n_dst, n_src]:
+the fields on the destination grid are W @ fields. The weights only depend on the two grids, hence
+they are computed once, optionally stored on disk, and every batch of fields is then regridded with
+a single sparse-dense matrix product, with SciPy on NumPy arrays or with torch on the device of the
+tensors.
+
+The lat/lon grids are given by their 1D latitudes and longitudes, in degrees, and the fields are
+flattened latitude-major, as in the loaders (np.meshgrid(lat, lon).T.reshape(-1, 2)). Longitudes
+are periodic. The supported weights are:
+- bilinear: linear in latitude then in longitude, the latitudes outside the source range take the
+  values of the nearest source latitude.
+- conservative: first order conservative, the destination value is the mean of the source values
+  weighted by the overlap area of the cells. The cell bounds are the midpoints between the centers,
+  and the poles for the first and last latitudes.
+- latlon_to_h3: mean of the points in every H3 cell, weighted by the cosine of the latitude. The
+  cells without points are zero.
+- h3_to_latlon: every point takes the value of its H3 cell.
+The H3 cells are ordered as the H3 nodes of the encoders, i.e. sorted.
+
+Example:
+    regridder = latlon_regridder(lat, lon, lat[::4], lon[::4], "conservative", path="w.npz")
+    coarse = regridder(fields, dim=1)  # [batch, nodes, features]
+"""
+
+import hashlib
+import os
+
+import numpy as np
+import scipy.sparse
+
+from graph_weather.data.h3_grid import cell_indices, h3_cells
+
+METHODS = ("bilinear", "conservative")
+
+
+def _cell_bounds(centers: np.ndarray, periodic: bool) -> tuple[np.ndarray, np.ndarray]:
+    """Return the lower and upper bounds of the cells, in the order of the centers."""
+    order = np.argsort(centers)
+    sorted_centers = centers[order]
+    if periodic:
+        gaps = np.diff(sorted_centers, append=sorted_centers[0] + 360.0)
+        upper = sorted_centers + gaps / 2
+        lower = sorted_centers - np.roll(gaps, 1) / 2
+    else:
+        midpoints = (sorted_centers[1:] + sorted_centers[:-1]) / 2
+        lower = np.concatenate([[-90.0], midpoints])
+        upper = np.concatenate([midpoints, [90.0]])
+    bounds = np.empty((2, len(centers)))
+    bounds[:, order] = lower, upper
+    return bounds[0], bounds[1]
+
+
+def _conservative_weights_1d(src: np.ndarray, dst: np.ndarray, periodic: bool) -> np.ndarray:
+    """Return the dense [n_dst, n_src] overlap weights of two 1D grids, normalized by row."""
+    src_lower, src_upper = _cell_bounds(src, periodic)
+    dst_lower, dst_upper = _cell_bounds(dst, periodic)
+    if periodic:
+        # the cells are compared over the three periods around the destination cells.
+        shifts = np.array([-360.0, 0.0, 360.0])[:, None, None]
+    else:
+        # the overlap is an area on the sphere, proportional to the difference of sin(latitude).
+        src_lower, src_upper, dst_lower, dst_upper = (
+            np.sin(np.radians(x)) for x in (src_lower, src_upper, dst_lower, dst_upper)
+        )
+        shifts = np.zeros((1, 1, 1))
+    upper = np.minimum(dst_upper[:, None], src_upper[None, :] + shifts)
+    lower = np.maximum(dst_lower[:, None], src_lower[None, :] + shifts)
+    overlap = np.clip(upper - lower, 0.0, None).sum(axis=0)
+    return overlap / np.maximum(overlap.sum(axis=1, keepdims=True), np.finfo(np.float64).tiny)
+
+
+def _bilinear_weights_1d(src: np.ndarray, dst: np.ndarray, periodic: bool) -> np.ndarray:
+    """Return the dense [n_dst, n_src] linear interpolation weights of two 1D grids."""
+    order = np.argsort(src)
+    sorted_src = src[order]
+    if periodic:
+        sorted_src = np.concatenate([sorted_src, [sorted_src[0] + 360.0]])
+        order = np.concatenate([order, order[:1]])
+        dst = sorted_src[0] + np.mod(dst - sorted_src[0], 360.0)
+    else:
+        dst = np.clip(dst, sorted_src[0], sorted_src[-1])
+    upper = np.clip(np.searchsorted(sorted_src, dst, side="right"), 1, len(sorted_src) - 1)
+    lower = upper - 1
+    fraction = (dst - sorted_src[lower]) / (sorted_src[upper] - sorted_src[lower])
+    weights = np.zeros((len(dst), len(src)))
+    rows = np.arange(len(dst))
+    np.add.at(weights, (rows, order[lower]), 1.0 - fraction)
+    np.add.at(weights, (rows, order[upper]), fraction)
+    return weights
+
+
+def latlon_weights(
+    src_lats, src_lons, dst_lats, dst_lons, method: str = "conservative"
+) -> scipy.sparse.csr_matrix:
+    """
+    Compute the remap weights between two lat/lon grids.
+
+    Both methods are separable, the weights are the Kronecker product of the latitude and longitude
+    weights.
+
+    Args:
+        src_lats: latitudes of the source grid with shape [n_src_lat].
+        src_lons: longitudes of the source grid with shape [n_src_lon].
+        dst_lats: latitudes of the destination grid with shape [n_dst_lat].
+        dst_lons: longitudes of the destination grid with shape [n_dst_lon].
+        method: "bilinear" or "conservative". Defaults to "conservative".
+
+    Returns:
+        scipy.sparse.csr_matrix: weights with shape [n_dst_lat * n_dst_lon, n_src_lat * n_src_lon].
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown regridding method {method}, expected one of {METHODS}.")
+    weights_1d = _conservative_weights_1d if method == "conservative" else _bilinear_weights_1d
+    src_lats, src_lons, dst_lats, dst_lons = (
+        np.asarray(x, dtype=np.float64).ravel() for x in (src_lats, src_lons, dst_lats, dst_lons)
+    )
+    lat_weights = scipy.sparse.csr_matrix(weights_1d(src_lats, dst_lats, periodic=False))
+    lon_weights = scipy.sparse.csr_matrix(weights_1d(src_lons, dst_lons, periodic=True))
+    return scipy.sparse.kron(lat_weights, lon_weights, format="csr")
+
+
+def h3_weights(latitudes, longitudes, resolution: int, to_h3: bool = True):
+    """
+    Compute the remap weights between a set of lat/lon points and the H3 cells of a resolution.
+
+    Args:
+        latitudes: latitudes of the points in degrees, with shape [n].
+        longitudes: longitudes of the points in degrees, with shape [n].
+        resolution: H3 resolution.
+        to_h3: if true map the points to the cells, otherwise the cells to the points.
+            Defaults to True.
+
+    Returns:
+        scipy.sparse.csr_matrix: weights with shape [num_cells, n] if to_h3 else [n, num_cells].
+    """
+    latitudes = np.asarray(latitudes, dtype=np.float64).ravel()
+    longitudes = np.asarray(longitudes, dtype=np.float64).ravel()
+    num_cells = len(h3_cells(resolution))
+    cells = cell_indices(latitudes, longitudes, resolution)
+    points = np.arange(len(latitudes))
+    if not to_h3:
+        return scipy.sparse.csr_matrix(
+            (np.ones(len(points)), (points, cells)), shape=(len(points), num_cells)
+        )
+    # the points at the poles keep a small weight, in case they are alone in their cell.
+    area = np.clip(np.cos(np.radians(latitudes)), 1e-6, None)
+    cell_area = np.bincount(cells, weights=area, minlength=num_cells)
+    return scipy.sparse.csr_matrix(
+        (area / cell_area[cells], (cells, points)), shape=(num_cells, len(points))
+    )
+
+
+class Regridder:
+    """
+    Regridding with a sparse weight matrix.
+
+    The weights are kept as a SciPy CSR matrix for NumPy fields, and converted once per device and
+    dtype to a torch sparse CSR tensor for tensor fields.
+    """
+
+    def __init__(self, weights: scipy.sparse.spmatrix, dtype=np.float32):
+        """
+        Initialize the regridder.
+
+        Args:
+            weights: weights with shape [n_dst, n_src].
+            dtype: dtype of the weights. Defaults to np.float32.
+        """
+        self.weights = scipy.sparse.csr_matrix(weights, dtype=dtype)
+        self._tensors = {}
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Shape [n_dst, n_src] of the weights."""
+        return self.weights.shape
+
+    def save(self, path: str, key: str = ""):
+        """
+        Write the weights to a .npz file.
+
+        Args:
+            path: output path.
+            key: identifier of the grids, checked by load. Defaults to "".
+        """
+        np.savez(
+            path,
+            data=self.weights.data,
+            indices=self.weights.indices,
+            indptr=self.weights.indptr,
+            shape=np.asarray(self.weights.shape),
+            key=np.asarray(key),
+        )
+
+    @classmethod
+    def load(cls, path: str, key: str | None = None) -> "Regridder | None":
+        """
+        Read the weights written by save.
+
+        Args:
+            path: path of the .npz file.
+            key: expected identifier of the grids. Defaults to None, i.e. not checked.
+
+        Returns:
+            Regridder: the regridder, or None if the file is missing or was written for other grids.
+        """
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as f:
+            if key is not None and str(f["key"]) != key:
+                return None
+            weights = scipy.sparse.csr_matrix(
+                (f["data"], f["indices"], f["indptr"]), shape=tuple(f["shape"])
+            )
+        return cls(weights, dtype=weights.dtype)
+
+    def __getstate__(self):
+        # the torch tensors are rebuilt on demand, e.g. in every DataLoader worker.
+        state = self.__dict__.copy()
+        state["_tensors"] = {}
+        return state
+
+    def _tensor(self, device, dtype):
+        key = (str(device), dtype)
+        if key not in self._tensors:
+            import torch
+
+            self._tensors[key] = torch.sparse_csr_tensor(
+                torch.from_numpy(self.weights.indptr.astype(np.int64)),
+                torch.from_numpy(self.weights.indices.astype(np.int64)),
+                torch.from_numpy(self.weights.data),
+                size=self.weights.shape,
+                dtype=dtype,
+                device=device,
+                check_invariants=False,
+            )
+        return self._tensors[key]
+
+    def __call__(self, fields, dim: int = 0):
+        """
+        Regrid a batch of fields.
+
+        Args:
+            fields: NumPy array or torch tensor with the n_src nodes along dim.
+            dim: node dimension. Defaults to 0.
+
+        Returns:
+            Fields of the same type with the n_dst nodes along dim.
+        """
+        if fields.shape[dim] != self.shape[1]:
+            raise ValueError(
+                f"Expected {self.shape[1]} nodes along dimension {dim}, got {fields.shape[dim]}."
+            )
+        if isinstance(fields, np.ndarray):
+            moved = np.moveaxis(fields, dim, 0)
+            output = self.weights @ moved.reshape(moved.shape[0], -1)
+            return np.moveaxis(output.reshape((self.shape[0],) + moved.shape[1:]), 0, dim)
+        moved = fields.movedim(dim, 0)
+        weights = self._tensor(fields.device, fields.dtype)
+        output = weights @ moved.reshape(moved.shape[0], -1)
+        return output.reshape((self.shape[0],) + moved.shape[1:]).movedim(0, dim)
+
+
+def _grids_key(*arrays, **params) -> str:
+    digest = hashlib.sha1()
+    for array in arrays:
+        digest.update(np.asarray(array, dtype=np.float64).tobytes())
+    digest.update(repr(sorted(params.items())).encode())
+    return digest.hexdigest()
+
+
+def latlon_regridder(
+    src_lats, src_lons, dst_lats, dst_lons, method: str = "conservative", path: str | None = None
+) -> Regridder:
+    """
+    Return the regridder between two lat/lon grids, reading or writing its weights at path.
+
+    Args:
+        src_lats: latitudes of the source grid.
+        src_lons: longitudes of the source grid.
+        dst_lats: latitudes of the destination grid.
+        dst_lons: longitudes of the destination grid.
+        method: "bilinear" or "conservative". Defaults to "conservative".
+        path: .npz file of the weights, recomputed if missing or written for other grids.
+            Defaults to None, i.e. always computed.
+    """
+    key = _grids_key(src_lats, src_lons, dst_lats, dst_lons, method=method)
+    regridder = Regridder.load(path, key) if path is not None else None
+    if regridder is None:
+        regridder = Regridder(latlon_weights(src_lats, src_lons, dst_lats, dst_lons, method))
+        if path is not None:
+            regridder.save(path, key)
+    return regridder
+
+
+def h3_regridder(
+    latitudes, longitudes, resolution: int, to_h3: bool = True, path: str | None = None
+) -> Regridder:
+    """
+    Return the regridder from lat/lon points to H3 cells or back, with its weights at path.
+
+    Args:
+        latitudes: latitudes of the points, with shape [n].
+        longitudes: longitudes of the points, with shape [n].
+        resolution: H3 resolution.
+        to_h3: if true map the points to the cells, otherwise the cells to the points.
+            Defaults to True.
+        path: .npz file of the weights, recomputed if missing or written for other points.
+            Defaults to None, i.e. always computed.
+    """
+    key = _grids_key(latitudes, longitudes, resolution=resolution, to_h3=to_h3)
+    regridder = Regridder.load(path, key) if path is not None else None
+    if regridder is None:
+        regridder = Regridder(h3_weights(latitudes, longitudes, resolution, to_h3))
+        if path is not None:
+            regridder.save(path, key)
+    return regridder
@@ -0,0 +1,269 @@
+"""
+Vectorized top-of-atmosphere solar irradiance.
+
+This is the array equivalent of pysolar.util.extraterrestrial_irrad: the irradiance is computed for
+a batch of times and a set of locations in one call, with NumPy or, if the locations are tensors,
+with torch on their device. As in pysolar the times are taken in UTC, to the minute.
+
+SolarIrradianceCache precomputes or caches the irradiance windows of a fixed grid, as the same
+timestamps recur across samples and epochs.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from graph_weather.data.cache import LRUCache
+
+SOLAR_CONSTANT = 1367.0  # W/m2, pysolar.util.SC_default
+EARTH_AXIS_INCLINATION = 23.45  # degrees
+
+
+def _time_components(times) -> tuple[np.ndarray, np.ndarray]:
+    """Return the day of the year and the minutes since midnight, in UTC, of the times."""
+    times = pd.DatetimeIndex(np.atleast_1d(times))
+    if times.tz is not None:
+        times = times.tz_convert("UTC")
+    day = times.dayofyear.values.astype(np.float64)
+    minutes = (times.hour * 60 + times.minute).values.astype(np.float64)
+    return day, minutes
+
+
+def extraterrestrial_irradiance(times, latitudes, longitudes, solar_constant=SOLAR_CONSTANT):
+    """
+    Compute the top-of-atmosphere solar irradiance.
+
+    Args:
+        times: timestamps with shape [t], e.g. datetime64 or pandas timestamps. Naive timestamps are
+            assumed to be in UTC.
+        latitudes: latitudes in degrees with shape [n], as a NumPy array or torch tensor.
+        longitudes: longitudes in degrees with shape [n], as a NumPy array or torch tensor.
+        solar_constant: solar constant in W/m2. Defaults to 1367.
+
+    Returns:
+        Irradiance in W/m2 with shape [t, n], a tensor on the device of the locations if they are
+        tensors, otherwise a float64 NumPy array.
+    """
+    day, minutes = _time_components(times)
+
+    # terms depending only on the time, [t, 1]
+    angle = 2 * np.pi * (day - 1.0) / 365.0
+    distance_factor = (
+        1.00010
+        + 0.034221 * np.cos(angle)
+        + 0.001280 * np.sin(angle)
+        + 0.000719 * np.cos(2 * angle)
+        + 0.000077 * np.sin(2 * angle)
+    )[:, None]
+    declination = np.radians(EARTH_AXIS_INCLINATION * np.sin((2 * np.pi / 365.0) * (day - 81)))
+    b = 2 * np.pi / 364.0 * (day - 81)
+    equation_of_time = 9.87 * np.sin(2 * b) - 7.53 * np.cos(b) - 1.5 * np.sin(b)
+    sin_declination = np.sin(declination)[:, None]
+    cos_declination = np.cos(declination)[:, None]
+
+    if isinstance(latitudes, np.ndarray) or not hasattr(latitudes, "device"):
+        xp = np
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+    else:
+        import torch
+
+        xp = torch
+        distance_factor, sin_declination, cos_declination, minutes, equation_of_time = (
+            torch.as_tensor(x, dtype=latitudes.dtype, device=latitudes.device)
+            for x in (distance_factor, sin_declination, cos_declination, minutes, equation_of_time)
+        )
+
+    # solar time in hours, hour angle in radians, [t, n]
+    solar_time = (minutes[:, None] + 4 * longitudes[None, :] + equation_of_time[:, None]) / 60
+    hour_angle = (15.0 * (solar_time - 12.0)) * (np.pi / 180.0)
+    latitudes = latitudes[None, :] * (np.pi / 180.0)
+    cos_zenith = xp.sin(latitudes) * sin_declination
+    cos_zenith = cos_zenith + xp.cos(latitudes) * cos_declination * xp.cos(hour_angle)
+    irradiance = solar_constant * cos_zenith * distance_factor
+    return xp.where(cos_zenith > 0, irradiance, xp.zeros_like(irradiance))
+
+
+def irradiance_window(time, latitudes, longitudes, hours: int = 12, freq: str = "1h"):
+    """
+    Compute the irradiance at a time and in the window of +- hours around it.
+
+    This is the solar feature of the analysis and forecast loaders: the first row is the irradiance
+    at the given time, followed by the irradiance at every step of the window, bounds included.
+
+    Args:
+        time: timestamp.
+        latitudes: latitudes in degrees with shape [n].
+        longitudes: longitudes in degrees with shape [n].
+        hours: half width of the window, in hours. Defaults to 12.
+        freq: step of the window. Defaults to "1h".
+
+    Returns:
+        Irradiance in W/m2 with shape [2 + 2 * hours / step, n].
+    """
+    time = pd.Timestamp(time)
+    window = pd.date_range(
+        time - pd.Timedelta(hours=hours), time + pd.Timedelta(hours=hours), freq=freq
+    )
+    return extraterrestrial_irradiance(window.insert(0, time), latitudes, longitudes)
+
+
+class SolarIrradianceCache:
+    """
+    Cache of the irradiance of a fixed set of locations, e.g. the nodes of a grid.
+
+    The hourly irradiance can be precomputed over a date range, then the windows of the timestamps
+    on the hour are slices of the table. If a path is given the table is written once to a NumPy
+    file and memory-mapped read-only: the DataLoader workers share the pages through the OS page
+    cache, and the file is reused across runs. The other timestamps are computed on demand and
+    kept in a per-worker LRU cache.
+    """
+
+    def __init__(
+        self,
+        latitudes,
+        longitudes,
+        start=None,
+        end=None,
+        path: str | None = None,
+        hours: int = 12,
+        max_bytes: int = 2**28,
+        dtype=np.float32,
+    ):
+        """
+        Initialize the cache, precomputing the hourly table if a date range is given.
+
+        Args:
+            latitudes: latitudes in degrees with shape [n].
+            longitudes: longitudes in degrees with shape [n].
+            start: first timestamp of the precomputed range. Defaults to None, i.e. no table.
+            end: last timestamp of the precomputed range. Defaults to None.
+            path: directory of the memory-mapped table. Defaults to None, i.e. kept in memory.
+            hours: half width of the windows, in hours. Defaults to 12.
+            max_bytes: max size of the LRU cache of the timestamps not in the table.
+                Defaults to 256 MiB.
+            dtype: dtype of the cached irradiance. Defaults to np.float32.
+        """
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)
+        self.hours = hours
+        self.dtype = dtype
+        self.path = path
+        self.lru = LRUCache(max_bytes=max_bytes)
+
+        self.table_start = None
+        self.num_hours = 0
+        self._table = None
+        if start is not None and end is not None:
+            # the table covers the windows of all the hours in [start, end]
+            self.table_start = pd.Timestamp(start).floor("h") - pd.Timedelta(hours=hours)
+            table_end = pd.Timestamp(end).ceil("h") + pd.Timedelta(hours=hours)
+            self.num_hours = int((table_end - self.table_start) / pd.Timedelta(hours=1)) + 1
+            if path is None:
+                self._table = self._compute_table(
+                    np.empty((self.num_hours, len(self.latitudes)), dtype=dtype)
+                )
+            elif not self._is_valid_store():
+                self._write_store()
+
+    def _metadata(self) -> dict:
+        return {
+            "table_start": str(self.table_start),
+            "num_hours": self.num_hours,
+            "num_locations": len(self.latitudes),
+            "dtype": np.dtype(self.dtype).name,
+            "locations_hash": hashlib.sha1(
+                self.latitudes.tobytes() + self.longitudes.tobytes()
+            ).hexdigest(),
+        }
+
+    def _is_valid_store(self) -> bool:
+        metadata_path = os.path.join(self.path, "metadata.json")
+        if not os.path.exists(metadata_path):
+            return False
+        with open(metadata_path) as f:
+            return json.load(f) == self._metadata()
+
+    def _compute_table(self, table, chunk_size: int = 24 * 7):
+        for start in range(0, self.num_hours, chunk_size):
+            stop = min(start + chunk_size, self.num_hours)
+            times = self.table_start + pd.to_timedelta(np.arange(start, stop), unit="h")
+            table[start:stop] = extraterrestrial_irradiance(times, self.latitudes, self.longitudes)
+        return table
+
+    def _write_store(self):
+        os.makedirs(self.path, exist_ok=True)
+        table = np.lib.format.open_memmap(
+            os.path.join(self.path, "irradiance.npy"),
+            mode="w+",
+            dtype=self.dtype,
+            shape=(self.num_hours, len(self.latitudes)),
+        )
+        self._compute_table(table)
+        table.flush()
+        del table
+        # the metadata is written last, an interrupted write is recomputed.
+        with open(os.path.join(self.path, "metadata.json"), "w") as f:
+            json.dump(self._metadata(), f)
+
+    @property
+    def table(self):
+        """Hourly irradiance table with shape [hours, n], or None if there is no date range."""
+        if self._table is None and self.path is not None and self.num_hours > 0:
+            # opened lazily, so that every worker maps the file instead of unpickling a copy.
+            self._table = np.load(os.path.join(self.path, "irradiance.npy"), mmap_mode="r")
+        return self._table
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.path is not None:
+            state["_table"] = None
+        return state
+
+    def _table_index(self, time: pd.Timestamp) -> int | None:
+        if self.table_start is None or time != time.floor("h"):
+            return None
+        index = int((time - self.table_start) / pd.Timedelta(hours=1))
+        if self.hours <= index < self.num_hours - self.hours:
+            return index
+        return None
+
+    def window(self, time) -> np.ndarray:
+        """
+        Return the irradiance at a time and in the window of +- hours around it.
+
+        The output is the same as irradiance_window(time, latitudes, longitudes, hours), in the
+        dtype of the cache.
+
+        Args:
+            time: timestamp.
+
+        Returns:
+            np.ndarray: irradiance with shape [2 + 2 * hours, n].
+        """
+        time = pd.Timestamp(time)
+        if time.tz is not None:
+            time = time.tz_convert("UTC").tz_localize(None)
+        index = self._table_index(time)
+        if index is not None:
+            table = self.table
+            return np.concatenate(
+                [table[index : index + 1], table[index - self.hours : index + self.hours + 1]]
+            )
+
+        window = pd.date_range(
+            time - pd.Timedelta(hours=self.hours), time + pd.Timedelta(hours=self.hours), freq="1h"
+        ).insert(0, time)
+        rows = {t: self.lru.get(t) for t in window.unique()}
+        missing = [t for t, row in rows.items() if row is None]
+        if missing:
+            irradiance = extraterrestrial_irradiance(
+                missing, self.latitudes, self.longitudes
+            ).astype(self.dtype)
+            for t, row in zip(missing, irradiance):
+                rows[t] = row
+                self.lru.put(t, row)
+        return np.stack([rows[t] for t in window])
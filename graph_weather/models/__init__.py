@@ -1,14 +1,22 @@
-"""Models"""
-
-from .fengwu_ghr.layers import (
-    ImageMetaModel,
-    LoRAModule,
-    MetaModel,
-    WrapperImageModel,
-    WrapperMetaModel,
-)
-from .layers.assimilator_decoder import AssimilatorDecoder
-from .layers.assimilator_encoder import AssimilatorEncoder
-from .layers.decoder import Decoder
-from .layers.encoder import Encoder
-from .layers.processor import Processor
+"""Models
+
+The public names are imported lazily on first access, see graph_weather/_lazy.py.
+"""
+
+from graph_weather._lazy import lazy_imports
+
+_LAZY_IMPORTS = {
+    "ImageMetaModel": ".fengwu_ghr.layers",
+    "LoRAModule": ".fengwu_ghr.layers",
+    "MetaModel": ".fengwu_ghr.layers",
+    "WrapperImageModel": ".fengwu_ghr.layers",
+    "WrapperMetaModel": ".fengwu_ghr.layers",
+    "AssimilatorDecoder": ".layers.assimilator_decoder",
+    "AssimilatorEncoder": ".layers.assimilator_encoder",
+    "Decoder": ".layers.decoder",
+    "Encoder": ".layers.encoder",
+    "Processor": ".layers.processor",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+__getattr__, __dir__ = lazy_imports(__name__, _LAZY_IMPORTS)
@@ -2,8 +2,10 @@
 
 import torch
 from huggingface_hub import PyTorchModelHubMixin
+from torch_geometric.utils import k_hop_subgraph
 
 from graph_weather.models import AssimilatorDecoder, AssimilatorEncoder, Processor
+from graph_weather.models.layers.assimilator_encoder import build_input_graph
 
 
 class GraphWeatherAssimilator(torch.nn.Module, PyTorchModelHubMixin):
@@ -90,18 +92,166 @@ class GraphWeatherAssimilator(torch.nn.Module, PyTorchModelHubMixin):
             use_checkpointing=use_checkpointing,
         )
 
-    def forward(self, features: torch.Tensor, obs_lat_lon_heights: torch.Tensor) -> torch.Tensor:
+    def forward(
+        self,
+        features: torch.Tensor,
+        obs_lat_lon_heights: torch.Tensor,
+        mask: torch.Tensor = None,
+        cell_index: torch.Tensor = None,
+    ) -> torch.Tensor:
         """
         Compute the analysis output
 
         Args:
             features: The input features, aligned with the order of lat_lons_heights
             obs_lat_lon_heights: Observation lat/lon/heights in same order as features
+            mask: Optional boolean tensor, false for the padding observations, e.g. the "mask" of
+                the windows of graph_weather.data.observations.ObservationBucketer
+            cell_index: Optional precomputed H3 cells of the observations, e.g. the "cell_index" of
+                the same windows, computed from obs_lat_lon_heights if not given
 
         Returns:
             The next state in the forecast
         """
-        x, edge_idx, edge_attr = self.encoder(features, obs_lat_lon_heights)
+        x, edge_idx, edge_attr = self.encoder(features, obs_lat_lon_heights, mask, cell_index)
         x = self.processor(x, edge_idx, edge_attr)
         x = self.decoder(x, features.shape[0])
         return x
+
+
+class IncrementalAssimilator:
+    """
+    Incremental analysis of a stream of observations with a GraphWeatherAssimilator
+
+    The encoder sums the messages of the observations of every H3 cell, hence the encoded H3 nodes
+    are updated exactly by adding the messages of the new observations to the sums of their cells,
+    and only the cells which received observations are re-encoded. The processor is then re-run on
+    the whole latent graph, or, if k_hops is given, only on the k-hop neighborhood of the changed
+    cells. The latter is an approximation, the processor propagates information over num_blocks
+    hops. The decoder only recomputes the output points connected to re-processed H3 nodes.
+
+    Only a batch size of 1 is supported, and the model is used in inference mode.
+    """
+
+    def __init__(self, model: GraphWeatherAssimilator, k_hops: int = None):
+        """
+        Incremental assimilation
+
+        Args:
+            model: Assimilation model
+            k_hops: Number of hops around the changed cells re-processed at every update,
+                None re-runs the processor on the whole latent graph
+        """
+        self.model = model
+        self.k_hops = k_hops
+        self.reset()
+
+    def reset(self):
+        """Forget the assimilated observations"""
+        self._messages = None
+        self._encoded = None
+        self._processed = None
+        self.analysis = None
+        # H3 nodes which received observations and were re-processed at the last update
+        self.changed_nodes = None
+        self.updated_nodes = None
+
+    def _init_state(self, device):
+        encoder, decoder = self.model.encoder, self.model.decoder
+        self._h3_node = encoder.node_encoder(encoder.h3_nodes[:1].to(device))
+        latent_graph = encoder.latent_graph.to(device)
+        self._latent_edge_index = latent_graph.edge_index
+        self._latent_edge_attr = encoder.latent_edge_encoder(latent_graph.edge_attr)
+        decoder_graph = decoder.graph.to(device)
+        self._decoder_edge_index = decoder_graph.edge_index
+        self._decoder_edge_attr = decoder.edge_encoder(decoder_graph.edge_attr)
+        # rows of the analysis of the lat/lon nodes, which a reordered decoder permutes
+        self._point_rows = torch.argsort(decoder.output_order.to(device))
+        num_h3 = encoder.h3_nodes.shape[0]
+        edge_dim = self._latent_edge_attr.shape[-1]
+        self._messages = torch.zeros((num_h3, edge_dim), device=device)
+
+    def _encode_nodes(self, nodes: torch.Tensor):
+        # Node update of the encoder for the given H3 nodes, from the sums of their messages
+        node_mlp = self.model.encoder.graph_processor.blocks[0].node_model.node_mlp
+        x = self._h3_node.expand(len(nodes), -1)
+        self._encoded[nodes] = node_mlp(torch.cat([x, self._messages[nodes]], dim=-1)) + x
+
+    def _decode_points(self, nodes: torch.Tensor):
+        # Decoder for the output points connected to the given H3 nodes
+        decoder = self.model.decoder
+        sources, targets = self._decoder_edge_index
+        points = torch.unique(targets[torch.isin(sources, nodes)])
+        edge_mask = torch.isin(targets, points)
+        local_targets = torch.searchsorted(points, targets[edge_mask])
+        block = decoder.graph_processor.blocks[0]
+        x = decoder.latlon_nodes.to(points.device)[points - decoder.num_h3]
+        messages = block.edge_model(
+            self._processed[sources[edge_mask]],
+            x[local_targets],
+            self._decoder_edge_attr[edge_mask],
+        )
+        aggregated = torch.zeros((len(points), messages.shape[-1]), device=messages.device)
+        aggregated.index_add_(0, local_targets, messages)
+        out = block.node_model.node_mlp(torch.cat([x, aggregated], dim=-1)) + x
+        self.analysis[self._point_rows[points - decoder.num_h3]] = decoder.node_decoder(out)
+
+    @torch.no_grad()
+    def update(self, features: torch.Tensor, obs_lat_lon_heights: torch.Tensor) -> torch.Tensor:
+        """
+        Assimilate new observations and return the updated analysis
+
+        Args:
+            features: The new observation features, in [1, N, F] or [N, F] format
+            obs_lat_lon_heights: Observation lat/lon/heights in same order as features, in [N, 3]
+                format
+
+        Returns:
+            The analysis of all the observations assimilated so far, in [1, Points, F] format
+        """
+        encoder, processor, decoder = self.model.encoder, self.model.processor, self.model.decoder
+        features = features.reshape(-1, features.shape[-1])
+        first_update = self._messages is None
+        if first_update:
+            self._init_state(features.device)
+
+        # Encoder messages of the new observations, added to the sums of their cells
+        num_points = features.shape[0]
+        graph = build_input_graph(obs_lat_lon_heights.cpu().numpy(), encoder.resolution)
+        nodes = graph.edge_index[1].to(features.device) - num_points
+        messages = encoder.graph_processor.blocks[0].edge_model(
+            encoder.node_encoder(features),
+            self._h3_node.expand(num_points, -1),
+            encoder.edge_encoder(graph.edge_attr.to(features.device)),
+        )
+        self._messages.index_add_(0, nodes, messages)
+        self.changed_nodes = torch.unique(nodes)
+
+        if first_update:
+            # the cells without observations are encoded once
+            all_nodes = torch.arange(self._messages.shape[0], device=features.device)
+            self._encoded = self._h3_node.expand(len(all_nodes), -1).clone()
+            self._encode_nodes(all_nodes)
+        else:
+            self._encode_nodes(self.changed_nodes)
+
+        if first_update or self.k_hops is None:
+            self._processed = processor(
+                self._encoded, self._latent_edge_index, self._latent_edge_attr
+            )
+            self.updated_nodes = None
+            self.analysis = decoder(self._processed, 1)[0]
+        else:
+            subset, edge_index, _, edge_mask = k_hop_subgraph(
+                self.changed_nodes,
+                self.k_hops,
+                self._latent_edge_index,
+                relabel_nodes=True,
+                num_nodes=self._encoded.shape[0],
+            )
+            self._processed[subset] = processor(
+                self._encoded[subset], edge_index, self._latent_edge_attr[edge_mask]
+            )
+            self.updated_nodes = subset
+            self._decode_points(subset)
+        return self.analysis[None]
@@ -31,6 +31,77 @@ def knn_interpolate(
     return y
 
 
+def knn_interpolation_weights(
+    pos_x: torch.Tensor, pos_y: torch.Tensor, k: int = 4, num_workers: int = 1
+) -> torch.Tensor:
+    """
+    Compute the weights of knn_interpolate from pos_x to pos_y as a sparse matrix.
+
+    knn_interpolate(x, pos_x, pos_y, k) is weights @ x: every row holds the normalized inverse
+    squared distances to the k nearest neighbors of a point of pos_y.
+
+    Returns:
+        Sparse COO tensor with shape [len(pos_y), len(pos_x)].
+    """
+    with torch.no_grad():
+        assign_index = knn(pos_x, pos_y, k, num_workers=num_workers)
+        y_idx, x_idx = assign_index[0], assign_index[1]
+        diff = pos_x[x_idx] - pos_y[y_idx]
+        squared_distance = (diff * diff).sum(dim=-1)
+        weights = 1.0 / torch.clamp(squared_distance, min=1e-16)
+        den = scatter(weights, y_idx, 0, pos_y.size(0), reduce="sum")
+        weights = weights / den[y_idx]
+    return torch.sparse_coo_tensor(
+        torch.stack([y_idx, x_idx]), weights, (pos_y.size(0), pos_x.size(0))
+    ).coalesce()
+
+
+class KNNInterpolator(nn.Module):
+    """
+    k-NN interpolation between fixed positions, precomputed once.
+
+    The weights of knn_interpolate are computed at construction and kept as a sparse buffer, hence
+    the interpolation is a sparse-dense matrix product. The buffer is not persistent, the state
+    dict is unchanged. It is converted to CSR once per device and dtype.
+    """
+
+    def __init__(self, pos_x: torch.Tensor, pos_y: torch.Tensor, k: int = 4):
+        """
+        Precompute the interpolation weights.
+
+        Args:
+            pos_x: Source positions, with shape [num_x, 2].
+            pos_y: Target positions, with shape [num_y, 2].
+            k: Number of nearest neighbors.
+        """
+        super().__init__()
+        self.register_buffer(
+            "weights", knn_interpolation_weights(pos_x, pos_y, k), persistent=False
+        )
+        self._csr = {}
+
+    def __getstate__(self):
+        # the CSR tensors can not be copied, they are rebuilt on demand
+        state = self.__dict__.copy()
+        state["_csr"] = {}
+        return state
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """
+        Interpolate the features from pos_x to pos_y.
+
+        Args:
+            x: Features at pos_x, with shape [num_x, channels].
+
+        Returns:
+            Features at pos_y, with shape [num_y, channels].
+        """
+        key = (str(x.device), x.dtype)
+        if key not in self._csr:
+            self._csr[key] = self.weights.to(x.device, x.dtype).to_sparse_csr()
+        return self._csr[key] @ x
+
+
 def posemb_sincos_2d(h, w, dim, temperature: int = 10000, dtype=torch.float32):
     y, x = torch.meshgrid(torch.arange(h), torch.arange(w), indexing="ij")
     assert (dim % 4) == 0, "feature dimension must be multiple of 4 for sincos emb"
@@ -293,17 +364,19 @@ class MetaModel(nn.Module):
             channels=channels,
             dim_head=dim_head,
         )
+        self.to_image = KNNInterpolator(self.pos_x, self.pos_y)
+        self.to_points = KNNInterpolator(self.pos_y, self.pos_x)
 
     def forward(self, x):
         b, n, c = x.shape
 
         x = rearrange(x, "b n c -> n (b c)")
-        x = knn_interpolate(x, self.pos_x, self.pos_y)
+        x = self.to_image(x)
         x = rearrange(x, "(h w) (b c) -> b c h w", b=b, c=c, h=self.i_h, w=self.i_w)
         x = self.image_meta_model(x)
 
         x = rearrange(x, "b c h w -> (h w) (b c)")
-        x = knn_interpolate(x, self.pos_y, self.pos_x)
+        x = self.to_points(x)
         x = rearrange(x, "n (b c) -> b n c", b=b, c=c)
         return x
 
@@ -329,12 +402,14 @@ class WrapperMetaModel(nn.Module):
         )
 
         self.debatcher = Rearrange("(b s_h s_w) c h w -> b c (h s_h) (w s_w)", s_h=s_h, s_w=s_w)
+        self.to_image = KNNInterpolator(self.pos_x, self.pos_y)
+        self.to_points = KNNInterpolator(self.pos_y, self.pos_x)
 
     def forward(self, x):
         b, n, c = x.shape
 
         x = rearrange(x, "b n c -> n (b c)")
-        x = knn_interpolate(x, self.pos_x, self.pos_y)
+        x = self.to_image(x)
         x = rearrange(x, "(h w) (b c) -> b c h w", b=b, c=c, h=self.i_h, w=self.i_w)
 
         x = self.batcher(x)
@@ -342,7 +417,7 @@ class WrapperMetaModel(nn.Module):
         x = self.debatcher(x)
 
         x = rearrange(x, "b c h w -> (h w) (b c)")
-        x = knn_interpolate(x, self.pos_y, self.pos_x)
+        x = self.to_points(x)
         x = rearrange(x, "n (b c) -> b n c", b=b, c=c)
 
         return x
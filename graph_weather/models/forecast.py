@@ -33,6 +33,10 @@ class GraphWeatherForecaster(torch.nn.Module, PyTorchModelHubMixin):
         # New constraint parameters
         constraint_type: str = "additive",  # "additive", "multiplicative", or "softmax"
         apply_constraints: bool = True,
+        regional: bool = False,
+        halo: int = 1,
+        multi_mesh_levels: int = 0,
+        reorder: bool = False,
     ):
         """
         Graph Weather Model based off https://arxiv.org/pdf/2202.07575.pdf
@@ -57,6 +61,13 @@ class GraphWeatherForecaster(torch.nn.Module, PyTorchModelHubMixin):
             norm_type: Type of norm for the MLPs
                 one of 'LayerNorm', 'GraphNorm', 'InstanceNorm', 'BatchNorm', 'MessageNorm', or None
             use_checkpointing: Use gradient checkpointing to reduce model memory
+            regional: Limited-area mode, the latent graph only covers the cells of lat_lons and
+                halo rings of boundary cells, see Encoder
+            halo: Number of rings of boundary cells, in regional mode
+            multi_mesh_levels: Number of coarser H3 resolutions whose edges are added to the
+                latent graph of the processor, as in the multi-mesh of GraphCast
+            reorder: Sort the lat/lon nodes along the H3 order and the edges by receiver then
+                sender, for memory locality. The inputs and outputs keep the order of lat_lons
         """
         super().__init__()
         self.feature_dim = feature_dim
@@ -82,6 +93,10 @@ class GraphWeatherForecaster(torch.nn.Module, PyTorchModelHubMixin):
             hidden_layers_processor_edge=hidden_layers_processor_edge,
             mlp_norm_type=norm_type,
             use_checkpointing=use_checkpointing,
+            regional=regional,
+            halo=halo,
+            multi_mesh_levels=multi_mesh_levels,
+            reorder=reorder,
         )
         self.processor = Processor(
             input_dim=node_dim,
@@ -107,6 +122,9 @@ class GraphWeatherForecaster(torch.nn.Module, PyTorchModelHubMixin):
             hidden_dim_decoder=hidden_dim_decoder,
             hidden_layers_decoder=hidden_layers_decoder,
             use_checkpointing=use_checkpointing,
+            regional=regional,
+            halo=halo,
+            reorder=reorder,
         )
 
         # Add physical constraint layer
@@ -114,17 +132,21 @@ class GraphWeatherForecaster(torch.nn.Module, PyTorchModelHubMixin):
             grid_shape=self.grid_shape,
             constraint_type=constraint_type)
 
-    def forward(self, features: torch.Tensor) -> torch.Tensor:
+    def forward(
+        self, features: torch.Tensor, boundary: Optional[torch.Tensor] = None
+    ) -> torch.Tensor:
         """
         Compute the new state of the forecast
 
         Args:
             features: The input features, aligned with the order of lat_lons_heights
+            boundary: Optional boundary forcing in regional mode, the input features at the
+                encoder.boundary_lat_lons in shape [B, num_boundary, feature_dim + aux_dim]
 
         Returns:
             The next state in the forecast
         """
-        x, edge_idx, edge_attr = self.encoder(features)
+        x, edge_idx, edge_attr = self.encoder(features, boundary)
         x = self.processor(x, edge_idx, edge_attr)
         x = self.decoder(x, features[..., : self.feature_dim])
         # Here, assume decoder output x is a 4D tensor, e.g. [B, output_dim, H, W] where H and W are grid dimensions.
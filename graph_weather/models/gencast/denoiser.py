@@ -15,8 +15,9 @@ from huggingface_hub import PyTorchModelHubMixin
 from graph_weather.models.gencast.graph.graph_builder import GraphBuilder
 from graph_weather.models.gencast.layers.decoder import Decoder
 from graph_weather.models.gencast.layers.encoder import Encoder
+from graph_weather.models.gencast.layers.padded_attention import build_neighbour_table
 from graph_weather.models.gencast.layers.processor import Processor
-from graph_weather.models.gencast.utils.batching import batch, hetero_batch
+from graph_weather.models.gencast.utils.batching import batch, hetero_batch, padded_batch
 from graph_weather.models.gencast.utils.noise import Preconditioner
 
 
@@ -38,6 +39,7 @@ class Denoiser(torch.nn.Module, PyTorchModelHubMixin):
         sparse: bool = False,
         use_edges_features: bool = True,
         scale_factor: float = 1.0,
+        padded: bool = False,
     ):
         """Initialize the Denoiser.
 
@@ -63,6 +65,9 @@ class Denoiser(torch.nn.Module, PyTorchModelHubMixin):
             scale_factor (float):  in the Encoder the message passing output is multiplied by the
                 scale factor. This is important when you want to fine-tune a pretrained model to a
                 higher resolution. Defaults to 1.
+            padded (bool): if true the processor will apply attention on a padded table of the
+                k-hop neighbours, built once at initialization. The weights are interchangeable
+                with the default backend. Defaults to False.
         """
         super().__init__()
         self.num_lon = len(grid_lon)
@@ -70,6 +75,7 @@ class Denoiser(torch.nn.Module, PyTorchModelHubMixin):
         self.input_features_dim = input_features_dim
         self.output_features_dim = output_features_dim
         self.use_edges_features = use_edges_features
+        self.padded = padded
 
         # Initialize graph
         self.graphs = GraphBuilder(
@@ -97,6 +103,8 @@ class Denoiser(torch.nn.Module, PyTorchModelHubMixin):
         # Initialize Processor
         if sparse and use_edges_features:
             raise ValueError("Sparse processor don't support edges features.")
+        if sparse and padded:
+            raise ValueError("The sparse and padded processors can't be used together.")
 
         self.processor = Processor(
             latent_dim=hidden_dims[-1],
@@ -110,6 +118,7 @@ class Denoiser(torch.nn.Module, PyTorchModelHubMixin):
             activation_layer=torch.nn.SiLU,
             use_layer_norm=True,
             sparse=sparse,
+            padded=padded,
         )
 
         # Initialize Decoder
@@ -211,17 +220,25 @@ class Denoiser(torch.nn.Module, PyTorchModelHubMixin):
         # build big graph with batch_size disconnected copies of the graph, with features [(b n) f].
         batch_size = latent_mesh_nodes.shape[0]
         num_nodes = latent_mesh_nodes.shape[1]
-        _, batched_edge_index, batched_edge_attr = batch(
-            self.khop_mesh_nodes,
-            self.khop_mesh_edge_index,
-            self.khop_mesh_edge_attr if self.use_edges_features else None,
-            batch_size,
-        )
+        if self.padded:
+            # the padded edges features are shared by all the copies of the graph.
+            edge_index, neighbours_mask = padded_batch(
+                self.khop_mesh_neighbours, self.khop_mesh_neighbours_mask, batch_size
+            )
+            input_edge_attr = self.khop_mesh_padded_edge_attr if self.use_edges_features else None
+        else:
+            _, batched_edge_index, batched_edge_attr = batch(
+                self.khop_mesh_nodes,
+                self.khop_mesh_edge_index,
+                self.khop_mesh_edge_attr if self.use_edges_features else None,
+                batch_size,
+            )
+            input_edge_attr = batched_edge_attr
+            edge_index = batched_edge_index
+            neighbours_mask = None
 
         # load features.
         latent_mesh_nodes = einops.rearrange(latent_mesh_nodes, "b n f -> (b n) f")
-        input_edge_attr = batched_edge_attr
-        edge_index = batched_edge_index
 
         # repeat noise levels for each node.
         noise_levels = einops.repeat(noise_levels, "b f -> (b n) f", n=num_nodes)
@@ -232,6 +249,7 @@ class Denoiser(torch.nn.Module, PyTorchModelHubMixin):
             input_edge_attr=input_edge_attr,
             edge_index=edge_index,
             noise_levels=noise_levels,
+            neighbours_mask=neighbours_mask,
         )
 
         # restore nodes dimension: [b, n, f]
@@ -329,6 +347,19 @@ class Denoiser(torch.nn.Module, PyTorchModelHubMixin):
             "khop_mesh_edge_index", self.graphs.khop_mesh_graph.edge_index, persistent=False
         )
 
+        if self.padded:
+            neighbours, edge_ids, mask = build_neighbour_table(
+                self.graphs.khop_mesh_graph.edge_index, self.graphs.khop_mesh_graph.x.shape[0]
+            )
+            self.register_buffer("khop_mesh_neighbours", neighbours, persistent=False)
+            self.register_buffer("khop_mesh_neighbours_mask", mask, persistent=False)
+            if self.use_edges_features:
+                self.register_buffer(
+                    "khop_mesh_padded_edge_attr",
+                    self.graphs.khop_mesh_graph.edge_attr[edge_ids],
+                    persistent=False,
+                )
+
         self.register_buffer(
             "m2g_grid_nodes", self.graphs.m2g_graph["grid_nodes"].x, persistent=False
         )
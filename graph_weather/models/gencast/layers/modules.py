@@ -7,6 +7,8 @@ import torch.nn as nn
 from torch_geometric.nn import MessagePassing
 from torch_geometric.nn.conv import TransformerConv
 
+from graph_weather.models.gencast.layers.padded_attention import PaddedTransformerConv
+
 
 class MLP(nn.Module):
     """Classic multi-layer perceptron (MLP) module."""
@@ -274,6 +276,7 @@ class CondTransformerBlock(nn.Module):
         concat: bool = True,
         beta: bool = True,
         activation_layer: torch.nn.Module | None = nn.ReLU,
+        padded: bool = False,
     ):
         """Initialize Conditional Layer Normalization module.
 
@@ -291,11 +294,16 @@ class CondTransformerBlock(nn.Module):
             beta (bool): if true apply the beta weighting described in the paper. Defauls to True.
             activation_layer (torch.nn.Module, optional): activation function applied before
                 returning the output. If None skip the activation function. Defaults to nn.ReLU.
+            padded (bool): if true use PaddedTransformerConv, which works on a padded neighbours
+                table instead of an edge index. The weights of the two backends are
+                interchangeable. Defaults to False.
         """
         super().__init__()
 
         # Initialize layers
-        self.transformer_conv = TransformerConv(
+        self.padded = padded
+        transformer_conv_cls = PaddedTransformerConv if padded else TransformerConv
+        self.transformer_conv = transformer_conv_cls(
             in_channels=input_dim,
             out_channels=output_dim,
             heads=num_heads,
@@ -320,6 +328,7 @@ class CondTransformerBlock(nn.Module):
         edge_index: torch.Tensor,
         edge_attr: torch.Tensor | None = None,
         cond_param: torch.Tensor | None = None,
+        neighbours_mask: torch.Tensor | None = None,
     ) -> torch.Tensor:
         """Apply CondTransformerBlock to input.
 
@@ -327,12 +336,23 @@ class CondTransformerBlock(nn.Module):
 
         Args:
             x (torch.Tensor): tensor containing nodes features.
-            edge_index (torch.Tensor): edge index tensor.
-            edge_attr (torch.Tensor, optional): tensor containing edges features.
+            edge_index (torch.Tensor): edge index tensor, or padded neighbours table of shape
+                [N, K] if the block is padded.
+            edge_attr (torch.Tensor, optional): tensor containing edges features. If the block is
+                padded, the features must be padded as well, with shape [N, K, edges_dim].
             cond_param (torch.Tensor, optional): conditioning parameter.
+            neighbours_mask (torch.Tensor, optional): mask of the padded neighbours table. Required
+                if the block is padded.
 
         """
-        x = self.transformer_conv(x=x, edge_index=edge_index, edge_attr=edge_attr)
+        if self.padded:
+            if neighbours_mask is None:
+                raise ValueError("A padded CondTransformerBlock requires the neighbours mask.")
+            x = self.transformer_conv(
+                x=x, neighbours=edge_index, mask=neighbours_mask, edge_attr=edge_attr
+            )
+        else:
+            x = self.transformer_conv(x=x, edge_index=edge_index, edge_attr=edge_attr)
 
         if self.cond_norm is not None:
             x = self.cond_norm(x, cond_param)
@@ -0,0 +1,182 @@
+"""Fixed-degree padded neighbourhood attention.
+
+The k-hop icosahedral mesh has an almost constant number of neighbours per node, hence graph
+attention can be computed on a dense [N, K] table of neighbours, padded to the maximum degree and
+masked, instead of scattering messages edge by edge. Gathering keys and values into a
+[N, H, K, C] tensor and calling torch's fused scaled-dot-product attention gives a much better
+memory locality than PyG's TransformerConv, especially on CPU.
+"""
+
+import math
+
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+
+def build_neighbour_table(
+    edge_index: torch.Tensor, num_nodes: int
+) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Build the padded neighbours table of a graph.
+
+    Messages flow from edge_index[0] (senders) to edge_index[1] (receivers), as in PyG's
+    "source_to_target" flow, so each row of the table contains the senders of a receiver.
+
+    Args:
+        edge_index (torch.Tensor): edge index tensor of shape [2, E].
+        num_nodes (int): number of nodes in the graph.
+
+    Returns:
+        neighbours (torch.Tensor): senders of each node, shape [N, K] where K is the max degree.
+            Padded entries point to node 0.
+        edge_ids (torch.Tensor): position in edge_index of each entry, shape [N, K]. Padded entries
+            point to edge 0.
+        mask (torch.Tensor): boolean mask of shape [N, K], false for padded entries.
+    """
+    senders, receivers = edge_index[0], edge_index[1]
+    device = edge_index.device
+
+    # sort edges by receiver, keeping the original order among edges of the same receiver.
+    order = torch.argsort(receivers, stable=True)
+    sorted_receivers = receivers[order]
+
+    degree = torch.bincount(receivers, minlength=num_nodes)
+    max_degree = int(degree.max()) if degree.numel() > 0 else 0
+    ptr = torch.cumsum(degree, dim=0) - degree
+
+    # slot of each edge inside the row of its receiver.
+    slots = torch.arange(order.shape[0], device=device) - ptr[sorted_receivers]
+
+    neighbours = torch.zeros((num_nodes, max_degree), dtype=torch.long, device=device)
+    edge_ids = torch.zeros((num_nodes, max_degree), dtype=torch.long, device=device)
+    mask = torch.zeros((num_nodes, max_degree), dtype=torch.bool, device=device)
+    neighbours[sorted_receivers, slots] = senders[order]
+    edge_ids[sorted_receivers, slots] = order
+    mask[sorted_receivers, slots] = True
+    return neighbours, edge_ids, mask
+
+
+class PaddedTransformerConv(nn.Module):
+    """Dense re-implementation of PyG's TransformerConv on a padded neighbours table.
+
+    The module has the same parameters (and parameters' names) as
+    torch_geometric.nn.conv.TransformerConv and computes the same function, therefore the weights
+    of the two modules are interchangeable. Dropout on the attention coefficients is not supported.
+    """
+
+    def __init__(
+        self,
+        in_channels: int,
+        out_channels: int,
+        heads: int = 1,
+        concat: bool = True,
+        beta: bool = False,
+        edge_dim: int | None = None,
+        bias: bool = True,
+        root_weight: bool = True,
+    ):
+        """Initialize the PaddedTransformerConv.
+
+        Args:
+            in_channels (int): dimension of the input features.
+            out_channels (int): dimension of the output features of each head.
+            heads (int): number of heads for multi-head attention. Defaults to 1.
+            concat (bool): if true concatenate the outputs of each head, otherwise average them.
+                Defaults to True.
+            beta (bool): if true combine the skip connection with the attention output using the
+                learned gate described in the paper. Defaults to False.
+            edge_dim (int, optional): dimension of the edges features. If None edges features are
+                not used. Defaults to None.
+            bias (bool): if true use bias in the linear layers. Defaults to True.
+            root_weight (bool): if true add the transformed root node features to the output.
+                Defaults to True.
+        """
+        super().__init__()
+        self.in_channels = in_channels
+        self.out_channels = out_channels
+        self.heads = heads
+        self.beta = beta and root_weight
+        self.root_weight = root_weight
+        self.concat = concat
+        self.edge_dim = edge_dim
+
+        self.lin_key = nn.Linear(in_channels, heads * out_channels, bias=bias)
+        self.lin_query = nn.Linear(in_channels, heads * out_channels, bias=bias)
+        self.lin_value = nn.Linear(in_channels, heads * out_channels, bias=bias)
+        if edge_dim is not None:
+            self.lin_edge = nn.Linear(edge_dim, heads * out_channels, bias=False)
+        else:
+            self.register_parameter("lin_edge", None)
+
+        final_dim = heads * out_channels if concat else out_channels
+        if root_weight:
+            self.lin_skip = nn.Linear(in_channels, final_dim, bias=bias)
+        else:
+            self.register_parameter("lin_skip", None)
+        if self.beta:
+            self.lin_beta = nn.Linear(3 * final_dim, 1, bias=False)
+        else:
+            self.register_parameter("lin_beta", None)
+
+    def forward(
+        self,
+        x: torch.Tensor,
+        neighbours: torch.Tensor,
+        mask: torch.Tensor,
+        edge_attr: torch.Tensor | None = None,
+    ) -> torch.Tensor:
+        """Apply the attention to the padded neighbourhoods.
+
+        Args:
+            x (torch.Tensor): nodes' features, shape [N, in_channels].
+            neighbours (torch.Tensor): padded neighbours table, shape [N, K].
+            mask (torch.Tensor): boolean mask of the neighbours table, shape [N, K].
+            edge_attr (torch.Tensor, optional): padded edges' features of shape [M, K, edge_dim].
+                M can be a divisor of N: in that case the features are shared by the N // M
+                disconnected copies of the graph stacked in x.
+
+        Returns:
+            torch.Tensor: updated nodes' features.
+        """
+        H, C = self.heads, self.out_channels
+        num_nodes, num_neighbours = neighbours.shape
+
+        query = self.lin_query(x).view(num_nodes, H, 1, C)
+        key = self.lin_key(x)[neighbours]
+        value = self.lin_value(x)[neighbours]
+
+        if self.lin_edge is not None:
+            if edge_attr is None:
+                raise ValueError("To use edges features initialize the module with edge_dim.")
+            edges_emb = self.lin_edge(edge_attr)
+            key = (key.view(-1, *edges_emb.shape) + edges_emb).view(num_nodes, num_neighbours, -1)
+            value = (value.view(-1, *edges_emb.shape) + edges_emb).view(
+                num_nodes, num_neighbours, -1
+            )
+
+        # [N, K, H*C] -> [N, H, K, C]
+        key = key.view(num_nodes, num_neighbours, H, C).transpose(1, 2)
+        value = value.view(num_nodes, num_neighbours, H, C).transpose(1, 2)
+
+        # nodes without neighbours would produce NaNs, let them attend the padding and zero them.
+        has_neighbours = mask.any(dim=-1)
+        attn_mask = (mask | ~has_neighbours[:, None])[:, None, None, :]
+
+        out = F.scaled_dot_product_attention(
+            query, key, value, attn_mask=attn_mask, scale=1 / math.sqrt(C)
+        )
+        out = out.view(num_nodes, H, C) * has_neighbours[:, None, None]
+
+        if self.concat:
+            out = out.reshape(num_nodes, H * C)
+        else:
+            out = out.mean(dim=1)
+
+        if self.root_weight:
+            x_r = self.lin_skip(x)
+            if self.lin_beta is not None:
+                beta = self.lin_beta(torch.cat([out, x_r, out - x_r], dim=-1)).sigmoid()
+                out = beta * x_r + (1 - beta) * out
+            else:
+                out = out + x_r
+        return out
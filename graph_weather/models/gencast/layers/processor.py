@@ -28,6 +28,11 @@ class Processor(torch.nn.Module):
     while the latter is a classical transformer that performs multi-head attention utilizing the
     mask's sparsity and does not include edge features in the computations.
 
+    Setting padded=True computes the same function as sparse=False, but the attention is applied
+    on a padded table of neighbours of shape [N, K] using torch's fused scaled-dot-product
+    attention. Since the k-hop mesh has an almost constant degree, this has a better memory
+    locality than the scatter-based TransformerConv.
+
     Note: The GenCast paper does not provide specific details regarding the implementation of the
     transformer architecture for graphs.
     """
@@ -45,6 +50,7 @@ class Processor(torch.nn.Module):
         activation_layer: torch.nn.Module = torch.nn.ReLU,
         use_layer_norm: bool = True,
         sparse: bool = False,
+        padded: bool = False,
     ):
         """Initialize the Processor.
 
@@ -63,11 +69,16 @@ class Processor(torch.nn.Module):
             use_layer_norm (bool): if true add a LayerNorm at the end of the embedding MLP.
                 Defaults to True.
             sparse (bool): if true use DGL as backend (experimental). Defaults to False.
+            padded (bool): if true use the padded neighbourhood attention backend. Defaults to
+                False.
         """
         super().__init__()
         self.latent_dim = latent_dim
         if latent_dim % num_heads != 0:
             raise ValueError("The latent dimension should be divisible by the number of heads.")
+        if sparse and padded:
+            raise ValueError("The sparse and padded backends can't be used together.")
+        self.padded = padded
 
         # Embedders
         self.fourier_embedder = FourierEmbedding(
@@ -100,6 +111,7 @@ class Processor(torch.nn.Module):
                         concat=True,
                         beta=True,
                         activation_layer=activation_layer,
+                        padded=padded,
                     )
                 )
 
@@ -114,6 +126,7 @@ class Processor(torch.nn.Module):
                     concat=False,
                     beta=True,
                     activation_layer=None,
+                    padded=padded,
                 )
             )
         else:
@@ -133,7 +146,7 @@ class Processor(torch.nn.Module):
                 )
                 # do we really need averaging for last block?
 
-    def _check_args(self, latent_mesh_nodes, noise_levels, input_edge_attr):
+    def _check_args(self, latent_mesh_nodes, noise_levels, input_edge_attr, neighbours_mask):
         if not latent_mesh_nodes.shape[-1] == self.latent_dim:
             raise ValueError(
                 "The dimension of the mesh nodes is different from the latent dimension provided at"
@@ -150,25 +163,34 @@ class Processor(torch.nn.Module):
         if (input_edge_attr is not None) and (self.edges_dim is None):
             raise ValueError("To use input_edge_attr initialize the processor with edges_dim.")
 
+        if self.padded and (neighbours_mask is None):
+            raise ValueError("The padded processor requires the neighbours mask.")
+
     def forward(
         self,
         latent_mesh_nodes: torch.Tensor,
         edge_index: torch.Tensor,
         noise_levels: torch.Tensor,
         input_edge_attr: torch.Tensor | None = None,
+        neighbours_mask: torch.Tensor | None = None,
     ) -> torch.Tensor:
         """Forward pass.
 
         Args:
             latent_mesh_nodes (torch.Tensor): mesh nodes' features.
-            edge_index (torch.Tensor): edge index tensor.
+            edge_index (torch.Tensor): edge index tensor, or padded neighbours table of shape
+                [N, K] if the processor is padded.
             noise_levels (torch.Tensor): log-noise levels.
-            input_edge_attr (torch.Tensor, optional): mesh edges' features.
+            input_edge_attr (torch.Tensor, optional): mesh edges' features. If the processor is
+                padded, the features must be padded as well, with shape [N, K, edges_dim] (or
+                [N // b, K, edges_dim] to share them across b copies of the graph).
+            neighbours_mask (torch.Tensor, optional): mask of the padded neighbours table. Required
+                if the processor is padded.
 
         Returns:
             torch.Tensor: latent mesh nodes.
         """
-        self._check_args(latent_mesh_nodes, noise_levels, input_edge_attr)
+        self._check_args(latent_mesh_nodes, noise_levels, input_edge_attr, neighbours_mask)
 
         # embedding
         noise_emb = self.fourier_embedder(noise_levels)
@@ -180,11 +202,20 @@ class Processor(torch.nn.Module):
 
         # apply transformer blocks
         for cond_transformer in self.cond_transformers:
-            latent_mesh_nodes = cond_transformer(
-                x=latent_mesh_nodes,
-                edge_index=edge_index,
-                cond_param=noise_emb,
-                edge_attr=edges_emb,
-            )
+            if self.padded:
+                latent_mesh_nodes = cond_transformer(
+                    x=latent_mesh_nodes,
+                    edge_index=edge_index,
+                    cond_param=noise_emb,
+                    edge_attr=edges_emb,
+                    neighbours_mask=neighbours_mask,
+                )
+            else:
+                latent_mesh_nodes = cond_transformer(
+                    x=latent_mesh_nodes,
+                    edge_index=edge_index,
+                    cond_param=noise_emb,
+                    edge_attr=edges_emb,
+                )
 
         return latent_mesh_nodes
@@ -17,6 +17,7 @@ from torch.utils.data import DataLoader  # noqa: E402
 
 from graph_weather.data.gencast_dataloader import GenCastDataset  # noqa: E402
 from graph_weather.models.gencast import Denoiser, Sampler, WeightedMSELoss  # noqa: E402
+from graph_weather.models.gencast.utils.noise import NoiseCorruption  # noqa: E402
 
 torch.set_float32_matmul_precision("high")
 
@@ -146,6 +147,16 @@ class LitModel(L.LightningModule):
             pressure_levels=torch.tensor(pressure_levels).to(self.device),
             num_atmospheric_features=len(atmospheric_features),
             single_features_weights=torch.tensor([1.0, 0.1, 0.1, 0.1, 0.1]).to(self.device),
+            # avoid a device synchronization at every training step.
+            check_nan=False,
+        )
+
+        # corrupt the targets on device, the dataset only returns clean inputs and residuals.
+        num_lon, num_lat = len(grid_lon), len(grid_lat)
+        self.noise_corruption = NoiseCorruption(
+            num_lon=num_lon,
+            num_lat=num_lat,
+            isotropic=(num_lon == 2 * num_lat) or (num_lon == 2 * (num_lat - 1)),
         )
 
         self.learning_rate = learning_rate
@@ -158,7 +169,11 @@ class LitModel(L.LightningModule):
 
     def training_step(self, batch):
         """Single training step"""
-        corrupted_targets, prev_inputs, noise_levels, target_residuals = batch
+        if len(batch) == 2:
+            prev_inputs, target_residuals = batch
+            corrupted_targets, noise_levels = self.noise_corruption(target_residuals)
+        else:
+            corrupted_targets, prev_inputs, noise_levels, target_residuals = batch
 
         preds = self.model(
             corrupted_targets=corrupted_targets,
@@ -223,7 +238,10 @@ class SamplingCallback(Callback):
 
     def __init__(self, data):
         """Initialize the callback"""
-        _, prev_inputs, _, target_residuals = data
+        if len(data) == 4:
+            _, prev_inputs, _, target_residuals = data
+        else:
+            prev_inputs, target_residuals = data
         self.prev_inputs = torch.tensor(prev_inputs).unsqueeze(0)
         self.target_residuals = torch.tensor(target_residuals).unsqueeze(0)
 
@@ -248,6 +266,7 @@ if __name__ == "__main__":
         static_features=static_features,
         max_year=2018,
         time_step=2,
+        corrupt=False,
     )
 
     dataloader = DataLoader(
@@ -67,3 +67,24 @@ def hetero_batch(senders, receivers, edge_index, edge_attr=None, batch_size=1):
             batched_edge_attr = torch.cat([batched_edge_attr, edge_attr], dim=0)
 
     return batched_senders, batched_receivers, batched_edge_index, batched_edge_attr
+
+
+def padded_batch(neighbours, mask, batch_size=1):
+    """Build big batched padded neighbours table.
+
+    Returns the padded neighbours table of a big graph with batch_size disconnected copies of the
+    original graph, with nodes ordered as [(b n)].
+
+    Args:
+        neighbours (torch.Tensor): padded neighbours table of shape [n, k].
+        mask (torch.Tensor): boolean mask of the neighbours table of shape [n, k].
+        batch_size (int): batch size. Defaults to 1.
+
+    Returns:
+        batched_neighbours, batched_mask
+    """
+    num_nodes = neighbours.shape[0]
+    offsets = torch.arange(batch_size, device=neighbours.device) * num_nodes
+    batched_neighbours = (neighbours[None] + offsets[:, None, None]).flatten(0, 1)
+    batched_mask = mask.repeat(batch_size, 1)
+    return batched_neighbours, batched_mask
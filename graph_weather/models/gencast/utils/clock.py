@@ -0,0 +1,79 @@
+"""Clock features utils."""
+
+import numpy as np
+import pandas as pd
+import torch
+
+
+class ClockFeatures:
+    """Sin/cos embeddings of the day of the year and of the local mean time.
+
+    The features only depend on the day of the year (366 values) and on the hour of the day (24
+    values, shifted by a longitude-dependent offset), hence they are precomputed once in two lookup
+    tables, and the features of a batch of timestamps are broadcast views of the looked-up rows.
+    The features are returned in the order [sin_day_of_year, cos_day_of_year, sin_local_mean_time,
+    cos_local_mean_time].
+    """
+
+    def __init__(self, grid_lon: np.ndarray, num_lat: int):
+        """Initialize the lookup tables.
+
+        Args:
+            grid_lon (np.ndarray): array of longitudes.
+            num_lat (int): number of latitudes in the grid.
+        """
+        self.num_lon = len(grid_lon)
+        self.num_lat = num_lat
+
+        # day of year is in [1, 366], the row 0 is unused.
+        day_of_year = np.arange(367)
+        self.day_of_year_table = np.stack(self._sin_cos_emb(day_of_year / 365.0), axis=-1).astype(
+            np.float32
+        )  # [367, 2]
+
+        # the local mean time is shifted by 4 minutes per degree of longitude.
+        hour_of_day = np.arange(24)
+        local_mean_time = hour_of_day[:, None] + np.asarray(grid_lon)[None, :] * 4 / 60.0
+        self.local_mean_time_table = np.stack(
+            self._sin_cos_emb(local_mean_time / 24.0), axis=-1
+        ).astype(np.float32)  # [24, lon, 2]
+
+    @staticmethod
+    def _sin_cos_emb(x):
+        return np.sin(2 * np.pi * x), np.cos(2 * np.pi * x)
+
+    def _lookup(self, times) -> np.ndarray:
+        times = pd.DatetimeIndex(np.atleast_1d(times))
+        day_of_year = self.day_of_year_table[times.dayofyear.values]  # [t, 2]
+        local_mean_time = self.local_mean_time_table[times.hour.values]  # [t, lon, 2]
+        day_of_year = np.broadcast_to(day_of_year[:, None, :], local_mean_time.shape)
+        return np.concatenate([day_of_year, local_mean_time], axis=-1)  # [t, lon, 4]
+
+    def __call__(self, times) -> np.ndarray:
+        """Return the clock features of the given timestamps.
+
+        Args:
+            times: array of datetime64 timestamps, with shape [t].
+
+        Returns:
+            np.ndarray: read-only broadcast view with shape [t, lon, lat, 4].
+        """
+        features = self._lookup(times)
+        return np.broadcast_to(
+            features[:, :, None, :], (len(features), self.num_lon, self.num_lat, 4)
+        )
+
+    def as_tensor(self, times, device: torch.device = None) -> torch.Tensor:
+        """Return the clock features of the given timestamps as a tensor, e.g. during rollouts.
+
+        Only the [t, lon, 4] features are moved to the device, then expanded over latitudes.
+
+        Args:
+            times: array of datetime64 timestamps, with shape [t].
+            device (torch.device, optional): device of the output. Defaults to None.
+
+        Returns:
+            torch.Tensor: expanded view with shape [t, lon, lat, 4].
+        """
+        features = torch.from_numpy(self._lookup(times)).to(device)
+        return features[:, :, None, :].expand(-1, -1, self.num_lat, -1)
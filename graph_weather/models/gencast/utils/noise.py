@@ -38,12 +38,13 @@ def generate_isotropic_noise(num_lon: int, num_lat: int, num_samples=1, isotropi
     if isotropic:
         lmax = num_lat - 1 if extend else num_lat
         mmax = lmax + 1
-        coeffs = torch.randn(num_samples, lmax, mmax, dtype=torch.complex64) / np.sqrt(
-            (num_lat**2) // 2
-        )
         isht = th.InverseRealSHT(
             nlat=num_lat, nlon=num_lon, lmax=lmax, mmax=mmax, grid="equiangular"
         )
+        # the transform may truncate lmax and mmax, depending on the torch_harmonics version.
+        coeffs = torch.randn(num_samples, isht.lmax, isht.mmax, dtype=torch.complex64) / np.sqrt(
+            (num_lat**2) // 2
+        )
         noise = isht(coeffs) * np.sqrt(2 * np.pi)
         noise = einops.rearrange(noise, "b lat lon -> lon lat b").numpy()
     else:
@@ -73,6 +74,113 @@ def sample_noise_level(sigma_min=0.02, sigma_max=88, rho=7):
     return noise_level
 
 
+class NoiseCorruption(torch.nn.Module):
+    """Batched corruption of target residuals, to be applied on the training device.
+
+    This module is the batched torch equivalent of sample_noise_level and generate_isotropic_noise:
+    for each sample of the batch it samples a noise level and corrupts the target residuals with
+    noise generated at that level. The spherical harmonics transform is built once, hence the
+    data workers only need to return clean residuals and inputs.
+    """
+
+    def __init__(
+        self,
+        num_lon: int,
+        num_lat: int,
+        isotropic: bool = True,
+        sigma_min: float = 0.02,
+        sigma_max: float = 88,
+        rho: float = 7,
+    ):
+        """Initialize the noise corruption.
+
+        Args:
+            num_lon (int): number of longitudes in the grid.
+            num_lat (int): number of latitudes in the grid.
+            isotropic (bool): if true generates isotropic noise, else flat noise. Defaults to True.
+            sigma_min (float, optional): Defaults to 0.02.
+            sigma_max (float, optional): Defaults to 88.
+            rho (float, optional): Defaults to 7.
+        """
+        super().__init__()
+        self.num_lon = num_lon
+        self.num_lat = num_lat
+        self.isotropic = isotropic
+        self.sigma_min = sigma_min
+        self.sigma_max = sigma_max
+        self.rho = rho
+
+        if isotropic:
+            if 2 * num_lat == num_lon:
+                lmax = num_lat
+            elif 2 * (num_lat - 1) == num_lon:
+                lmax = num_lat - 1
+            else:
+                raise ValueError(
+                    "Isotropic noise requires grid's shape to be 2N x N or 2N x (N+1): "
+                    f"got {num_lon} x {num_lat}. If the shape is correct, please specify "
+                    "isotropic=False in the constructor.",
+                )
+            self.isht = th.InverseRealSHT(
+                nlat=num_lat, nlon=num_lon, lmax=lmax, mmax=lmax + 1, grid="equiangular"
+            )
+
+    def sample_noise_levels(self, batch_size: int, device: torch.device = None) -> torch.Tensor:
+        """Sample a noise level for each sample of the batch.
+
+        Args:
+            batch_size (int): batch size.
+            device (torch.device, optional): device of the output. Defaults to None.
+
+        Returns:
+            torch.Tensor: noise levels with shape [batch, 1].
+        """
+        u = torch.rand((batch_size, 1), device=device)
+        return (
+            self.sigma_max ** (1 / self.rho)
+            + u * (self.sigma_min ** (1 / self.rho) - self.sigma_max ** (1 / self.rho))
+        ) ** self.rho
+
+    def generate_noise(
+        self, batch_size: int, num_samples: int, device: torch.device = None
+    ) -> torch.Tensor:
+        """Generate noise on the grid.
+
+        Args:
+            batch_size (int): batch size.
+            num_samples (int): number of indipendent samples per batch element.
+            device (torch.device, optional): device of the output. Defaults to None.
+
+        Returns:
+            torch.Tensor: noise with shape [batch, lon, lat, num_samples].
+        """
+        if self.isotropic:
+            coeffs = torch.randn(
+                (batch_size, num_samples, self.isht.lmax, self.isht.mmax),
+                dtype=torch.complex64,
+                device=device,
+            ) / np.sqrt((self.num_lat**2) // 2)
+            noise = self.isht(coeffs) * np.sqrt(2 * np.pi)
+            return einops.rearrange(noise, "b f lat lon -> b lon lat f")
+        return torch.randn((batch_size, self.num_lon, self.num_lat, num_samples), device=device)
+
+    def forward(self, target_residuals: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        """Corrupt the target residuals.
+
+        Args:
+            target_residuals (torch.Tensor): target residuals with shape [batch, lon, lat, var].
+
+        Returns:
+            corrupted_targets, noise_levels
+        """
+        batch_size, _, _, num_vars = target_residuals.shape
+        device = target_residuals.device
+        noise_levels = self.sample_noise_levels(batch_size, device=device)
+        noise = self.generate_noise(batch_size, num_vars, device=device)
+        corrupted_targets = target_residuals + noise_levels[:, :, None, None] * noise
+        return corrupted_targets.to(target_residuals.dtype), noise_levels
+
+
 class Preconditioner(torch.nn.Module):
     """Collection of preconditioning functions.
 
@@ -1,91 +1,284 @@
-"""Statistics computation utils."""
+"""
+Statistics computation utils.
+
+The means and stds of the features, and of their differences between timesteps t and t + time_step,
+are computed in a single streaming pass over the dataset: the time axis is split into chunks, the
+partial statistics of every chunk are computed independently (optionally in a process pool), and
+they are merged with the parallel algorithm of Chan et al. (1979). The results are exact, i.e. they
+match the statistics of the whole dataset loaded in memory, and they are written to a compact JSON
+file that the GenCast datasets load with the stats_path argument.
+
+The statistics are reduced over every dimension but "level", hence atmospheric features have one
+value per pressure level and single and static features have a scalar value. Static features, i.e.
+without a "time" dimension, have no difference statistics. As in the training datasets, NaNs are
+replaced by zeros.
+
+Usage:
+    python -m graph_weather.models.gencast.utils.statistics dataset.zarr stats.json \
+        --variables geopotential 2m_temperature land_sea_mask --num-workers 8
+"""
+
+import argparse
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
-import apache_beam  # noqa: F401
 import numpy as np
-import weatherbench2  # noqa: F401
 import xarray as xr
 
 
-def compute_statistics(dataset, vars, num_samples=100, single=False):
-    """Compute statistics for single timestep.
+class RunningStatistics:
+    """Count, mean and sum of squared deviations from the mean (M2) of a set of samples."""
+
+    def __init__(self, count: int = 0, mean=0.0, m2=0.0):
+        """Initialize the statistics.
+
+        Args:
+            count (int): number of samples. Defaults to 0.
+            mean: mean of the samples. Defaults to 0.0.
+            m2: sum of squared deviations from the mean. Defaults to 0.0.
+        """
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    @classmethod
+    def from_samples(cls, samples: np.ndarray, axis: tuple[int, ...]) -> "RunningStatistics":
+        """Compute the statistics of an array of samples.
+
+        Args:
+            samples (np.ndarray): array of samples.
+            axis (tuple[int, ...]): axes to reduce.
+
+        Returns:
+            RunningStatistics: statistics of the samples.
+        """
+        samples = np.asarray(samples, dtype=np.float64)
+        count = int(np.prod([samples.shape[a] for a in axis]))
+        if count == 0:
+            return cls()
+        mean = samples.mean(axis=axis)
+        m2 = np.square(samples - np.expand_dims(mean, axis)).sum(axis=axis)
+        return cls(count, mean, m2)
+
+    def merge(self, other: "RunningStatistics") -> "RunningStatistics":
+        """Merge the statistics of two disjoint sets of samples.
+
+        Args:
+            other (RunningStatistics): statistics of the other set.
+
+        Returns:
+            RunningStatistics: statistics of the union of the two sets.
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        mean = self.mean + delta * other.count / count
+        m2 = self.m2 + other.m2 + np.square(delta) * self.count * other.count / count
+        return RunningStatistics(count, mean, m2)
+
+    @property
+    def std(self):
+        """Population standard deviation of the samples."""
+        return np.sqrt(self.m2 / self.count)
+
+
+def open_dataset(path: str) -> xr.Dataset:
+    """Lazily open a local Zarr store or NetCDF file.
+
+    Args:
+        path (str): dataset path.
+
+    Returns:
+        xr.Dataset: the dataset.
+    """
+    if path.endswith((".nc", ".nc4", ".netcdf")):
+        return xr.open_dataset(path, chunks={})
+    return xr.open_zarr(path, chunks={})
+
+
+def _reduced_axes(array: xr.DataArray) -> tuple[int, ...]:
+    return tuple(i for i, dim in enumerate(array.dims) if dim != "level")
+
+
+def _chunk_statistics(
+    path: str, variables: list[str], start: int, stop: int, time_step: int, num_times: int
+) -> dict[str, tuple[RunningStatistics, RunningStatistics]]:
+    """Compute the partial statistics of the timesteps [start, stop).
+
+    The differences are computed between the timesteps t in [start, stop) and t + time_step, hence
+    the chunk is read with time_step additional timesteps.
+    """
+    ds = open_dataset(path)
+    read_stop = min(stop + time_step, num_times)
+    chunk_stats = {}
+    for var in variables:
+        array = ds[var]
+        if "time" not in array.dims:
+            continue
+        time_axis = array.dims.index("time")
+        axis = _reduced_axes(array)
+        values = np.nan_to_num(array.isel(time=slice(start, read_stop)).values)
+        num_diffs = max(read_stop - time_step - start, 0)
+
+        def time_slice(begin, end):
+            index = [slice(None)] * values.ndim
+            index[time_axis] = slice(begin, end)
+            return values[tuple(index)]
+
+        samples = time_slice(0, stop - start)
+        diffs = time_slice(time_step, time_step + num_diffs) - time_slice(0, num_diffs)
+        chunk_stats[var] = (
+            RunningStatistics.from_samples(samples, axis),
+            RunningStatistics.from_samples(diffs, axis),
+        )
+    return chunk_stats
+
+
+def _to_json(value):
+    value = np.asarray(value, dtype=np.float32)
+    return value.tolist() if value.ndim > 0 else float(value)
+
+
+def compute_statistics(
+    path: str,
+    variables: list[str] | None = None,
+    time_step: int = 2,
+    chunk_size: int = 64,
+    num_workers: int = 0,
+    max_year: int | None = None,
+) -> dict:
+    """Compute the means and stds of the features and of their time differences.
 
     Args:
-        dataset: xarray dataset.
-        vars: list of features.
-        num_samples (int, optional): _description_. Defaults to 100.
-        single (bool, optional): if the features have multiple pressure levels. Defaults to False.
+        path (str): path of a local Zarr store or NetCDF file.
+        variables (list[str], optional): features. Defaults to None, i.e. all the data variables.
+        time_step (int): number of timesteps between the start and the end of the differences.
+            E.g. 12h steps correspond to time_step = 2 in a 6h dataset. Defaults to 2.
+        chunk_size (int): number of timesteps per chunk. Defaults to 64.
+        num_workers (int): number of worker processes. Defaults to 0, i.e. the chunks are processed
+            in the main process.
+        max_year (int, optional): only use the timesteps before this year, e.g. to exclude the
+            validation and test years. Defaults to None, i.e. all the timesteps.
 
     Returns:
-        means: dict with the means.
-        stds: dict with the stds.
+        dict: with keys "means", "stds", "diff_means" and "diff_stds", each mapping the features to
+            float32 arrays, and the metadata "variables", "time_step" and "num_times".
+    """
+    ds = open_dataset(path)
+    if variables is None:
+        variables = list(ds.data_vars)
+    if max_year is None:
+        num_times = ds.sizes["time"]
+    else:
+        num_times = int(sum(ds["time.year"].values < max_year))
+    if num_times <= time_step:
+        raise ValueError(f"The dataset needs more than time_step={time_step} timesteps.")
+
+    stats = {}
+    for var in variables:
+        if "time" not in ds[var].dims:
+            # static features are small, they are loaded at once.
+            values = np.nan_to_num(ds[var].values)
+            stats[var] = (RunningStatistics.from_samples(values, _reduced_axes(ds[var])), None)
+        else:
+            stats[var] = (RunningStatistics(), RunningStatistics())
+
+    tasks = [
+        (path, variables, start, min(start + chunk_size, num_times), time_step, num_times)
+        for start in range(0, num_times, chunk_size)
+    ]
+    if num_workers > 0:
+        # forked workers can deadlock on the locks of the zarr/xarray I/O threads of the parent.
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=mp_context) as executor:
+            results = list(executor.map(_chunk_statistics, *zip(*tasks)))
+    else:
+        results = [_chunk_statistics(*task) for task in tasks]
+
+    # the merge is associative, the chunks are merged in order for reproducibility.
+    for chunk_stats in results:
+        for var, (value_stats, diff_stats) in chunk_stats.items():
+            stats[var] = (stats[var][0].merge(value_stats), stats[var][1].merge(diff_stats))
+
+    output = {
+        "variables": variables,
+        "time_step": time_step,
+        "num_times": num_times,
+        "means": {},
+        "stds": {},
+        "diff_means": {},
+        "diff_stds": {},
+    }
+    for var, (value_stats, diff_stats) in stats.items():
+        output["means"][var] = np.asarray(value_stats.mean, dtype=np.float32)
+        output["stds"][var] = np.asarray(value_stats.std, dtype=np.float32)
+        if diff_stats is not None:
+            output["diff_means"][var] = np.asarray(diff_stats.mean, dtype=np.float32)
+            output["diff_stds"][var] = np.asarray(diff_stats.std, dtype=np.float32)
+    return output
+
+
+def save_statistics(stats: dict, path: str):
+    """Write the output of compute_statistics to a JSON file.
+
+    Args:
+        stats (dict): statistics.
+        path (str): output path.
     """
-    means = {}
-    stds = {}
-    for var in vars:
-        print(f"Computing statistics for {var}")
-        random_indexes = np.random.randint(0, len(dataset.time), num_samples)
-        samples = data.isel(time=random_indexes)[var].values
-        samples = np.nan_to_num(samples)
-        axis_tuple = (0, 1, 2) if single else (0, 2, 3)
-        means[var] = samples.mean(axis=axis_tuple)
-        stds[var] = samples.std(axis=axis_tuple)
-    return means, stds
-
-
-def compute_statistics_diff(dataset, vars, num_samples=100, single=False, timestep=2):
-    """Compute statistics for difference of two timesteps.
+    serializable = {
+        key: (
+            {var: _to_json(value) for var, value in stats[key].items()}
+            if key in ("means", "stds", "diff_means", "diff_stds")
+            else stats[key]
+        )
+        for key in stats
+    }
+    with open(path, "w") as f:
+        json.dump(serializable, f)
+
+
+def load_statistics(path: str) -> dict:
+    """Read a statistics file written by save_statistics.
 
     Args:
-        dataset: xarray dataset.
-        vars: list of features.
-        num_samples (int, optional): _description_. Defaults to 100.
-        single (bool, optional): if the features have multiple pressure levels. Defaults to False.
-        timestep (int, optional): number of steps to consider between start and end. Defaults to 2.
+        path (str): statistics file path.
 
     Returns:
-        means: dict with the means.
-        stds: dict with the stds.
+        dict: same structure as the output of compute_statistics.
     """
-    means = {}
-    stds = {}
-    for var in vars:
-        print(f"Computing statistics for {var}")
-        random_indexes = np.random.randint(0, len(dataset.time), num_samples)
-        samples_start = data.isel(time=random_indexes)[var].values
-        samples_start = np.nan_to_num(samples_start)
-        samples_end = data.isel(time=random_indexes + timestep)[var].values
-        samples_end = np.nan_to_num(samples_end)
-        axis_tuple = (0, 1, 2) if single else (0, 2, 3)
-        means[var] = (samples_end - samples_start).mean(axis=axis_tuple)
-        stds[var] = (samples_end - samples_start).std(axis=axis_tuple)
-    return means, stds
-
-
-atmospheric_features = [
-    "geopotential",
-    "specific_humidity",
-    "temperature",
-    "u_component_of_wind",
-    "v_component_of_wind",
-    "vertical_velocity",
-]
-
-single_features = [
-    "2m_temperature",
-    "10m_u_component_of_wind",
-    "10m_v_component_of_wind",
-    "mean_sea_level_pressure",
-    # "sea_surface_temperature",
-    "total_precipitation_12hr",
-]
-
-static_features = ["geopotential_at_surface", "land_sea_mask"]
-
-obs_path = "gs://weatherbench2/datasets/era5/1959-2022-6h-64x32_equiangular_conservative.zarr"
-# obs_path = 'gs://weatherbench2/datasets/era5/1959-2022-6h-1440x721.zarr'
-# obs_path = 'gs://weatherbench2/datasets/era5/1959-2022-6h-512x256_equiangular_conservative.zarr'
-data = xr.open_zarr(obs_path)
-num_samples = 100
-means, stds = compute_statistics_diff(data, single_features, num_samples=num_samples, single=True)
-print("Means: ", means)
-print("Stds: ", stds)
+    with open(path) as f:
+        stats = json.load(f)
+    for key in ("means", "stds", "diff_means", "diff_stds"):
+        stats[key] = {var: np.asarray(value, dtype=np.float32) for var, value in stats[key].items()}
+    return stats
+
+
+def main():
+    """Command line interface of compute_statistics."""
+    parser = argparse.ArgumentParser(description="Compute the statistics of a dataset.")
+    parser.add_argument("path", help="path of a local Zarr store or NetCDF file.")
+    parser.add_argument("output_path", help="path of the JSON statistics file.")
+    parser.add_argument("--variables", nargs="+", default=None)
+    parser.add_argument("--time-step", type=int, default=2)
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--num-workers", type=int, default=0)
+    parser.add_argument("--max-year", type=int, default=None)
+    args = parser.parse_args()
+
+    stats = compute_statistics(
+        path=args.path,
+        variables=args.variables,
+        time_step=args.time_step,
+        chunk_size=args.chunk_size,
+        num_workers=args.num_workers,
+        max_year=args.max_year,
+    )
+    save_statistics(stats, args.output_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,7 @@ class WeightedMSELoss(torch.nn.Module):
         pressure_levels: Optional[torch.Tensor] = None,
         num_atmospheric_features: Optional[int] = None,
         single_features_weights: Optional[torch.Tensor] = None,
+        check_nan: bool = True,
     ):
         """Initialize the WeightedMSELoss Module.
 
@@ -33,6 +34,8 @@ class WeightedMSELoss(torch.nn.Module):
             num_atmospheric_features (int, optional): number of atmospheric features.
             single_features_weights (torch.Tensor, optional): 1D tensor containing single features
                 weights.
+            check_nan (bool): if true raise an error when the loss is NaN. The check synchronizes
+                with the device at every call. Defaults to True.
         """
         super().__init__()
 
@@ -62,32 +65,25 @@ class WeightedMSELoss(torch.nn.Module):
             )
 
         self.sigma_data = 1  # assuming normalized data!
+        self.check_nan = check_nan
 
-        self.register_buffer("area_weights", area_weights, persistent=False)
-        self.register_buffer("features_weights", features_weights, persistent=False)
+        # expected sizes of the lat and var dimensions, None if they are not weighted.
+        self.num_lat = len(area_weights) if area_weights is not None else None
+        self.num_features = len(features_weights) if features_weights is not None else None
+
+        # combine area and features weights into a single broadcastable [lat, var] tensor.
+        weights = torch.ones((1, 1))
+        if area_weights is not None:
+            weights = area_weights.float()[:, None]
+        if features_weights is not None:
+            weights = weights.to(features_weights.device) * features_weights.float()[None, :]
+        self.register_buffer("weights", weights, persistent=False)
 
     def _lambda_sigma(self, noise_level):
         noise_weights = (noise_level**2 + self.sigma_data**2) / (noise_level * self.sigma_data) ** 2
         return noise_weights  # [batch, 1]
 
-    def forward(
-        self,
-        pred: torch.Tensor,
-        noise_level: torch.Tensor,
-        target: torch.Tensor,
-    ) -> torch.Tensor:
-        """Compute the loss.
-
-        Args:
-            pred (torch.Tensor): prediction of the model [batch, lon, lat, var].
-            noise_level (torch.Tensor): noise levels fed to the model for the corresponding
-                predictions [batch, 1].
-            target (torch.Tensor): target tensor [batch, lon, lat, var].
-
-        Returns:
-            torch.Tensor: weighted MSE loss.
-        """
-        # check shapes
+    def _check_shapes(self, pred, noise_level, target):
         if not (pred.shape == target.shape):
             raise ValueError(
                 "Predictions and targets must have same shape. The actual shapes "
@@ -102,34 +98,70 @@ class WeightedMSELoss(torch.nn.Module):
             raise ValueError(
                 f"The expected shape for noise levels is [batch, 1], but got {noise_level.shape}."
             )
+        if self.num_lat is not None and not (self.num_lat == pred.shape[2]):
+            raise ValueError(
+                f"The size of grid_lat at initialization ({self.num_lat}) "
+                f"and the number of latitudes in predictions ({pred.shape[2]}) "
+                "don't match."
+            )
+        if self.num_features is not None and not (self.num_features == pred.shape[-1]):
+            raise ValueError(
+                f"The size of features weights at initialization ({self.num_features})"
+                f" and the number of features in predictions ({pred.shape[-1]}) "
+                "don't match."
+            )
+
+    def per_variable_loss(
+        self,
+        pred: torch.Tensor,
+        noise_level: torch.Tensor,
+        target: torch.Tensor,
+    ) -> torch.Tensor:
+        """Compute the contribution of each variable to the loss.
+
+        The contributions sum up to the output of forward, hence they can be logged at no extra
+        cost by calling this method and summing the result.
 
-        # compute square residuals
-        loss = (pred - target) ** 2  # [batch, lon, lat, var]
-        if torch.isnan(loss).any():
+        Args:
+            pred (torch.Tensor): prediction of the model [batch, lon, lat, var].
+            noise_level (torch.Tensor): noise levels fed to the model for the corresponding
+                predictions [batch, 1].
+            target (torch.Tensor): target tensor [batch, lon, lat, var].
+
+        Returns:
+            torch.Tensor: weighted MSE loss of each variable [var].
+        """
+        self._check_shapes(pred, noise_level, target)
+        num_lon, num_lat, num_var = pred.shape[1:]
+
+        # compute square residuals and reduce over longitudes before weighting, so that the full
+        # weighted residual is never allocated.
+        loss = torch.sub(pred, target).square_().sum(dim=1)  # [batch, lat, var]
+        loss = (loss * self.weights).sum(dim=1)  # [batch, var]
+
+        # weight each sample using the corresponding noise level, then average over the batch.
+        loss = loss * self._lambda_sigma(noise_level)
+        loss = loss.mean(dim=0) / (num_lon * num_lat * num_var)  # [var]
+
+        if self.check_nan and torch.isnan(loss).any():
             raise ValueError("NaN values encountered in loss calculation.")
+        return loss
+
+    def forward(
+        self,
+        pred: torch.Tensor,
+        noise_level: torch.Tensor,
+        target: torch.Tensor,
+    ) -> torch.Tensor:
+        """Compute the loss.
+
+        Args:
+            pred (torch.Tensor): prediction of the model [batch, lon, lat, var].
+            noise_level (torch.Tensor): noise levels fed to the model for the corresponding
+                predictions [batch, 1].
+            target (torch.Tensor): target tensor [batch, lon, lat, var].
 
-        # apply area and features weights to residuals
-        if self.area_weights is not None:
-            if not (len(self.area_weights) == pred.shape[2]):
-                raise ValueError(
-                    f"The size of grid_lat at initialization ({len(self.area_weights)}) "
-                    f"and the number of latitudes in predictions ({pred.shape[2]}) "
-                    "don't match."
-                )
-            loss *= self.area_weights[None, None, :, None]
-
-        if self.features_weights is not None:
-            if not (len(self.features_weights) == pred.shape[-1]):
-                raise ValueError(
-                    f"The size of features weights at initialization ({len(self.features_weights)})"
-                    f" and the number of features in predictions ({pred.shape[-1]}) "
-                    "don't match."
-                )
-            loss *= self.features_weights[None, None, None, :]
-
-        # compute means across lon, lat, var for each sample in the batch
-        loss = loss.flatten(1).mean(-1)  # [batch]
-
-        # weight each sample using the corresponding noise level, then return the mean.
-        loss *= self._lambda_sigma(noise_level).flatten()
-        return loss.mean()
+        Returns:
+            torch.Tensor: weighted MSE loss.
+        """
+        return self.per_variable_loss(pred, noise_level, target).sum()
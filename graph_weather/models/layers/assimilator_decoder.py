@@ -20,7 +20,8 @@ import numpy as np
 import torch
 from torch_geometric.data import Data
 
-from graph_weather.models.layers.graph_net_block import MLP, GraphProcessor
+from graph_weather.data.h3_grid import h3_cells, region_cells, spatial_order
+from graph_weather.models.layers.graph_net_block import MLP, GraphProcessor, sort_edges
 
 
 class AssimilatorDecoder(torch.nn.Module):
@@ -41,10 +42,19 @@ class AssimilatorDecoder(torch.nn.Module):
         hidden_dim_decoder: int = 128,
         hidden_layers_decoder: int = 2,
         use_checkpointing: bool = False,
+        regional: bool = False,
+        halo: int = 1,
+        reorder: bool = False,
     ):
         """
         Decoder from latent graph to lat/lon graph for assimilation of observation
 
+        In regional mode the latent graph is the limited-area graph of the Encoder, i.e. the cells
+        of the lat/lon points and halo rings of boundary cells around them.
+
+        With reorder the lat/lon nodes are sorted along the H3 space-filling order and the edges by
+        receiver then sender, see Encoder. The outputs are permuted back to the order of lat_lons.
+
         Args:
             lat_lons: List of (lat,lon) points
             resolution: H3 resolution level
@@ -60,19 +70,34 @@ class AssimilatorDecoder(torch.nn.Module):
             mlp_norm_type: Type of norm for the MLPs
                 one of 'LayerNorm', 'GraphNorm', 'InstanceNorm', 'BatchNorm', 'MessageNorm', or None
             use_checkpointing: Whether to use gradient checkpointing to reduce model size
+            regional: Whether the latent graph only covers the area of the lat/lon points
+            halo: Number of rings of boundary cells around the area, in regional mode
+            reorder: Whether to sort the lat/lon nodes and the edges for memory locality
         """
         super().__init__()
         self.use_checkpointing = use_checkpointing
         self.num_latlons = len(lat_lons)
-        self.base_h3_grid = sorted(list(h3.uncompact(h3.get_res0_indexes(), resolution)))
+        self.reorder = reorder
+        if reorder:
+            order = spatial_order(
+                [lat for lat, _ in lat_lons], [lon for _, lon in lat_lons], resolution
+            )
+            lat_lons = [lat_lons[i] for i in order]
+        else:
+            order = np.arange(self.num_latlons)
+        # Position in the lat/lon nodes of the outputs
+        self.register_buffer("output_order", torch.from_numpy(np.argsort(order)), persistent=False)
+        if regional:
+            cells, _ = region_cells(
+                [lat for lat, _ in lat_lons], [lon for _, lon in lat_lons], resolution, halo
+            )
+            self.base_h3_grid = [h3_cells(resolution)[i] for i in cells]
+        else:
+            self.base_h3_grid = list(h3_cells(resolution))
         self.num_h3 = len(self.base_h3_grid)
         self.h3_grid = [h3.geo_to_h3(lat, lon, resolution) for lat, lon in lat_lons]
-        self.h3_to_index = {}
-        h_index = len(self.base_h3_grid)
-        for h in self.base_h3_grid:
-            if h not in self.h3_to_index:
-                h_index -= 1
-                self.h3_to_index[h] = h_index
+        # Same node order as the latent graph of the encoder
+        self.h3_to_index = {h: i for i, h in enumerate(self.base_h3_grid)}
         self.h3_mapping = {}
         for h, value in enumerate(self.h3_grid):
             self.h3_mapping[h + self.num_h3] = value
@@ -91,6 +116,8 @@ class AssimilatorDecoder(torch.nn.Module):
             # Get h3 index
             h_points = h3.k_ring(self.h3_mapping[node_index + self.num_h3], 1)
             for h in h_points:
+                if h not in self.h3_to_index:  # outside of the regional graph
+                    continue
                 distance = h3.point_dist(lat_lons[node_index], h3.h3_to_geo(h), unit="rads")
                 self.h3_to_lat_distances.append([np.sin(distance), np.cos(distance)])
                 edge_sources.append(self.h3_to_index[h])
@@ -100,6 +127,8 @@ class AssimilatorDecoder(torch.nn.Module):
 
         # Use normal graph as its a bit simpler
         self.graph = Data(edge_index=edge_index, edge_attr=self.h3_to_lat_distances)
+        if reorder:
+            self.graph = sort_edges(self.graph)
 
         self.edge_encoder = MLP(
             2, output_edge_dim, hidden_dim_processor_edge, 2, mlp_norm_type, self.use_checkpointing
@@ -159,4 +188,6 @@ class AssimilatorDecoder(torch.nn.Module):
         out = self.node_decoder(out)  # Decode to 78 from 256
         out = einops.rearrange(out, "(b n) f -> b n f", b=batch_size)
         test, out = torch.split(out, [self.num_h3, self.num_latlons], dim=1)
+        if self.reorder:
+            out = out[:, self.output_order]
         return out
@@ -22,17 +22,68 @@ or mildly randomize graph connectivity in encoder, as a kind of edge Dropout
 
 """
 
+import hashlib
+from collections import OrderedDict
 from typing import Tuple
 
-import einops
 import h3
 import numpy as np
 import torch
-from torch_geometric.data import Data
+from torch_geometric.data import Batch, Data
 
+from graph_weather.data.h3_grid import (
+    cell_indices,
+    great_circle_distance,
+    h3_cell_centers,
+    h3_cells,
+)
 from graph_weather.models.layers.graph_net_block import MLP, GraphProcessor
 
 
+def build_input_graph(lat_lons_heights, resolution: int, mask=None, cells=None) -> Data:
+    """
+    Builds the bipartite graph from the observations to the H3 nodes
+
+    Every observation is connected to the node of its H3 cell, with the sin and cos of the great
+    circle distance to the cell center and the height as edge attributes. The nodes are the N
+    observations followed by the H3 nodes, in the order of the sorted cells as in the latent graph.
+
+    Args:
+        lat_lons_heights: Array of lat/lon/height values for each observation, in [N,3] format
+        resolution: H3 resolution
+        mask: Optional boolean array [N], the edges of the false observations are dropped
+        cells: Optional int64 array [N], the positions of the H3 cells of the observations in the
+            sorted cells, e.g. the "cell_index" of ObservationBucketer, computed if not given
+
+    Returns:
+        torch geometric Data object containing the graph connectivity and edge attributes
+    """
+    lat_lons_heights = np.asarray(lat_lons_heights, dtype=np.float64).reshape(-1, 3)
+    num_latlons = lat_lons_heights.shape[0]
+    num_h3 = len(h3_cells(resolution))
+    latitudes, longitudes, heights = lat_lons_heights.T
+    if cells is None:
+        cells = cell_indices(latitudes, longitudes, resolution)
+    else:
+        cells = np.asarray(cells, dtype=np.int64).reshape(-1)
+    center_lats, center_lons = h3_cell_centers(resolution)
+    # Should have vertical and horizontal difference
+    distance = great_circle_distance(latitudes, longitudes, center_lats[cells], center_lons[cells])
+    # TODO Normalize height by some amount
+    edge_attr = np.stack([np.sin(distance), np.cos(distance), heights], axis=-1)
+    edge_index = np.stack([np.arange(num_latlons), num_latlons + cells])
+    if mask is not None:
+        mask = np.asarray(mask, dtype=bool)
+        edge_index, edge_attr = edge_index[:, mask], edge_attr[mask]
+
+    # Use homogenous graph to make it easier
+    return Data(
+        edge_index=torch.from_numpy(edge_index),
+        edge_attr=torch.from_numpy(edge_attr).float(),
+        num_nodes=num_latlons + num_h3,
+    )
+
+
 class AssimilatorEncoder(torch.nn.Module):
     """Encoder graph model for assimilation"""
 
@@ -48,6 +99,7 @@ class AssimilatorEncoder(torch.nn.Module):
         hidden_layers_processor_edge: int = 2,
         mlp_norm_type: str = "LayerNorm",
         use_checkpointing: bool = False,
+        input_graph_cache_size: int = 32,
     ):
         """
         Encode the lat/lon data inot the isohedron graph
@@ -65,6 +117,7 @@ class AssimilatorEncoder(torch.nn.Module):
             mlp_norm_type: Type of norm for the MLPs
                 one of 'LayerNorm', 'GraphNorm', 'InstanceNorm', 'BatchNorm', 'MessageNorm', or None
             use_checkpointing: Whether to use gradient checkpointing
+            input_graph_cache_size: Number of input graphs kept in the LRU cache, 0 disables it
         """
         super().__init__()
         self.use_checkpointing = use_checkpointing
@@ -73,8 +126,11 @@ class AssimilatorEncoder(torch.nn.Module):
         self.resolution = resolution
         self.base_h3_grid = sorted(list(h3.uncompact(h3.get_res0_indexes(), resolution)))
         self.base_h3_map = {h_i: i for i, h_i in enumerate(self.base_h3_grid)}
-        self.h3_mapping = {}
         self.latent_graph = self.create_latent_graph()
+        self.input_graph_cache_size = input_graph_cache_size
+        self._input_graphs = OrderedDict()
+        self.input_graph_hits = 0
+        self.input_graph_misses = 0
 
         # Extra starting ones for appending to inputs, could 'learn' good starting points
         self.h3_nodes = torch.zeros((h3.num_hexagons(resolution), input_dim), dtype=torch.float)
@@ -116,100 +172,114 @@ class AssimilatorEncoder(torch.nn.Module):
         )
 
     def forward(
-        self, features: torch.Tensor, lat_lon_heights: torch.Tensor
+        self,
+        features: torch.Tensor,
+        lat_lon_heights: torch.Tensor,
+        mask: torch.Tensor = None,
+        cell_index: torch.Tensor = None,
     ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
         """
-        Adds features to the encoding graph, assuming all inputs have same lat/lon/height points
+        Adds features to the encoding graph, with one input graph per sample
 
-        This is more designed for a batch size of 1, unless the observations are all only taken
-        at the same height/lat/lon point combinations, otherwise the input graph will be wrong
-        for all but the first set of features
+        Every sample has its own observation graph, the graphs are assembled into one disjoint
+        batched graph, as a PyG Batch: the nodes of a sample are its observations followed by the
+        H3 nodes. The padding observations are nodes without edges, hence the node count of the
+        batch only depends on the padded shape of the inputs.
 
         Args:
-            features: Array of features in same order as lat_lon
-            lat_lon_heights: Tensor containing [Batch, N, 3] with 3 being [Lat,Lon,Height]
+            features: Array of features in same order as lat_lon, in [Batch, N, F] format
+            lat_lon_heights: Tensor containing [N, 3] lat/lon/heights shared by all the samples or
+                [Batch, N, 3] per sample, with 3 being [Lat,Lon,Height]
+            mask: Optional boolean tensor [N] or [Batch, N], false for the padding observations,
+                which are not connected to the H3 nodes
+            cell_index: Optional int64 tensor [N] or [Batch, N], the positions of the H3 cells of
+                the observations, e.g. from ObservationBucketer, computed if not given
 
         Returns:
             Torch tensors of node features, latent graph edge index, and latent edge attributes
         """
-        graph = self.create_input_graph(features=features, lat_lons_heights=lat_lon_heights)
-        batch_size = features.shape[0]
-        features = torch.cat(
-            [features, einops.repeat(self.h3_nodes, "n f -> b n f", b=batch_size)], dim=1
-        )
-        # Cat with the h3 nodes to have correct amount of nodes, and in right order
-        features = einops.rearrange(features, "b n f -> (b n) f")
-        out = self.node_encoder(features)  # Encode to 256 from 2
-        edge_attr = self.edge_encoder(graph.edge_attr)  # Update attributes based on distance
-        # Copy attributes batch times
-        edge_attr = einops.repeat(edge_attr, "e f -> (repeat e) f", repeat=batch_size)
-        # Expand edge index correct number of times while adding the proper number to the edge index
-        edge_index = torch.cat(
-            [graph.edge_index + i * torch.max(graph.edge_index) + i for i in range(batch_size)],
-            dim=1,
-        )
-        out, _ = self.graph_processor(out, edge_index, edge_attr)  # Message Passing
-        # Remove the extra nodes (lat/lon) from the output
-        out = einops.rearrange(out, "(b n) f -> b n f", b=batch_size)
-        _, out = torch.split(out, [len(lat_lon_heights), self.h3_nodes.shape[0]], dim=1)
-        out = einops.rearrange(out, "b n f -> (b n) f")
+        batch_size, num_points = features.shape[:2]
+        shared = all(x is None or x.dim() == 1 for x in (mask, cell_index))
+        if shared and lat_lon_heights.dim() == 2:
+            # the samples share their observation locations, hence their graph
+            shared_graph = self.create_input_graph(None, lat_lon_heights, mask, cell_index)
+            graphs = [shared_graph] * batch_size
+        else:
+            lat_lon_heights = lat_lon_heights.expand(batch_size, num_points, 3)
+            masks, cells = (
+                [None] * batch_size if x is None else x.expand(batch_size, num_points)
+                for x in (mask, cell_index)
+            )
+            graphs = [
+                self.create_input_graph(None, lat_lon_heights[i], masks[i], cells[i])
+                for i in range(batch_size)
+            ]
+        batch = Batch.from_data_list(graphs).to(features.device)
+
+        # Nodes of every sample: its observations followed by the h3 nodes
+        h3_nodes = self.h3_nodes.to(features.device)
+        num_h3 = h3_nodes.shape[0]
+        nodes = torch.cat([features, h3_nodes.expand(batch_size, -1, -1)], dim=1)
+        out = self.node_encoder(nodes.flatten(0, 1))  # Encode to 256 from 2
+        edge_attr = self.edge_encoder(batch.edge_attr)  # Update attributes based on distance
+        out, _ = self.graph_processor(out, batch.edge_index, edge_attr)  # Message Passing
+        # Keep only the h3 nodes of every sample, which are the last nodes of its graph
+        out = out.view(batch_size, num_points + num_h3, -1)[:, num_points:].flatten(0, 1)
+
+        latent_graph = Batch.from_data_list([self.latent_graph] * batch_size).to(features.device)
         return (
             out,
-            torch.cat(
-                [
-                    self.latent_graph.edge_index + i * torch.max(self.latent_graph.edge_index) + i
-                    for i in range(batch_size)
-                ],
-                dim=1,
-            ),
-            self.latent_edge_encoder(
-                einops.repeat(self.latent_graph.edge_attr, "e f -> (repeat e) f", repeat=batch_size)
-            ),
+            latent_graph.edge_index,
+            self.latent_edge_encoder(latent_graph.edge_attr),
         )  # New graph
 
-    def create_input_graph(self, features: torch.Tensor, lat_lons_heights: torch.Tensor) -> Data:
+    def create_input_graph(
+        self,
+        features: torch.Tensor,
+        lat_lons_heights: torch.Tensor,
+        mask: torch.Tensor = None,
+        cell_index: torch.Tensor = None,
+    ) -> Data:
         """
-        Creates an input graph, currently limited to a batch size of 1 to work
+        Returns the input graph of one sample, from the cache if its locations were seen before
+
+        The graphs are cached by a fingerprint of the observation locations, so networks with
+        fixed locations, e.g. surface stations or radiosondes, only build their graph once.
 
         Args:
-            features: Node features
+            features: Node features, unused, the graph only depends on the locations
             lat_lons_heights: List of lat/lon/height values for each node, in [N,3] format
+            mask: Optional boolean tensor [N], the edges of the false nodes are dropped
+            cell_index: Optional int64 tensor [N], the precomputed H3 cells of the nodes, see
+                build_input_graph. The cells follow from the locations, they are not part of the key
 
         Returns:
             torch geometric Data object containing the graph connectivity and
             edge attributes for the input
         """
-        num_latlons = lat_lons_heights.shape[0]
-        h3_grid = [h3.geo_to_h3(lat, lon, self.resolution) for lat, lon, height in lat_lons_heights]
-        h3_mapping = {}
-        h_index = len(self.base_h3_grid)
-        for h in self.base_h3_grid:
-            if h not in h3_mapping:
-                h_index -= 1
-                h3_mapping[h] = h_index + num_latlons
-        self.h3_mapping = h3_mapping
-        # Now have the h3 grid mapping, the bipartite graph of edges connecting lat/lon to h3 nodes
-        # Should have vertical and horizontal difference
-        h3_distances = []
-        for idx, h3_point in enumerate(h3_grid):
-            lat, lon, height = lat_lons_heights[idx]
-            distance = h3.point_dist((lat, lon), h3.h3_to_geo(h3_point), unit="rads")
-            # TODO Normalize height by some amount
-            h3_distances.append([np.sin(distance), np.cos(distance), height])
-        h3_distances = torch.tensor(h3_distances, dtype=torch.float)
-        # Compress to between 0 and 1
-
-        # Build the default graph
-        # Get connections between lat nodes and h3 nodes
-        edge_sources = []
-        edge_targets = []
-        for node_index, lat_node in enumerate(h3_grid):
-            edge_sources.append(node_index)
-            edge_targets.append(self.h3_mapping[lat_node])
-        edge_index = torch.tensor([edge_sources, edge_targets], dtype=torch.long)
+        lat_lons_heights = np.ascontiguousarray(
+            torch.as_tensor(lat_lons_heights).detach().cpu().numpy(), dtype=np.float32
+        )
+        fingerprint = hashlib.blake2b(lat_lons_heights.tobytes(), digest_size=16)
+        fingerprint.update(str(lat_lons_heights.shape).encode())
+        if mask is not None:
+            mask = np.asarray(torch.as_tensor(mask).detach().cpu().numpy(), dtype=bool)
+            fingerprint.update(np.packbits(mask).tobytes())
+        key = fingerprint.hexdigest()
+        if key in self._input_graphs:
+            self.input_graph_hits += 1
+            self._input_graphs.move_to_end(key)
+            return self._input_graphs[key]
 
-        # Use homogenous graph to make it easier
-        return Data(edge_index=edge_index, edge_attr=h3_distances)
+        self.input_graph_misses += 1
+        if cell_index is not None:
+            cell_index = torch.as_tensor(cell_index).detach().cpu().numpy()
+        graph = build_input_graph(lat_lons_heights, self.resolution, mask, cell_index)
+        if self.input_graph_cache_size > 0:
+            self._input_graphs[key] = graph
+            if len(self._input_graphs) > self.input_graph_cache_size:
+                self._input_graphs.popitem(last=False)
+        return graph
 
     def create_latent_graph(self) -> Data:
         """
@@ -233,4 +303,4 @@ class AssimilatorEncoder(torch.nn.Module):
         edge_attrs = torch.tensor(edge_attrs, dtype=torch.float)
         # Use heterogeneous graph as input and output dims are not same for the encoder
         # Because uniform grid now, don't need edge attributes as they are all the same
-        return Data(edge_index=edge_index, edge_attr=edge_attrs)
+        return Data(edge_index=edge_index, edge_attr=edge_attrs, num_nodes=len(self.base_h3_grid))
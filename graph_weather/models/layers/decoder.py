@@ -37,6 +37,9 @@ class Decoder(AssimilatorDecoder):
         hidden_dim_decoder: int = 128,
         hidden_layers_decoder: int = 2,
         use_checkpointing: bool = False,
+        regional: bool = False,
+        halo: int = 1,
+        reorder: bool = False,
     ):
         """
         Decoder from latent graph to lat/lon graph
@@ -56,6 +59,9 @@ class Decoder(AssimilatorDecoder):
             mlp_norm_type: Type of norm for the MLPs
                 one of 'LayerNorm', 'GraphNorm', 'InstanceNorm', 'BatchNorm', 'MessageNorm', or None
             use_checkpointing: Whether to use gradient checkpointing or not
+            regional: Whether the latent graph only covers the area of the lat/lon points
+            halo: Number of rings of boundary cells around the area, in regional mode
+            reorder: Whether to sort the lat/lon nodes and the edges for memory locality
         """
         super().__init__(
             lat_lons,
@@ -71,6 +77,9 @@ class Decoder(AssimilatorDecoder):
             hidden_dim_decoder,
             hidden_layers_decoder,
             use_checkpointing,
+            regional,
+            halo,
+            reorder,
         )
 
     def forward(
@@ -22,7 +22,7 @@ or mildly randomize graph connectivity in encoder, as a kind of edge Dropout
 
 """
 
-from typing import Tuple
+from typing import Optional, Tuple
 
 import einops
 import h3
@@ -30,7 +30,14 @@ import numpy as np
 import torch
 from torch_geometric.data import Data
 
-from graph_weather.models.layers.graph_net_block import MLP, GraphProcessor
+from graph_weather.data.h3_grid import (
+    great_circle_distance,
+    h3_cells,
+    multi_mesh_edges,
+    region_cells,
+    spatial_order,
+)
+from graph_weather.models.layers.graph_net_block import MLP, GraphProcessor, sort_edges
 
 
 class Encoder(torch.nn.Module):
@@ -49,10 +56,29 @@ class Encoder(torch.nn.Module):
         hidden_layers_processor_edge=2,
         mlp_norm_type="LayerNorm",
         use_checkpointing: bool = False,
+        regional: bool = False,
+        halo: int = 1,
+        multi_mesh_levels: int = 0,
+        reorder: bool = False,
     ):
         """
         Encode the lat/lon data inot the isohedron graph
 
+        By default the latent graph is made of all the H3 cells of the resolution. In regional mode
+        it is made of the cells of the lat/lon points only, i.e. of a limited area, plus halo rings
+        of boundary cells around them. The boundary cells have no lat/lon points, their features
+        are given to forward as the boundary forcing, e.g. the global forecast at their centers.
+
+        The latent graph connects every cell to its neighbors. With multi_mesh_levels it also has
+        the edges of the coarser resolutions between their center children, see
+        graph_weather.data.h3_grid.multi_mesh_edges, so that fewer processor blocks are needed
+        for the long-range propagation.
+
+        With reorder the lat/lon nodes are sorted along the H3 space-filling order, the latent nodes
+        already are, and the edges are sorted by receiver then sender, for the memory locality of
+        the gathers and scatters of the message passing. The inputs are permuted in forward, the
+        order of the lat_lons and of the features is unchanged for the caller.
+
         Args:
             lat_lons: List of (lat,lon) points
             resolution: H3 resolution level
@@ -66,20 +92,50 @@ class Encoder(torch.nn.Module):
             mlp_norm_type: Type of norm for the MLPs
                 one of 'LayerNorm', 'GraphNorm', 'InstanceNorm', 'BatchNorm', 'MessageNorm', or None
             use_checkpointing: Whether to use gradient checkpointing to use less memory
+            regional: Whether the latent graph only covers the area of the lat/lon points
+            halo: Number of rings of boundary cells around the area, in regional mode
+            multi_mesh_levels: Number of coarser resolutions added to the latent graph
+            reorder: Whether to sort the lat/lon nodes and the edges for memory locality
         """
         super().__init__()
         self.use_checkpointing = use_checkpointing
         self.output_dim = output_dim
         self.num_latlons = len(lat_lons)
-        self.base_h3_grid = sorted(list(h3.uncompact(h3.get_res0_indexes(), resolution)))
+        self.reorder = reorder
+        if reorder:
+            order = spatial_order(
+                [lat for lat, _ in lat_lons], [lon for _, lon in lat_lons], resolution
+            )
+            lat_lons = [lat_lons[i] for i in order]
+        else:
+            order = np.arange(self.num_latlons)
+        # Position in the inputs of the lat/lon nodes
+        self.register_buffer("input_order", torch.from_numpy(order), persistent=False)
+        self.regional = regional
+        if regional:
+            cells, is_boundary = region_cells(
+                [lat for lat, _ in lat_lons], [lon for _, lon in lat_lons], resolution, halo
+            )
+            self.base_h3_grid = [h3_cells(resolution)[i] for i in cells]
+            # Position in h3_cells(resolution) of the boundary cells, e.g. to select them in the
+            # output of graph_weather.data.regrid.h3_regridder
+            self.boundary_index = cells[is_boundary]
+            self.boundary_lat_lons = [
+                h3.h3_to_geo(h3_cells(resolution)[i]) for i in cells[is_boundary]
+            ]
+            boundary_nodes = torch.from_numpy(np.flatnonzero(is_boundary))
+        else:
+            self.base_h3_grid = list(h3_cells(resolution))
+            self.boundary_index = np.empty(0, dtype=np.int64)
+            self.boundary_lat_lons = []
+            boundary_nodes = torch.empty(0, dtype=torch.long)
+        self.register_buffer("boundary_nodes", boundary_nodes, persistent=False)
+        self.resolution = resolution
+        self.multi_mesh_levels = multi_mesh_levels
         self.base_h3_map = {h_i: i for i, h_i in enumerate(self.base_h3_grid)}
         self.h3_grid = [h3.geo_to_h3(lat, lon, resolution) for lat, lon in lat_lons]
-        self.h3_mapping = {}
-        h_index = len(self.base_h3_grid)
-        for h in self.base_h3_grid:
-            if h not in self.h3_mapping:
-                h_index -= 1
-                self.h3_mapping[h] = h_index + self.num_latlons
+        # The H3 nodes follow the lat/lon nodes, in the order of the latent graph
+        self.h3_mapping = {h: i + self.num_latlons for h, i in self.base_h3_map.items()}
         # Now have the h3 grid mapping, the bipartite graph of edges connecting lat/lon to h3 nodes
         # Should have vertical and horizontal difference
         self.h3_distances = []
@@ -105,10 +161,13 @@ class Encoder(torch.nn.Module):
         self.graph = Data(edge_index=edge_index, edge_attr=self.h3_distances)
 
         self.latent_graph = self.create_latent_graph()
+        if reorder:
+            self.graph = sort_edges(self.graph)
+            self.latent_graph = sort_edges(self.latent_graph)
 
         # Extra starting ones for appending to inputs, could 'learn' good starting points
         self.h3_nodes = torch.nn.Parameter(
-            torch.zeros((h3.num_hexagons(resolution), input_dim), dtype=torch.float)
+            torch.zeros((len(self.base_h3_grid), input_dim), dtype=torch.float)
         )
         # Output graph
 
@@ -147,23 +206,38 @@ class Encoder(torch.nn.Module):
             mlp_norm_type,
         )
 
-    def forward(self, features: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    def forward(
+        self, features: torch.Tensor, boundary: Optional[torch.Tensor] = None
+    ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
         """
         Adds features to the encoding graph
 
         Args:
             features: Array of features in same order as lat_lon
+            boundary: Optional boundary forcing in regional mode, the input features at the
+                boundary_lat_lons in shape [B, num_boundary, input_dim]. They replace the learned
+                starting features of the boundary nodes
 
         Returns:
             Torch tensors of node features, latent graph edge index, and latent edge attributes
         """
         batch_size = features.shape[0]
+        if self.reorder:
+            features = features[:, self.input_order]
         self.h3_nodes = self.h3_nodes.to(features.device)
         self.graph = self.graph.to(features.device)
         self.latent_graph = self.latent_graph.to(features.device)
-        features = torch.cat(
-            [features, einops.repeat(self.h3_nodes, "n f -> b n f", b=batch_size)], dim=1
-        )
+        h3_features = einops.repeat(self.h3_nodes, "n f -> b n f", b=batch_size)
+        if boundary is not None:
+            if boundary.shape[1] != len(self.boundary_nodes):
+                raise ValueError(
+                    f"Expected boundary forcing for {len(self.boundary_nodes)} boundary nodes, "
+                    f"got {boundary.shape[1]}."
+                )
+            h3_features = h3_features.index_copy(
+                1, self.boundary_nodes, boundary.to(h3_features.dtype)
+            )
+        features = torch.cat([features, h3_features], dim=1)
         # Cat with the h3 nodes to have correct amount of nodes, and in right order
         features = einops.rearrange(features, "b n f -> (b n) f")
         out = self.node_encoder(features)  # Encode to 256 from 78
@@ -171,12 +245,10 @@ class Encoder(torch.nn.Module):
         # Copy attributes batch times
         edge_attr = einops.repeat(edge_attr, "e f -> (repeat e) f", repeat=batch_size)
         # Expand edge index correct number of times while adding the proper number to the edge index
+        # The boundary nodes of the regional graph have no edges, offset by the number of nodes
+        num_nodes = self.num_latlons + self.h3_nodes.shape[0]
         edge_index = torch.cat(
-            [
-                self.graph.edge_index + i * torch.max(self.graph.edge_index) + i
-                for i in range(batch_size)
-            ],
-            dim=1,
+            [self.graph.edge_index + i * num_nodes for i in range(batch_size)], dim=1
         )
         out, _ = self.graph_processor(out, edge_index, edge_attr)  # Message Passing
         # Remove the extra nodes (lat/lon) from the output
@@ -211,12 +283,33 @@ class Encoder(torch.nn.Module):
         for h3_index in self.base_h3_grid:
             h_points = h3.k_ring(h3_index, 1)
             for h in h_points:  # Already includes itself
+                if h not in self.base_h3_map:  # outside of the regional graph
+                    continue
                 distance = h3.point_dist(h3.h3_to_geo(h3_index), h3.h3_to_geo(h), unit="rads")
                 edge_attrs.append([np.sin(distance), np.cos(distance)])
                 edge_sources.append(self.base_h3_map[h3_index])
                 edge_targets.append(self.base_h3_map[h])
         edge_index = torch.tensor([edge_sources, edge_targets], dtype=torch.long)
         edge_attrs = torch.tensor(edge_attrs, dtype=torch.float)
+        if self.multi_mesh_levels > 0:
+            coarse_edges = multi_mesh_edges(
+                self.base_h3_grid, self.resolution, self.multi_mesh_levels
+            )
+            center_lats = np.array([h3.h3_to_geo(h)[0] for h in self.base_h3_grid])
+            center_lons = np.array([h3.h3_to_geo(h)[1] for h in self.base_h3_grid])
+            distance = great_circle_distance(
+                center_lats[coarse_edges[0]],
+                center_lons[coarse_edges[0]],
+                center_lats[coarse_edges[1]],
+                center_lons[coarse_edges[1]],
+            )
+            edge_index = torch.cat([edge_index, torch.from_numpy(coarse_edges)], dim=1)
+            edge_attrs = torch.cat(
+                [
+                    edge_attrs,
+                    torch.tensor(np.stack([np.sin(distance), np.cos(distance)], axis=-1)).float(),
+                ]
+            )
         # Use heterogeneous graph as input and output dims are not same for the encoder
         # Because uniform grid now, don't need edge attributes as they are all the same
         return Data(edge_index=edge_index, edge_attr=edge_attrs)
@@ -0,0 +1,106 @@
+"""
+Tests for the AnalysisDataset.
+
+The dataset is built on small synthetic Zarr stores written in a temporary directory.
+"""
+
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from graph_weather.data.analysis_preprocessing import coarsen_analysis_stores
+from graph_weather.data.dataloader import AnalysisDataset
+
+VARIABLES = ["t", "u", "v"]
+INVARIANTS = ["z", "slt"]
+
+
+@pytest.fixture
+def analysis_paths(tmp_path):
+    """Write 4 analysis stores, 6h apart, on a 16 x 32 grid and an invariant store on a finer grid."""
+    rng = np.random.default_rng(0)
+    latitude = np.linspace(-90, 90, 16)
+    longitude = np.arange(0, 360, 360 / 32)
+    filepaths = []
+    for i, time in enumerate(pd.date_range("2016-01-01", periods=4, freq="6h")):
+        ds = xr.Dataset(
+            {
+                var: (("latitude", "longitude"), rng.normal(size=(16, 32)).astype(np.float32))
+                for var in VARIABLES
+            },
+            coords={"latitude": latitude, "longitude": longitude, "time": time},
+        )
+        path = str(tmp_path / f"analysis_{i}.zarr")
+        ds.to_zarr(path, consolidated=True)
+        filepaths.append(path)
+
+    invariant = xr.Dataset(
+        {
+            var: (("latitude", "longitude"), rng.random((64, 128)).astype(np.float32))
+            for var in INVARIANTS
+        },
+        coords={
+            "latitude": np.linspace(-90, 90, 64),
+            "longitude": np.arange(0, 360, 360 / 128),
+        },
+    )
+    invariant_path = str(tmp_path / "invariant.zarr")
+    invariant.to_zarr(invariant_path, consolidated=True)
+    return filepaths, invariant_path
+
+
+@pytest.mark.parametrize("coarsen", [1, 2])
+def test_analysis_dataset(analysis_paths, coarsen):
+    filepaths, invariant_path = analysis_paths
+    dataset = AnalysisDataset(filepaths, invariant_path, mean=0.0, std=1.0, coarsen=coarsen)
+    assert len(dataset) == 3
+
+    num_nodes = (16 // coarsen) * (32 // coarsen)
+    # variables, sin/cos of lat/lon, 26 solar irradiance times and invariants
+    num_features = len(VARIABLES) + 4 + 26 + len(INVARIANTS)
+    input_data, output_data = dataset[0]
+    assert input_data.shape == (num_nodes, num_features)
+    assert output_data.shape == (num_nodes, num_features)
+    assert not np.isnan(input_data).any()
+
+    # the grid features are computed once and reused
+    grid = dataset._grid
+    dataset[1]
+    assert dataset._grid is grid
+
+    fresh_dataset = AnalysisDataset(filepaths, invariant_path, mean=0.0, std=1.0, coarsen=coarsen)
+    fresh_input_data, _ = fresh_dataset[1]
+    np.testing.assert_array_equal(dataset[1][0], fresh_input_data)
+
+
+def test_analysis_dataset_stores(analysis_paths, tmp_path):
+    filepaths, invariant_path = analysis_paths
+    dataset = AnalysisDataset(
+        filepaths, invariant_path, mean=0.0, std=1.0, coarsen=2, max_open_stores=2
+    )
+    for item in range(len(dataset)):
+        dataset[item]
+    # the handles are reused and bounded, and not sent to the workers
+    assert list(dataset._stores) == filepaths[-2:]
+    assert len(pickle.loads(pickle.dumps(dataset))._stores) == 0
+
+    # pre-coarsened stores give the same samples
+    coarsened_paths = coarsen_analysis_stores(filepaths, str(tmp_path / "coarsened"), coarsen=2)
+    coarsened = AnalysisDataset(coarsened_paths, invariant_path, mean=0.0, std=1.0, coarsen=1)
+    for item in range(len(dataset)):
+        np.testing.assert_allclose(coarsened[item][0], dataset[item][0], rtol=1e-6)
+        np.testing.assert_allclose(coarsened[item][1], dataset[item][1], rtol=1e-6)
+
+    # only the selected variables are read
+    subset = AnalysisDataset(
+        filepaths, invariant_path, mean=0.0, std=1.0, coarsen=2, variables=VARIABLES[:2]
+    )
+    subset_paths = coarsen_analysis_stores(
+        filepaths, str(tmp_path / "subset"), coarsen=2, variables=VARIABLES[:2]
+    )
+    coarsened_subset = AnalysisDataset(subset_paths, invariant_path, mean=0.0, std=1.0, coarsen=1)
+    assert subset[0][0].shape[1] == dataset[0][0].shape[1] - 1
+    np.testing.assert_allclose(subset[0][0], coarsened_subset[0][0], rtol=1e-6)
@@ -1,12 +1,23 @@
 import numpy as np
+import pandas as pd
 import pytest
 import torch
 from packaging.version import Version
+from torch_geometric.nn.conv import TransformerConv
 from torch_geometric.transforms import TwoHop
 
 from graph_weather.models.gencast import Denoiser, GraphBuilder, Sampler, WeightedMSELoss
 from graph_weather.models.gencast.layers.modules import FourierEmbedding
-from graph_weather.models.gencast.utils.noise import generate_isotropic_noise, sample_noise_level
+from graph_weather.models.gencast.layers.padded_attention import (
+    PaddedTransformerConv,
+    build_neighbour_table,
+)
+from graph_weather.models.gencast.utils.clock import ClockFeatures
+from graph_weather.models.gencast.utils.noise import (
+    NoiseCorruption,
+    generate_isotropic_noise,
+    sample_noise_level,
+)
 
 
 def test_gencast_noise():
@@ -47,6 +58,26 @@ def test_gencast_noise():
     assert not np.isnan(corrupted_residuals).any()
 
 
+@pytest.mark.parametrize(
+    "num_lon,num_lat,isotropic", [(36, 18, True), (36, 19, True), (10, 4, False)]
+)
+def test_gencast_noise_corruption(num_lon, num_lat, isotropic):
+    batch_size = 3
+    num_vars = 5
+    noise_corruption = NoiseCorruption(num_lon=num_lon, num_lat=num_lat, isotropic=isotropic)
+    target_residuals = torch.zeros((batch_size, num_lon, num_lat, num_vars))
+    corrupted_targets, noise_levels = noise_corruption(target_residuals)
+    assert corrupted_targets.shape == target_residuals.shape
+    assert noise_levels.shape == (batch_size, 1)
+    assert ((noise_levels >= 0.02) & (noise_levels <= 88)).all()
+    assert not torch.isnan(corrupted_targets).any()
+
+    # the noise has roughly unit variance, as in generate_isotropic_noise.
+    noise = noise_corruption.generate_noise(batch_size=4, num_samples=16)
+    assert noise.shape == (4, num_lon, num_lat, 16)
+    assert 0.7 < noise.var().item() < 1.3
+
+
 def test_gencast_graph():
     grid_lat = np.arange(-90, 90, 1)
     grid_lon = np.arange(0, 360, 1)
@@ -90,6 +121,22 @@ def test_gencast_loss():
     targets = torch.rand((batch_size, len(grid_lon), len(grid_lat), features_dim))
     assert loss.forward(preds, noise_levels, targets) is not None
 
+    # compare with the unfused computation.
+    area_weights = torch.abs(torch.cos(grid_lat * np.pi / 180.0))
+    area_weights = area_weights / area_weights.mean()
+    features_weights = torch.cat(
+        (
+            (pressure_levels / pressure_levels.sum()).repeat(num_atmospheric_features),
+            single_features_weights,
+        )
+    )
+    expected = (preds - targets) ** 2 * area_weights[None, None, :, None] * features_weights
+    expected = expected.flatten(1).mean(-1) * ((noise_levels**2 + 1) / noise_levels**2).flatten()
+    per_variable_loss = loss.per_variable_loss(preds, noise_levels, targets)
+    assert per_variable_loss.shape == (features_dim,)
+    assert torch.isclose(loss(preds, noise_levels, targets), expected.mean(), rtol=1e-4)
+    assert torch.isclose(per_variable_loss.sum(), expected.mean(), rtol=1e-4)
+
 
 def test_gencast_denoiser():
     grid_lat = np.arange(-90, 90, 1)
@@ -123,6 +170,54 @@ def test_gencast_denoiser():
     assert not torch.isnan(preds).any()
 
 
+@pytest.mark.parametrize("concat", [True, False])
+def test_gencast_padded_attention(concat):
+    num_nodes = 50
+    edge_index = torch.randint(0, num_nodes, (2, 300))
+    edge_index = edge_index[:, edge_index[0] != edge_index[1]]
+    edge_attr = torch.randn((edge_index.shape[1], 3))
+    x = torch.randn((num_nodes, 16))
+
+    conv = TransformerConv(16, 8, heads=4, concat=concat, beta=True, edge_dim=3)
+    padded_conv = PaddedTransformerConv(16, 8, heads=4, concat=concat, beta=True, edge_dim=3)
+    padded_conv.load_state_dict(conv.state_dict())
+
+    neighbours, edge_ids, mask = build_neighbour_table(edge_index, num_nodes)
+    assert mask.sum() == edge_index.shape[1]
+    with torch.no_grad():
+        out = conv(x, edge_index, edge_attr)
+        padded_out = padded_conv(x, neighbours, mask, edge_attr[edge_ids])
+    assert torch.allclose(out, padded_out, atol=1e-5)
+
+
+def test_gencast_padded_denoiser():
+    grid_lat = np.arange(-90, 90, 10)
+    grid_lon = np.arange(0, 360, 10)
+    batch_size = 2
+    kwargs = dict(
+        grid_lon=grid_lon,
+        grid_lat=grid_lat,
+        input_features_dim=4,
+        output_features_dim=3,
+        hidden_dims=[16, 32],
+        num_blocks=2,
+        num_heads=4,
+        splits=1,
+        num_hops=2,
+    )
+    denoiser = Denoiser(**kwargs).eval()
+    padded_denoiser = Denoiser(padded=True, **kwargs).eval()
+    padded_denoiser.load_state_dict(denoiser.state_dict())
+
+    corrupted_targets = torch.randn((batch_size, len(grid_lon), len(grid_lat), 3))
+    prev_inputs = torch.randn((batch_size, len(grid_lon), len(grid_lat), 8))
+    noise_levels = torch.rand((batch_size, 1))
+    with torch.no_grad():
+        preds = denoiser(corrupted_targets, prev_inputs, noise_levels)
+        padded_preds = padded_denoiser(corrupted_targets, prev_inputs, noise_levels)
+    assert torch.allclose(preds, padded_preds, atol=1e-4)
+
+
 def test_gencast_fourier():
     batch_size = 10
     output_dim = 20
@@ -180,3 +275,31 @@ def test_gencast_full():
 
     assert not torch.isnan(preds).any()
     assert preds.shape == target_residuals.shape
+
+
+def test_gencast_clock_features():
+    grid_lon = np.arange(0, 360, 30.0)
+    num_lat = 5
+    times = pd.date_range("2016-12-30", periods=12, freq="6h").values
+    clock = ClockFeatures(grid_lon, num_lat)
+
+    features = clock(times)
+    assert features.shape == (len(times), len(grid_lon), num_lat, 4)
+
+    # compare with the direct computation.
+    day_of_year = pd.DatetimeIndex(times).dayofyear.values[:, None, None] / 365.0
+    local_mean_time = (
+        pd.DatetimeIndex(times).hour.values[:, None, None] + grid_lon[None, :, None] * 4 / 60.0
+    ) / 24.0
+    shape = (len(times), len(grid_lon), num_lat)
+    expected = np.stack(
+        [
+            np.broadcast_to(np.sin(2 * np.pi * day_of_year), shape),
+            np.broadcast_to(np.cos(2 * np.pi * day_of_year), shape),
+            np.broadcast_to(np.sin(2 * np.pi * local_mean_time), shape),
+            np.broadcast_to(np.cos(2 * np.pi * local_mean_time), shape),
+        ],
+        axis=-1,
+    ).astype(np.float32)
+    np.testing.assert_array_equal(features, expected)
+    assert torch.equal(clock.as_tensor(times), torch.from_numpy(expected))
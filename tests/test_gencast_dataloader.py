@@ -0,0 +1,209 @@
+"""
+Tests for the GenCast data pipeline.
+
+The datasets are built on a small synthetic Zarr store written in a temporary directory.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from graph_weather.data.cache import LRUCache
+from graph_weather.data.gencast_dataloader import (
+    BatchedGenCastDataset,
+    GenCastDataset,
+    PreprocessedGenCastDataset,
+)
+from graph_weather.data.gencast_preprocessing import convert_gencast_dataset
+from graph_weather.models.gencast.utils.statistics import (
+    RunningStatistics,
+    compute_statistics,
+    load_statistics,
+    save_statistics,
+)
+
+ATMOSPHERIC_FEATURES = ["temperature", "geopotential"]
+SINGLE_FEATURES = ["2m_temperature", "mean_sea_level_pressure"]
+STATIC_FEATURES = ["land_sea_mask"]
+LEVELS = [50, 100, 150, 200, 250, 300, 400, 500, 600, 700, 850, 925, 1000]
+
+
+@pytest.fixture
+def obs_path(tmp_path):
+    """Write a synthetic 6h ERA5-like dataset with a 10 x 4 grid."""
+    rng = np.random.default_rng(0)
+    time = pd.date_range("2017-12-29", periods=20, freq="6h")
+    longitude = np.arange(0, 360, 36.0)
+    latitude = np.array([-67.5, -22.5, 22.5, 67.5])
+    dims_atm = ("time", "level", "longitude", "latitude")
+    dims_single = ("time", "longitude", "latitude")
+    shape_atm = (len(time), len(LEVELS), len(longitude), len(latitude))
+    shape_single = (len(time), len(longitude), len(latitude))
+
+    data_vars = {
+        var: (dims_atm, rng.normal(size=shape_atm).astype(np.float32))
+        for var in ATMOSPHERIC_FEATURES
+    }
+    data_vars.update(
+        {
+            var: (dims_single, rng.normal(size=shape_single).astype(np.float32))
+            for var in SINGLE_FEATURES
+        }
+    )
+    data_vars["land_sea_mask"] = (
+        ("longitude", "latitude"),
+        rng.random((len(longitude), len(latitude))).astype(np.float32),
+    )
+    ds = xr.Dataset(
+        data_vars,
+        coords={"time": time, "level": LEVELS, "longitude": longitude, "latitude": latitude},
+    )
+    path = str(tmp_path / "dataset.zarr")
+    ds.to_zarr(path)
+    return path
+
+
+def _dataset_kwargs(obs_path):
+    return dict(
+        obs_path=obs_path,
+        atmospheric_features=ATMOSPHERIC_FEATURES,
+        single_features=SINGLE_FEATURES,
+        static_features=STATIC_FEATURES,
+        max_year=2018,
+        time_step=2,
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [3, 32])
+def test_preprocessed_gencast_dataset(obs_path, tmp_path, chunk_size):
+    store_path = str(tmp_path / "preprocessed")
+    convert_gencast_dataset(
+        output_path=store_path, chunk_size=chunk_size, **_dataset_kwargs(obs_path)
+    )
+
+    dataset = GenCastDataset(**_dataset_kwargs(obs_path))
+    preprocessed = PreprocessedGenCastDataset(store_path)
+
+    assert len(preprocessed) == len(dataset)
+    assert preprocessed.input_features_dim == dataset.input_features_dim
+    assert preprocessed.output_features_dim == dataset.output_features_dim
+    for item in range(len(dataset)):
+        _, prev_inputs, _, target_residuals = dataset[item]
+        corrupted, pre_prev_inputs, noise_levels, pre_target_residuals = preprocessed[item]
+        np.testing.assert_array_equal(prev_inputs, pre_prev_inputs)
+        np.testing.assert_array_equal(target_residuals, pre_target_residuals)
+        assert corrupted.shape == target_residuals.shape
+        assert noise_levels.shape == (1,)
+
+
+def test_gencast_dataset_without_corruption(obs_path):
+    dataset = GenCastDataset(**_dataset_kwargs(obs_path))
+    clean_dataset = GenCastDataset(corrupt=False, **_dataset_kwargs(obs_path))
+    _, prev_inputs, _, target_residuals = dataset[0]
+    clean_prev_inputs, clean_target_residuals = clean_dataset[0]
+    np.testing.assert_array_equal(prev_inputs, clean_prev_inputs)
+    np.testing.assert_array_equal(target_residuals, clean_target_residuals)
+
+
+def test_lru_cache():
+    cache = LRUCache(max_bytes=3 * 8)
+    for key in range(3):
+        cache.put(key, np.zeros(1))
+    assert cache.get(0) is not None
+    cache.put(3, np.zeros(1))
+    assert 1 not in cache and 0 in cache
+    assert cache.nbytes == 3 * 8
+    cache.put(4, np.zeros(4))
+    assert 4 not in cache
+    assert cache.get(1) is None
+    assert cache.hits == 1 and cache.misses == 1
+    assert cache.hit_rate == 0.5
+
+
+def test_batched_gencast_dataset_cache(obs_path):
+    batch_size = 2
+    dataset = GenCastDataset(corrupt=False, **_dataset_kwargs(obs_path))
+    batched = BatchedGenCastDataset(
+        corrupt=False, batch_size=batch_size, **_dataset_kwargs(obs_path)
+    )
+    cached = BatchedGenCastDataset(
+        corrupt=False, batch_size=batch_size, cache_size=2**20, **_dataset_kwargs(obs_path)
+    )
+
+    for item in range(len(batched)):
+        prev_inputs, target_residuals = batched[item]
+        cached_prev_inputs, cached_target_residuals = cached[item]
+        np.testing.assert_array_equal(prev_inputs, cached_prev_inputs)
+        np.testing.assert_array_equal(target_residuals, cached_target_residuals)
+        for b in range(batch_size):
+            sample_prev_inputs, sample_target_residuals = dataset[item * batch_size + b]
+            np.testing.assert_allclose(prev_inputs[b], sample_prev_inputs, atol=1e-5)
+            np.testing.assert_array_equal(target_residuals[b], sample_target_residuals)
+
+    # each batch reads 3 * time_step + batch_size - 2 = 6 timesteps, successive batches share 4.
+    assert cached.cache.misses == 6 + 2 * (len(batched) - 1)
+    assert cached.cache.hits == 4 * (len(batched) - 1)
+    assert batched.cache.hits == 0
+
+
+def test_running_statistics_merge():
+    rng = np.random.default_rng(0)
+    samples = rng.normal(loc=3.0, scale=2.0, size=(17, 5))
+    stats = RunningStatistics()
+    for chunk in np.array_split(samples, [1, 2, 9]):
+        stats = stats.merge(RunningStatistics.from_samples(chunk, axis=(0,)))
+    assert stats.count == 17
+    np.testing.assert_allclose(stats.mean, samples.mean(axis=0))
+    np.testing.assert_allclose(stats.std, samples.std(axis=0))
+
+
+@pytest.mark.parametrize("chunk_size,num_workers", [(3, 0), (32, 0), (4, 2)])
+def test_compute_statistics(obs_path, tmp_path, chunk_size, num_workers):
+    time_step = 2
+    stats = compute_statistics(
+        obs_path, time_step=time_step, chunk_size=chunk_size, num_workers=num_workers
+    )
+    ds = xr.open_zarr(obs_path)
+
+    for var in ATMOSPHERIC_FEATURES + SINGLE_FEATURES:
+        values = ds[var].values.astype(np.float64)
+        diffs = values[time_step:] - values[:-time_step]
+        axis = (0, 2, 3) if var in ATMOSPHERIC_FEATURES else (0, 1, 2)
+        np.testing.assert_allclose(stats["means"][var], values.mean(axis=axis), rtol=1e-5)
+        np.testing.assert_allclose(stats["stds"][var], values.std(axis=axis), rtol=1e-5)
+        np.testing.assert_allclose(stats["diff_means"][var], diffs.mean(axis=axis), atol=1e-6)
+        np.testing.assert_allclose(stats["diff_stds"][var], diffs.std(axis=axis), rtol=1e-5)
+    assert stats["means"]["temperature"].shape == (len(LEVELS),)
+    assert stats["means"]["land_sea_mask"].shape == ()
+    assert "land_sea_mask" not in stats["diff_means"]
+
+    stats_path = str(tmp_path / "stats.json")
+    save_statistics(stats, stats_path)
+    loaded = load_statistics(stats_path)
+    for key in ("means", "stds", "diff_means", "diff_stds"):
+        for var in stats[key]:
+            np.testing.assert_array_equal(loaded[key][var], stats[key][var])
+
+
+def test_compute_statistics_netcdf(obs_path, tmp_path):
+    nc_path = str(tmp_path / "dataset.nc")
+    xr.open_zarr(obs_path).to_netcdf(nc_path)
+    stats = compute_statistics(nc_path, variables=SINGLE_FEATURES, chunk_size=5, max_year=2018)
+    ds = xr.open_zarr(obs_path)
+    # 2017-12-29 to 2017-12-31 18:00 at 6h
+    assert stats["num_times"] == 12
+    for var in SINGLE_FEATURES:
+        values = ds[var].values[:12].astype(np.float64)
+        np.testing.assert_allclose(stats["stds"][var], values.std(), rtol=1e-5)
+
+
+def test_gencast_dataset_stats_path(obs_path, tmp_path):
+    stats_path = str(tmp_path / "stats.json")
+    save_statistics(compute_statistics(obs_path), stats_path)
+    dataset = GenCastDataset(corrupt=False, stats_path=stats_path, **_dataset_kwargs(obs_path))
+    assert dataset.means.shape == (dataset.input_features_dim - 4,)
+    assert dataset.diff_stds.shape == (dataset.output_features_dim,)
+    # the inputs are normalized with the statistics of the dataset itself.
+    prev_inputs, _ = dataset[0]
+    assert np.abs(prev_inputs[..., : dataset.output_features_dim].mean()) < 1.0
@@ -0,0 +1,93 @@
+"""
+Tests for the IFSAnalisysDataset, on a small synthetic Zarr store.
+"""
+
+import pickle
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+import xarray as xr
+from torch.utils.data import DataLoader
+
+from graph_weather.data.IFSAnalysis_dataloader import IFS_MEAN, IFS_STD, IFSAnalisysDataset
+
+FEATURES = ["geopotential", "temperature", "specific_humidity"]
+
+
+@pytest.fixture
+def ifs_path(tmp_path):
+    rng = np.random.default_rng(0)
+    time = pd.date_range("2016-01-01", periods=11, freq="6h")
+    shape = (len(time), 3, 4, 8)
+    ds = xr.Dataset(
+        {
+            var: (
+                ("time", "level", "latitude", "longitude"),
+                (IFS_MEAN[var] + IFS_STD[var] * rng.normal(size=shape)).astype(np.float32),
+            )
+            for var in FEATURES
+        },
+        coords={"time": time, "level": [500, 850, 1000]},
+    )
+    path = str(tmp_path / "ifs.zarr")
+    ds.to_zarr(path)
+    return path
+
+
+def expected_timestep(path, idx):
+    ds = xr.open_zarr(path).isel(time=idx)
+    fields = np.stack(
+        [(ds[var].values - IFS_MEAN[var]) / (IFS_STD[var] + 1e-6) for var in FEATURES]
+    )
+    # [feature, level, lat, lon] -> [lat * lon, feature * level]
+    return fields.transpose(2, 3, 0, 1).reshape(32, -1)
+
+
+@pytest.mark.parametrize("chunk_size,prefetch", [(1, 0), (4, 0), (4, 2), (16, 1)])
+def test_ifs_dataset(ifs_path, chunk_size, prefetch):
+    dataset = IFSAnalisysDataset(
+        ifs_path, FEATURES, start_year=2016, end_year=2016, chunk_size=chunk_size, prefetch=prefetch
+    )
+    assert len(dataset) == 10
+    for idx in [0, 3, 4, 9, 2, -1]:
+        x, y = dataset[idx]
+        assert x.shape == y.shape == (32, 9) and x.dtype == torch.float32
+        idx = idx % len(dataset)
+        np.testing.assert_allclose(x.numpy(), expected_timestep(ifs_path, idx), rtol=1e-5)
+        np.testing.assert_allclose(y.numpy(), expected_timestep(ifs_path, idx + 1), rtol=1e-5)
+    with pytest.raises(IndexError):
+        dataset[10]
+
+
+def test_ifs_dataset_workers(ifs_path):
+    dataset = IFSAnalisysDataset(ifs_path, FEATURES, end_year=2016, chunk_size=3)
+    dataset[0]
+    # the prefetching threads and chunks are not pickled nor shared with the workers
+    assert pickle.loads(pickle.dumps(dataset))._chunks == {}
+    batches = list(DataLoader(dataset, batch_size=4, num_workers=2))
+    x = torch.cat([batch[0] for batch in batches])
+    assert x.shape == (10, 32, 9)
+    np.testing.assert_allclose(x[7].numpy(), expected_timestep(ifs_path, 7), rtol=1e-5)
+
+
+@pytest.mark.parametrize("chunk_size,prefetch", [(1, 0), (1, 2), (4, 2)])
+def test_ifs_dataset_shuffled_reads(ifs_path, monkeypatch, chunk_size, prefetch):
+    dataset = IFSAnalisysDataset(
+        ifs_path, FEATURES, end_year=2016, chunk_size=chunk_size, prefetch=prefetch
+    )
+    reads = []
+    read_chunk = dataset._read_chunk
+    monkeypatch.setattr(
+        dataset, "_read_chunk", lambda chunk: reads.append(chunk) or read_chunk(chunk)
+    )
+    sampler = torch.utils.data.RandomSampler(dataset, generator=torch.Generator().manual_seed(0))
+    for idx in sampler:
+        dataset[idx]
+    # nothing is read ahead when shuffled, every item reads at most the two chunks of its timesteps
+    assert all(not isinstance(value, Future) for value in dataset._chunks.values())
+    assert len(reads) <= 2 * len(dataset)
+    if chunk_size == 1:
+        assert len(reads) == 2 * len(dataset)
@@ -0,0 +1,76 @@
+"""
+Import-time regression tests.
+
+The packages import their public names lazily, so that importing graph_weather or one of its
+subpackages does not pull in the dependencies of all the models.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = [
+    "torch",
+    "torch_geometric",
+    "h3",
+    "einops",
+    "graph_weather.data.nnja_ai",
+    "graph_weather.models.fengwu_ghr",
+    "graph_weather.models.weathermesh",
+]
+
+
+def _import_times_us(statement: str) -> dict[str, tuple[int, int]]:
+    """Return the (self, cumulative) import times in microseconds, as reported by -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split("|")
+        if len(fields) == 3 and fields[0].split(":")[-1].strip().isdigit():
+            times[fields[2].strip()] = (int(fields[0].split(":")[1]), int(fields[1]))
+    return times
+
+
+@pytest.mark.parametrize(
+    "module,budget_us",
+    [
+        ("graph_weather", 50_000),
+        ("graph_weather.models", 50_000),
+        ("graph_weather.data", 50_000),
+        # includes the import of numpy.
+        ("graph_weather.data.const", 500_000),
+    ],
+)
+def test_import_time_budget(module, budget_us):
+    times = _import_times_us(f"import {module}")
+    _, cumulative = times[module]
+    assert cumulative < budget_us
+    assert not set(HEAVY_MODULES) & set(times)
+
+
+def test_const_import_time():
+    # parsing the python literals of the statistics took ~30ms, the lazy module only a few ms.
+    self_time, _ = _import_times_us("import graph_weather.data.const")["graph_weather.data.const"]
+    assert self_time < 10_000
+
+
+def test_lazy_public_names():
+    import graph_weather
+    import graph_weather.data
+    import graph_weather.models
+    from graph_weather.models.forecast import GraphWeatherForecaster
+    from graph_weather.models.layers.encoder import Encoder
+
+    assert graph_weather.GraphWeatherForecaster is GraphWeatherForecaster
+    assert graph_weather.models.Encoder is Encoder
+    assert "GraphWeatherAssimilator" in dir(graph_weather)
+    assert "AMSUDataset" in graph_weather.data.__all__
+    with pytest.raises(AttributeError):
+        graph_weather.models.UnknownModel
@@ -1,8 +1,11 @@
+from copy import deepcopy
+
 import h3
 import numpy as np
+import pytest
 import torch
 
-from graph_weather import GraphWeatherAssimilator, GraphWeatherForecaster
+from graph_weather import GraphWeatherAssimilator, GraphWeatherForecaster, IncrementalAssimilator
 from graph_weather.models import (
     AssimilatorDecoder,
     AssimilatorEncoder,
@@ -14,6 +17,7 @@ from graph_weather.models import (
     WrapperImageModel,
     WrapperMetaModel,
 )
+from graph_weather.models.fengwu_ghr.layers import knn_interpolate
 from graph_weather.models.losses import NormalizedMSELoss
 
 
@@ -63,6 +67,55 @@ def test_assimilation_encoder_uneven_grid():
     assert edge_idx.size() == (2, 41162 * 2)
 
 
+def test_assimilation_encoder_batched():
+    rng = np.random.default_rng(0)
+    model = AssimilatorEncoder(output_dim=32, output_edge_dim=32).eval()
+    # every sample has its own observations, with a different number of valid ones
+    lat_lon_heights = np.stack(
+        [rng.uniform(-90, 90, (3, 50)), rng.uniform(0, 360, (3, 50)), np.zeros((3, 50))], axis=-1
+    )
+    lat_lon_heights = torch.tensor(lat_lon_heights, dtype=torch.float)
+    mask = torch.ones((3, 50), dtype=torch.bool)
+    mask[1, 30:] = False
+    features = torch.randn((3, 50, 2))
+    with torch.no_grad():
+        x, edge_idx, edge_attr = model(features, lat_lon_heights, mask)
+        for i in range(3):
+            expected, _, _ = model(features[i : i + 1, mask[i]], lat_lon_heights[i, mask[i]])
+            torch.testing.assert_close(x[i * 5882 : (i + 1) * 5882], expected)
+    assert x.size() == (5882 * 3, 32)
+    assert edge_idx.size() == (2, 41162 * 3) and edge_idx.max() == 5882 * 3 - 1
+
+
+def test_assimilation_input_graph_cache():
+    rng = np.random.default_rng(0)
+    lat_lon_heights = torch.tensor(
+        np.stack([rng.uniform(-90, 90, 40), rng.uniform(-180, 360, 40), rng.random(40)], -1),
+        dtype=torch.float,
+    )
+    model = AssimilatorEncoder(output_dim=32, output_edge_dim=32, input_graph_cache_size=2)
+    graph = model.create_input_graph(None, lat_lon_heights)
+
+    # same graph as the h3 lookups of every observation
+    cells = sorted(h3.uncompact(h3.get_res0_indexes(), 2))
+    for i, (lat, lon, height) in enumerate(lat_lon_heights.tolist()):
+        cell = h3.geo_to_h3(lat, lon, 2)
+        distance = h3.point_dist((lat, lon), h3.h3_to_geo(cell), unit="rads")
+        assert graph.edge_index[1, i] == 40 + cells.index(cell)
+        np.testing.assert_allclose(
+            graph.edge_attr[i], [np.sin(distance), np.cos(distance), height], rtol=1e-5
+        )
+    assert graph.num_nodes == 40 + len(cells)
+
+    # fixed locations reuse their graph, other locations or masks do not
+    assert model.create_input_graph(None, lat_lon_heights.clone()) is graph
+    mask = torch.arange(40) < 30
+    assert model.create_input_graph(None, lat_lon_heights, mask).edge_index.shape == (2, 30)
+    assert model.create_input_graph(None, lat_lon_heights + 1) is not graph
+    assert (model.input_graph_hits, model.input_graph_misses) == (1, 3)
+    assert len(model._input_graphs) == 2
+
+
 def test_processor():
     processor = Processor().eval()
     lat_lons = []
@@ -136,6 +189,82 @@ def test_forecaster():
     out = model(features)
     assert not torch.isnan(out).any()
 
+def test_multi_mesh_encoder():
+    lat_lons = [(lat, lon) for lat in range(-90, 90, 5) for lon in range(0, 360, 5)]
+    model = Encoder(lat_lons, multi_mesh_levels=2).eval()
+    edge_index = model.latent_graph.edge_index
+    # the resolution 2 edges, then the edges of the resolutions 1 and 0
+    coarse_edges = edge_index[:, 41162:]
+    assert coarse_edges.shape[1] == 6 * (842 - 12) + 5 * 12 + 6 * (122 - 12) + 5 * 12
+    assert len(torch.unique(coarse_edges, dim=1).T) == coarse_edges.shape[1]
+    assert not (coarse_edges[0] == coarse_edges[1]).any()
+    # undirected, every coarse edge is in both directions
+    pairs = set(map(tuple, coarse_edges.T.tolist()))
+    assert pairs == {(j, i) for i, j in pairs}
+    # the coarse edges are longer than the resolution 2 edges
+    sin_distance = model.latent_graph.edge_attr[:, 0]
+    assert sin_distance[41162:].min() > sin_distance[:41162].max()
+
+    features = torch.randn((2, len(lat_lons), 78))
+    with torch.no_grad():
+        x, edge_idx, edge_attr = model(features)
+    out = Processor(num_blocks=1).eval()(x, edge_idx, edge_attr)
+    assert edge_idx.shape == (2, 2 * edge_index.shape[1])
+    assert out.shape == (2 * 5882, 256)
+
+
+def test_regional_forecaster():
+    lat_lons = [(lat, lon) for lat in range(30, 60, 2) for lon in range(0, 40, 2)]
+    model = GraphWeatherForecaster(
+        lat_lons, feature_dim=78, aux_dim=24, num_blocks=2, regional=True, halo=2
+    )
+    encoder, decoder = model.encoder, model.decoder
+    num_cells = len(encoder.base_h3_grid)
+    assert num_cells < h3.num_hexagons(2)
+    assert encoder.h3_nodes.shape[0] == num_cells
+    assert decoder.base_h3_grid == encoder.base_h3_grid
+    assert len(encoder.boundary_lat_lons) == len(encoder.boundary_nodes) > 0
+    # the lat/lon nodes are connected to the latent node of their cell
+    cells = [encoder.base_h3_grid[i] for i in encoder.graph.edge_index[1] - len(lat_lons)]
+    assert cells == encoder.h3_grid
+    assert encoder.latent_graph.edge_index.max() == num_cells - 1
+
+    features = torch.randn((2, len(lat_lons), 78 + 24))
+    boundary = torch.randn((2, len(encoder.boundary_nodes), 78 + 24))
+    with torch.no_grad():
+        x, _, _ = encoder(features, boundary)
+        out = model(features, boundary)
+    assert x.shape == (2 * num_cells, 256)
+    assert out.shape == (2, len(lat_lons), 78)
+    assert not torch.isnan(out).any()
+    with pytest.raises(ValueError):
+        encoder(features, boundary[:, 1:])
+
+
+def test_reordered_forecaster():
+    lat_lons = [(lat, lon) for lat in range(-90, 90, 5) for lon in range(0, 360, 5)]
+    lat_lons = [lat_lons[i] for i in np.random.default_rng(0).permutation(len(lat_lons))]
+    kwargs = dict(feature_dim=4, aux_dim=0, node_dim=32, edge_dim=32, num_blocks=2)
+    kwargs.update(hidden_dim_processor_node=32, hidden_dim_processor_edge=32)
+    model = GraphWeatherForecaster(lat_lons, apply_constraints=False, **kwargs).eval()
+    reordered = GraphWeatherForecaster(
+        lat_lons, apply_constraints=False, reorder=True, **kwargs
+    ).eval()
+    reordered.load_state_dict(model.state_dict())
+    for graph in (reordered.encoder.graph, reordered.encoder.latent_graph, reordered.decoder.graph):
+        senders, receivers = graph.edge_index
+        key = receivers * (graph.edge_index.max() + 1) + senders
+        assert (key[1:] > key[:-1]).all()
+    # the lat/lon nodes of an H3 node are contiguous
+    senders, receivers = reordered.encoder.graph.edge_index
+    assert (receivers[1:] >= receivers[:-1]).all()
+    assert (senders == torch.arange(len(lat_lons))).all()
+
+    features = torch.randn((2, len(lat_lons), 4))
+    with torch.no_grad():
+        assert torch.allclose(reordered(features), model(features), atol=1e-5)
+
+
 def test_assimilator_model():
     obs_lat_lons = []
     for lat in range(-90, 90, 7):
@@ -157,6 +286,91 @@ def test_assimilator_model():
     assert not torch.isnan(out).any()
 
 
+def test_incremental_assimilator():
+    rng = np.random.default_rng(0)
+    output_lat_lons = [(lat, lon) for lat in range(-90, 90, 10) for lon in range(0, 360, 10)]
+    model = GraphWeatherAssimilator(
+        output_lat_lons=output_lat_lons,
+        analysis_dim=4,
+        node_dim=32,
+        edge_dim=32,
+        num_blocks=2,
+        hidden_dim_processor_node=32,
+        hidden_dim_processor_edge=32,
+    ).eval()
+    # a global batch of observations, then two regional updates
+    lat_lon_heights = torch.tensor(
+        np.concatenate(
+            [
+                np.stack([rng.uniform(-90, 90, 200), rng.uniform(0, 360, 200)], -1),
+                np.stack([rng.uniform(40, 50, 40), rng.uniform(0, 10, 40)], -1),
+                np.stack([rng.uniform(-20, -10, 40), rng.uniform(100, 110, 40)], -1),
+            ]
+        ),
+        dtype=torch.float,
+    )
+    lat_lon_heights = torch.cat([lat_lon_heights, torch.zeros(280, 1)], dim=1)
+    features = torch.randn((1, 280, 2))
+    updates = [slice(0, 200), slice(200, 240), slice(240, 280)]
+
+    full = IncrementalAssimilator(model)
+    for update in updates:
+        analysis = full.update(features[:, update], lat_lon_heights[update])
+    with torch.no_grad():
+        expected = model(features, lat_lon_heights)
+    torch.testing.assert_close(analysis, expected, rtol=1e-4, atol=1e-4)
+    cells = {h3.geo_to_h3(lat, lon, 2) for lat, lon, _ in lat_lon_heights[240:].tolist()}
+    assert len(full.changed_nodes) == len(cells)
+
+    local = IncrementalAssimilator(model, k_hops=2)
+    previous = local.update(features[:, :240], lat_lon_heights[:240]).clone()
+    analysis = local.update(features[:, 240:], lat_lon_heights[240:])
+    assert 0 < len(local.updated_nodes) < 5882
+    # only the output points around the new observations are updated
+    changed = (analysis != previous).any(dim=-1)[0]
+    changed_lat_lons = np.array(output_lat_lons)[changed.numpy()]
+    assert 0 < len(changed_lat_lons) < len(output_lat_lons) / 10
+    assert np.all(changed_lat_lons[:, 0] < 10) and np.all(changed_lat_lons[:, 1] > 80)
+
+
+def test_incremental_assimilator_reordered_decoder():
+    rng = np.random.default_rng(0)
+    output_lat_lons = [(lat, lon) for lat in range(-90, 90, 10) for lon in range(0, 360, 10)]
+    kwargs = dict(analysis_dim=4, node_dim=32, edge_dim=32, num_blocks=2)
+    kwargs.update(hidden_dim_processor_node=32, hidden_dim_processor_edge=32)
+    model = GraphWeatherAssimilator(output_lat_lons=output_lat_lons, **kwargs).eval()
+    reordered = deepcopy(model)
+    reordered.decoder = AssimilatorDecoder(
+        lat_lons=output_lat_lons,
+        resolution=2,
+        input_dim=32,
+        output_dim=4,
+        output_edge_dim=32,
+        hidden_dim_processor_node=32,
+        hidden_dim_processor_edge=32,
+        reorder=True,
+    ).eval()
+    reordered.decoder.load_state_dict(model.decoder.state_dict())
+    lat_lon_heights = torch.tensor(
+        np.concatenate(
+            [
+                np.stack([rng.uniform(-90, 90, 200), rng.uniform(0, 360, 200), np.zeros(200)], -1),
+                np.stack([rng.uniform(40, 50, 40), rng.uniform(0, 10, 40), np.zeros(40)], -1),
+            ]
+        ),
+        dtype=torch.float,
+    )
+    features = torch.randn((1, 240, 2))
+
+    # the k-hop updates write the decoded points in the order of output_lat_lons
+    local = IncrementalAssimilator(model, k_hops=2)
+    local_reordered = IncrementalAssimilator(reordered, k_hops=2)
+    for update in [slice(0, 200), slice(200, 240)]:
+        expected = local.update(features[:, update], lat_lon_heights[update])
+        analysis = local_reordered.update(features[:, update], lat_lon_heights[update])
+        torch.testing.assert_close(analysis, expected, rtol=1e-4, atol=1e-4)
+
+
 def test_forecaster_and_loss():
     lat_lons = []
     for lat in range(-90, 90, 5):
@@ -344,6 +558,25 @@ def test_meta_model():
     assert out.size() == features.size()
 
 
+def test_meta_model_cached_interpolation():
+    lat_lons = [(lat, lon) for lat in range(-90, 90, 5) for lon in range(0, 360, 5)]
+    model = MetaModel(
+        lat_lons, image_size=20, patch_size=4, depth=1, heads=1, mlp_dim=7, channels=3
+    )
+    assert "to_image.weights" not in model.state_dict()
+    x = torch.randn((len(lat_lons), 6), requires_grad=True)
+    expected = knn_interpolate(x, model.pos_x, model.pos_y)
+    assert torch.allclose(model.to_image(x), expected, atol=1e-5)
+    image = torch.randn((20 * 20, 6))
+    expected = knn_interpolate(image, model.pos_y, model.pos_x)
+    assert torch.allclose(model.to_points(image), expected, atol=1e-5)
+
+    model.to_image(x).sum().backward()
+    assert x.grad is not None
+    copy = deepcopy(model)
+    assert torch.allclose(copy.to_image(x), model.to_image(x))
+
+
 def test_wrapper_meta_model():
     lat_lons = []
     for lat in range(-90, 90, 5):
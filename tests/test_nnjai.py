@@ -7,8 +7,11 @@ This file contains unit tests for AMSUDataset and collate_fn functions.
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pandas as pd
 import pytest
 import torch
+from torch.utils.data import DataLoader
 
 from graph_weather.data.nnja_ai import AMSUDataset, collate_fn
 
@@ -21,29 +24,20 @@ def mock_datacatalog():
 
     This mock provides a mock dataset with predefined columns and values.
     """
-    with patch("graph_weather.data.nnjai_wrapp.DataCatalog") as mock:
+    with patch("graph_weather.data.nnja_ai.DataCatalog", create=True) as mock:
         # Mock dataset structure
-        mock_df = MagicMock()
-        mock_df.columns = ["OBS_TIMESTAMP", "LAT", "LON", "TMBR_00001", "TMBR_00002"]
-
-        # Define a mock row
-        class MockRow:
-            def __getitem__(self, key):
-                data = {
-                    "OBS_TIMESTAMP": datetime.now(),
-                    "LAT": 45.0,
-                    "LON": -120.0,
-                    "TMBR_00001": 250.0,
-                    "TMBR_00002": 260.0,
-                }
-                return data.get(key, None)
+        num_obs = 100
+        mock_df = pd.DataFrame(
+            {
+                "OBS_TIMESTAMP": pd.date_range("2021-01-01", periods=num_obs, freq="s"),
+                "LAT": np.linspace(-90, 90, num_obs),
+                "LON": np.linspace(-180, 180, num_obs),
+                "TMBR_00001": np.full(num_obs, 250.0),
+                "TMBR_00002": np.arange(num_obs, dtype=np.float64),
+            }
+        )
 
         # Configure mock dataset
-        mock_row = MockRow()
-        mock_df.iloc = MagicMock()
-        mock_df.iloc.__getitem__.return_value = mock_row
-        mock_df.__len__.return_value = 100
-
         mock_dataset = MagicMock()
         mock_dataset.load_dataset.return_value = mock_df
         mock_dataset.sel.return_value = mock_dataset
@@ -94,6 +88,33 @@ def test_amsu_dataset(mock_datacatalog):
         len(additional_variables),
     ), f"Metadata shape mismatch. Expected ({len(additional_variables)},)."
     assert item["metadata"].dtype == torch.float32, "Metadata should have dtype float32."
+    assert item["timestamp"] == pd.Timestamp("2021-01-01").timestamp()
+    assert item["latitude"] == -90.0
+
+
+def test_amsu_dataset_batches(mock_datacatalog):
+    """
+    Test that the batches sliced by __getitems__ match the items of __getitem__.
+    """
+    dataset = AMSUDataset(
+        "amsua-1bamua-NC021023",
+        "2021-01-01 00Z",
+        ["OBS_TIMESTAMP", "LAT", "LON"],
+        ["TMBR_00001", "TMBR_00002"],
+    )
+    for indices in [[3, 4, 5, 6], [10, 2, 7], [-2, -1]]:
+        batch = dataset.__getitems__(indices)
+        expected = collate_fn([dataset[i] for i in indices])
+        assert batch.keys() == expected.keys()
+        for key in batch:
+            torch.testing.assert_close(batch[key], expected[key])
+
+    loader = DataLoader(dataset, batch_size=32, shuffle=True, collate_fn=collate_fn)
+    batches = list(loader)
+    assert [len(batch["timestamp"]) for batch in batches] == [32, 32, 32, 4]
+    assert batches[0]["metadata"].shape == (32, 2)
+    metadata = torch.cat([batch["metadata"][:, 1] for batch in batches])
+    assert sorted(metadata.tolist()) == list(range(100))
 
 
 def test_collate_function():
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+import torch
+
+from graph_weather.data import const, normalization
+
+
+def test_normalization_tables():
+    era5_means = normalization.get_table("ERA5_MEANS")
+    assert era5_means["geopotential"].shape == (13,)
+    assert era5_means["geopotential"].dtype == np.float32
+    assert isinstance(era5_means["2m_temperature"], float)
+    assert normalization.get_table("ERA5_MEANS") is era5_means
+    assert isinstance(normalization.get_table("SOLAR_MEAN"), float)
+    assert "FORECAST_GROUPED_MEANS" in normalization.available_tables()
+    with pytest.raises(KeyError):
+        normalization.get_table("UNKNOWN")
+
+    # const is a lazy view on the registry
+    assert const.ERA5_MEANS is era5_means
+    assert const.SOLAR_STD == normalization.get_table("SOLAR_STD")
+    with pytest.raises(AttributeError):
+        const.UNKNOWN
+
+
+def test_normalization_get_stats():
+    variables = ["temperature", "2m_temperature", "land_sea_mask"]
+    stats = normalization.get_stats("ERA5_MEANS", variables)
+    assert stats.shape == (15,) and stats.dtype == np.float32
+    np.testing.assert_array_equal(stats[:13], const.ERA5_MEANS["temperature"])
+    assert stats[13] == np.float32(const.ERA5_MEANS["2m_temperature"])
+
+    tensor = normalization.get_stats("ERA5_STD", variables, as_tensor=True)
+    assert isinstance(tensor, torch.Tensor) and tensor.shape == (15,)
+
+
+def test_forecast_grouped_stats():
+    grouped = normalization.get_table("FORECAST_GROUPED_MEANS")
+    # pressure level statistics are averaged over the levels
+    tmp_mb = [
+        value
+        for var, value in const.FORECAST_MEANS.items()
+        if "mb" in var and "TMP" in var and "-" not in var
+    ]
+    np.testing.assert_allclose(grouped["TMP_mb"], np.mean(tmp_mb), rtol=1e-6)
+    assert grouped["TMP"] == const.FORECAST_MEANS["TMP.surface"]
+    max_wind = [
+        const.FORECAST_MEANS[var] for var in sorted(const.FORECAST_MEANS) if "max_wind" in var
+    ]
+    np.testing.assert_allclose(grouped["max_wind"], max_wind, rtol=1e-6)
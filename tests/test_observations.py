@@ -0,0 +1,164 @@
+"""
+Tests for the observation pipeline of the assimilator.
+"""
+
+import h3
+import numpy as np
+import pytest
+import torch
+
+from graph_weather import GraphWeatherAssimilator
+from graph_weather.data.h3_grid import cell_indices, h3_cells
+from graph_weather.data.observations import (
+    ObservationBucketer,
+    bucket_size,
+    collate_windows,
+    superobservations,
+    time_windows,
+)
+
+WINDOW = 6 * 3600
+
+
+@pytest.fixture
+def observations():
+    rng = np.random.default_rng(0)
+    num_obs = 300
+    # 100 observations in the first window, 200 in the third one
+    timestamps = np.concatenate(
+        [rng.uniform(0, WINDOW, 100), rng.uniform(2 * WINDOW, 3 * WINDOW, 200)]
+    )
+    return {
+        "timestamp": torch.from_numpy(timestamps),
+        "latitude": torch.from_numpy(rng.uniform(-90, 90, num_obs)).float(),
+        "longitude": torch.from_numpy(rng.uniform(-180, 180, num_obs)).float(),
+        "metadata": torch.from_numpy(rng.normal(size=(num_obs, 2))).float(),
+    }
+
+
+def test_cell_indices():
+    rng = np.random.default_rng(0)
+    latitudes, longitudes = rng.uniform(-90, 90, 500), rng.uniform(-180, 360, 500)
+    cells = h3_cells(2)
+    expected = [cells.index(h3.geo_to_h3(lat, lon, 2)) for lat, lon in zip(latitudes, longitudes)]
+    np.testing.assert_array_equal(cell_indices(latitudes, longitudes, 2), expected)
+
+
+def test_time_windows_and_buckets():
+    np.testing.assert_array_equal(time_windows([0.0, 10.0, 25.0, -1.0], 10.0), [0, 1, 2, -1])
+    np.testing.assert_array_equal(time_windows([5.0, 15.0], 10.0, origin=5.0), [0, 1])
+    assert bucket_size(1, (8, 32)) == 8
+    assert bucket_size(32, (8, 32)) == 32
+    assert bucket_size(33, (8, 32)) == 64
+
+
+def test_observation_bucketer(observations):
+    bucketer = ObservationBucketer(window_seconds=WINDOW, bucket_sizes=(128, 256))
+    windows = bucketer(observations)
+    assert [w["window_start"] for w in windows] == [0.0, 2 * WINDOW]
+    assert [w["num_observations"] for w in windows] == [100, 200]
+    assert [w["features"].shape for w in windows] == [(1, 128, 3), (1, 256, 3)]
+
+    window = windows[1]
+    n = window["num_observations"]
+    assert window["mask"].sum() == n and not window["mask"][n:].any()
+    assert torch.all(window["cell_index"][1:n] >= window["cell_index"][: n - 1])
+    np.testing.assert_array_equal(
+        window["cell_index"][:n],
+        cell_indices(window["lat_lon_heights"][:n, 0], window["lat_lon_heights"][:n, 1], 2),
+    )
+    relative_time = window["features"][0, :n, -1]
+    assert torch.all((relative_time >= 0) & (relative_time < 1))
+    # the channels are moved with their observations
+    latitudes = observations["latitude"]
+    for i in range(0, n, 37):
+        source = torch.nonzero(latitudes == window["lat_lon_heights"][i, 0])[0, 0]
+        torch.testing.assert_close(window["features"][0, i, :2], observations["metadata"][source])
+
+    with pytest.raises(ValueError):
+        ObservationBucketer(bucket_sizes=(256, 128))
+
+
+def test_assimilator_padded_window(observations):
+    output_lat_lons = [(lat, lon) for lat in range(-90, 90, 30) for lon in range(0, 360, 30)]
+    model = GraphWeatherAssimilator(
+        output_lat_lons=output_lat_lons, observation_dim=3, analysis_dim=4, num_blocks=1
+    ).eval()
+    window = ObservationBucketer(window_seconds=WINDOW, bucket_sizes=(128,))(observations)[0]
+    n = window["num_observations"]
+    with torch.no_grad():
+        padded = model(
+            window["features"], window["lat_lon_heights"], window["mask"], window["cell_index"]
+        )
+        unpadded = model(window["features"][:, :n], window["lat_lon_heights"][:n])
+    assert padded.shape == (1, len(output_lat_lons), 4)
+    # the precomputed cells are used, the padding observations are kept as nodes without edges
+    graph = model.encoder.create_input_graph(
+        None, window["lat_lon_heights"], window["mask"], window["cell_index"]
+    )
+    assert graph.num_nodes == 128 + 5882 and graph.edge_index.shape == (2, n)
+    torch.testing.assert_close(graph.edge_index[1] - 128, window["cell_index"][:n])
+    # the padding observations are not connected to the H3 nodes
+    torch.testing.assert_close(padded, unpadded, rtol=1e-4, atol=1e-4)
+
+
+def test_superobservations():
+    rng = np.random.default_rng(0)
+    # a dense swath: 400 observations around 4 points, in 2 time bins
+    centers = np.array([[10.0, 20.0], [-30.0, 100.0], [60.0, -170.0], [0.0, 179.9]])
+    point = rng.integers(0, 4, 400)
+    latitudes = centers[point, 0] + rng.normal(scale=0.01, size=400)
+    longitudes = centers[point, 1] + rng.normal(scale=0.01, size=400)
+    timestamps = rng.choice([100.0, 4000.0], 400)
+    channels = rng.normal(size=(400, 2))
+    channels[::10, 1] = np.nan
+    thinned = superobservations(
+        {
+            "timestamp": timestamps,
+            "latitude": latitudes,
+            "longitude": longitudes,
+            "metadata": channels,
+        },
+        bin_seconds=3600,
+    )
+    assert len(thinned["timestamp"]) == 8
+    assert thinned["metadata"].shape == (8, 6)
+    assert thinned["count"][:, 0].sum() == 400
+    assert thinned["count"][:, 1].sum() == 360
+
+    # every super-observation matches the statistics of its group
+    for i in range(8):
+        group = (np.abs(latitudes - thinned["latitude"][i]) < 0.1) & (
+            timestamps == thinned["timestamp"][i]
+        )
+        values = channels[group]
+        np.testing.assert_allclose(thinned["metadata"][i, :2], np.nanmean(values, axis=0))
+        np.testing.assert_allclose(thinned["variance"][i], np.nanvar(values, axis=0), atol=1e-12)
+        np.testing.assert_allclose(thinned["metadata"][i, 2:4], np.log1p(thinned["count"][i]))
+        np.testing.assert_allclose(
+            thinned["longitude"][i] % 360, longitudes[group].mean() % 360, atol=0.01
+        )
+
+    # the super-observations feed the bucketer
+    windows = ObservationBucketer(bucket_sizes=(16,))(thinned)
+    assert windows[0]["features"].shape == (1, 16, 7)
+
+
+def test_assimilator_batched_windows(observations):
+    output_lat_lons = [(lat, lon) for lat in range(-90, 90, 30) for lon in range(0, 360, 30)]
+    model = GraphWeatherAssimilator(
+        output_lat_lons=output_lat_lons, observation_dim=3, analysis_dim=4, num_blocks=1
+    ).eval()
+    windows = ObservationBucketer(window_seconds=WINDOW, bucket_sizes=(128, 256))(observations)
+    batch = collate_windows(windows)
+    assert batch["features"].shape == (2, 256, 3)
+    assert batch["mask"].sum(dim=1).tolist() == [100, 200]
+    with torch.no_grad():
+        batched = model(
+            batch["features"], batch["lat_lon_heights"], batch["mask"], batch["cell_index"]
+        )
+        separate = torch.cat(
+            [model(w["features"], w["lat_lon_heights"], w["mask"]) for w in windows]
+        )
+    assert batched.shape == (2, len(output_lat_lons), 4)
+    torch.testing.assert_close(batched, separate, rtol=1e-4, atol=1e-4)
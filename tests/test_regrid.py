@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+import torch
+import xarray as xr
+
+from graph_weather.data.h3_grid import h3_cells
+from graph_weather.data.regrid import (
+    Regridder,
+    h3_regridder,
+    latlon_regridder,
+    latlon_weights,
+)
+
+
+@pytest.fixture
+def grid():
+    # descending latitudes, as in ERA5
+    lats = np.linspace(87.5, -87.5, 36)
+    lons = np.arange(0.0, 360.0, 5.0)
+    rng = np.random.default_rng(0)
+    fields = rng.standard_normal((2, len(lats) * len(lons), 3)).astype(np.float32)
+    return lats, lons, fields
+
+
+def test_bilinear_matches_xarray_interp(grid):
+    lats, lons, fields = grid
+    dst_lats = np.linspace(-80, 80, 17)
+    dst_lons = np.arange(1.0, 350.0, 7.0)
+    regridder = latlon_regridder(lats, lons, dst_lats, dst_lons, method="bilinear")
+    assert regridder.shape == (len(dst_lats) * len(dst_lons), len(lats) * len(lons))
+
+    field = fields[0, :, 0].reshape(len(lats), len(lons))
+    expected = (
+        xr.DataArray(field, coords={"latitude": lats, "longitude": lons})
+        .interp(latitude=dst_lats, longitude=dst_lons)
+        .values.ravel()
+    )
+    np.testing.assert_allclose(regridder(fields[0, :, 0]), expected, rtol=1e-5, atol=1e-5)
+
+    # periodic longitudes
+    wrapped = latlon_weights(lats, lons, lats, [357.5], method="bilinear")
+    np.testing.assert_allclose(wrapped @ fields[0, :, 0], (field[:, -1] + field[:, 0]) / 2)
+
+
+def test_conservative_weights(grid):
+    lats, lons, fields = grid
+    dst_lats = np.linspace(85, -85, 18)
+    dst_lons = np.arange(0.0, 360.0, 10.0) + 2.5
+    regridder = latlon_regridder(lats, lons, dst_lats, dst_lons)
+
+    # constant fields are preserved and the global area-weighted mean is conserved
+    np.testing.assert_allclose(regridder.weights.sum(axis=1), 1.0, rtol=1e-6)
+    src_area = np.repeat(np.cos(np.radians(lats)), len(lons))
+    dst_area = np.repeat(
+        np.diff(-np.sin(np.radians(np.linspace(90, -90, len(dst_lats) + 1)))), len(dst_lons)
+    )
+    field = fields[0, :, 0].astype(np.float64)
+    np.testing.assert_allclose(
+        np.average(regridder(field), weights=dst_area),
+        np.average(field, weights=src_area),
+        atol=1e-3,
+    )
+
+    # along the longitudes, a coarsening by 2 is the mean of the pairs of cells
+    weights = latlon_weights([0.0], lons, [0.0], lons[::2] + 2.5).toarray()
+    np.testing.assert_allclose(weights[0, :2], 0.5)
+
+    with pytest.raises(ValueError):
+        latlon_weights(lats, lons, dst_lats, dst_lons, method="nearest")
+
+
+def test_regridder_batches_and_devices(grid):
+    lats, lons, fields = grid
+    regridder = latlon_regridder(lats, lons, lats[::2], lons[::2])
+    expected = np.stack([regridder(fields[b]) for b in range(len(fields))])
+    output = regridder(fields, dim=1)
+    assert output.shape == (2, regridder.shape[0], 3)
+    np.testing.assert_allclose(output, expected, rtol=1e-6)
+
+    tensor = regridder(torch.from_numpy(fields), dim=1)
+    assert isinstance(tensor, torch.Tensor) and tensor.dtype == torch.float32
+    np.testing.assert_allclose(tensor.numpy(), expected, rtol=1e-5, atol=1e-6)
+
+    with pytest.raises(ValueError):
+        regridder(fields, dim=2)
+
+
+def test_regridder_storage(grid, tmp_path):
+    lats, lons, fields = grid
+    path = str(tmp_path / "weights.npz")
+    regridder = latlon_regridder(lats, lons, lats[::3], lons[::3], path=path)
+    loaded = latlon_regridder(lats, lons, lats[::3], lons[::3], path=path)
+    assert (loaded.weights != regridder.weights).nnz == 0
+    # other grids are recomputed and overwrite the file
+    other = latlon_regridder(lats, lons, lats[::2], lons[::2], path=path)
+    assert other.shape != regridder.shape
+    assert Regridder.load(path).shape == other.shape
+    assert Regridder.load(str(tmp_path / "missing.npz")) is None
+
+
+def test_h3_regridder(grid):
+    lats, lons, _ = grid
+    lat_lons = np.array(np.meshgrid(lats, lons)).T.reshape((-1, 2))
+    num_cells = len(h3_cells(1))
+    to_h3 = h3_regridder(lat_lons[:, 0], lat_lons[:, 1], resolution=1)
+    to_latlon = h3_regridder(lat_lons[:, 0], lat_lons[:, 1], resolution=1, to_h3=False)
+    assert to_h3.shape == (num_cells, len(lat_lons))
+    assert to_latlon.shape == (len(lat_lons), num_cells)
+
+    # the cells with points average them, and a constant field is preserved both ways
+    cells = to_h3(np.ones(len(lat_lons), dtype=np.float32))
+    assert set(np.round(cells, 5)) <= {0.0, 1.0}
+    np.testing.assert_allclose(to_latlon(cells), 1.0, rtol=1e-6)
@@ -0,0 +1,86 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+
+from graph_weather.data.solar import (
+    SolarIrradianceCache,
+    extraterrestrial_irradiance,
+    irradiance_window,
+)
+
+
+@pytest.fixture
+def locations():
+    rng = np.random.default_rng(0)
+    return rng.uniform(-90, 90, 20), rng.uniform(-180, 360, 20)
+
+
+def test_irradiance_matches_pysolar(locations):
+    extraterrestrial_irrad = pytest.importorskip("pysolar.util").extraterrestrial_irrad
+    latitudes, longitudes = locations
+    times = pd.date_range("2016-01-01 00:37", periods=30, freq="317min", tz="UTC")
+    expected = np.array(
+        [
+            [
+                extraterrestrial_irrad(
+                    latitude_deg=lat, longitude_deg=lon, when=time.to_pydatetime()
+                )
+                for lat, lon in zip(latitudes, longitudes)
+            ]
+            for time in times
+        ]
+    )
+    irradiance = extraterrestrial_irradiance(times, latitudes, longitudes)
+    assert irradiance.shape == (len(times), len(latitudes))
+    np.testing.assert_allclose(irradiance, expected, atol=1e-6)
+
+    # naive datetime64 timestamps are in UTC, tensors are computed with torch
+    irradiance_tensor = extraterrestrial_irradiance(
+        times.tz_localize(None).values, torch.from_numpy(latitudes), torch.from_numpy(longitudes)
+    )
+    assert isinstance(irradiance_tensor, torch.Tensor)
+    np.testing.assert_allclose(irradiance_tensor.numpy(), expected, atol=1e-6)
+
+
+def test_irradiance_window(locations):
+    latitudes, longitudes = locations
+    time = pd.Timestamp("2016-06-01 06:00")
+    window = irradiance_window(time, latitudes, longitudes)
+    assert window.shape == (26, len(latitudes))
+    np.testing.assert_array_equal(window[0], window[13])
+    np.testing.assert_array_equal(
+        window[1],
+        extraterrestrial_irradiance([time - pd.Timedelta("12h")], latitudes, longitudes)[0],
+    )
+    assert (window >= 0).all()
+
+
+@pytest.mark.parametrize("use_path", [False, True])
+def test_solar_irradiance_cache(locations, tmp_path, use_path):
+    latitudes, longitudes = locations
+    path = str(tmp_path / "solar") if use_path else None
+    cache = SolarIrradianceCache(
+        latitudes, longitudes, start="2016-01-01", end="2016-01-03", path=path, dtype=np.float64
+    )
+    assert cache.table.shape == (2 * 24 + 1 + 2 * 12, len(latitudes))
+    if use_path:
+        assert isinstance(cache.table, np.memmap)
+        # the store is reused, and the workers receive the path and not the table
+        assert SolarIrradianceCache(
+            latitudes, longitudes, start="2016-01-01", end="2016-01-03", path=path, dtype=np.float64
+        )._is_valid_store()
+        assert pickle.loads(pickle.dumps(cache))._table is None
+
+    # on the hour in the range, off the hour and out of the range
+    for time in ["2016-01-02 05:00", "2016-01-01 00:00", "2016-01-02 05:30", "2016-02-01 00:00"]:
+        window = cache.window(time)
+        np.testing.assert_allclose(
+            window, irradiance_window(time, latitudes, longitudes), atol=1e-9
+        )
+    # the time itself is also in the window, i.e. 25 unique timestamps
+    assert cache.lru.misses == 2 * 25
+    cache.window("2016-01-02 05:30")
+    assert cache.lru.hits == 25
@@ -9,16 +9,13 @@ import torch
 import torch.optim as optim
 import xarray as xr
 from datasets import Array2D, Array3D, Features, Sequence, Value
-from pysolar.util import extraterrestrial_irrad
 from torch.utils.data import DataLoader, IterableDataset
 
 from graph_weather import GraphWeatherForecaster
-from graph_weather.data import const
+from graph_weather.data import const, normalization
+from graph_weather.data.solar import SolarIrradianceCache
 from graph_weather.models.losses import NormalizedMSELoss
 
-const.FORECAST_MEANS = {var: np.asarray(value) for var, value in const.FORECAST_MEANS.items()}
-const.FORECAST_STD = {var: np.asarray(value) for var, value in const.FORECAST_STD.items()}
-
 
 def worker_init_fn(worker_id):
     """
@@ -33,129 +30,19 @@ def worker_init_fn(worker_id):
     np.random.seed(np.random.get_state()[1][0] + worker_id)
 
 
-def get_mean_stds():  # noqa: D103
-    names = [
-        "CLMR",
-        "GRLE",
-        "VVEL",
-        "VGRD",
-        "UGRD",
-        "O3MR",
-        "CAPE",
-        "TMP",
-        "PLPL",
-        "DZDT",
-        "CIN",
-        "HGT",
-        "RH",
-        "ICMR",
-        "SNMR",
-        "SPFH",
-        "RWMR",
-        "TCDC",
-        "ABSV",
-    ]
-    means = {}
-    stds = {}
-    # For pressure level values
-    for n in names:
-        if (
-            len(
-                sorted(
-                    [
-                        float(var.split(".", 1)[-1].split("_")[0])
-                        for var in const.FORECAST_MEANS
-                        if "mb" in var and n in var and "-" not in var
-                    ]
-                )
-            )
-            > 0
-        ):
-            means[n + "_mb"] = []
-            stds[n + "_mb"] = []
-            for value in sorted(
-                [
-                    float(var.split(".", 1)[-1].split("_")[0])
-                    for var in const.FORECAST_MEANS
-                    if "mb" in var and n in var and "-" not in var
-                ]
-            ):
-                # Is floats now, but will be fixed
-                if value >= 1:
-                    value = int(value)
-                var_name = f"{n}.{value}_mb"
-                # print(var_name)
-
-                means[n + "_mb"].append(const.FORECAST_MEANS[var_name])
-                stds[n + "_mb"].append(const.FORECAST_STD[var_name])
-            means[n + "_mb"] = np.mean(np.stack(means[n + "_mb"], axis=-1))
-            stds[n + "_mb"] = np.mean(np.stack(stds[n + "_mb"], axis=-1))
-
-    # For surface values
-    for n in list(
-        set(
-            [
-                var.split(".", 1)[0]
-                for var in const.FORECAST_MEANS
-                if "surface" in var
-                and "level" not in var
-                and "2e06" not in var
-                and "below" not in var
-                and "atmos" not in var
-                and "tropo" not in var
-                and "iso" not in var
-                and "planetary_boundary_layer" not in var
-            ]
-        )
-    ):
-        means[n] = const.FORECAST_MEANS[n + ".surface"]
-        stds[n] = const.FORECAST_STD[n + ".surface"]
-
-    # For Cloud levels
-    for n in list(
-        set(
-            [
-                var.split(".", 1)[0]
-                for var in const.FORECAST_MEANS
-                if "sigma" not in var
-                and "level" not in var
-                and "2e06" not in var
-                and "below" not in var
-                and "atmos" not in var
-                and "tropo" not in var
-                and "iso" not in var
-                and "planetary_boundary_layer" not in var
-            ]
-        )
-    ):
-        if "LCDC" in n:  # or "MCDC" in n or "HCDC" in n:
-            means[n] = const.FORECAST_MEANS["LCDC.low_cloud_layer"]
-            stds[n] = const.FORECAST_STD["LCDC.low_cloud_layer"]
-        if "MCDC" in n:  # or "HCDC" in n:
-            means[n] = const.FORECAST_MEANS["MCDC.middle_cloud_layer"]
-            stds[n] = const.FORECAST_STD["MCDC.middle_cloud_layer"]
-        if "HCDC" in n:
-            means[n] = const.FORECAST_MEANS["HCDC.high_cloud_layer"]
-            stds[n] = const.FORECAST_STD["HCDC.high_cloud_layer"]
+def get_mean_stds():
+    """
+    Return the means and standard deviations of the forecast variables, grouped by variable.
 
-    # Now for each of these
-    means["max_wind"] = []
-    stds["max_wind"] = []
-    for n in sorted([var for var in const.FORECAST_MEANS if "max_wind" in var]):
-        means["max_wind"].append(const.FORECAST_MEANS[n])
-        stds["max_wind"].append(const.FORECAST_STD[n])
-    means["max_wind"] = np.stack(means["max_wind"], axis=-1)
-    stds["max_wind"] = np.stack(stds["max_wind"], axis=-1)
+    The grouped statistics are precomputed in the normalization registry.
 
-    for i in [2, 10, 20, 30, 40, 50, 80, 100]:
-        means[f"{i}m_above_ground"] = []
-        stds[f"{i}m_above_ground"] = []
-        for n in sorted([var for var in const.FORECAST_MEANS if f"{i}_m_above_ground" in var]):
-            means[f"{i}m_above_ground"].append(const.FORECAST_MEANS[n])
-            stds[f"{i}m_above_ground"].append(const.FORECAST_STD[n])
-        means[f"{i}m_above_ground"] = np.stack(means[f"{i}m_above_ground"], axis=-1)
-        stds[f"{i}m_above_ground"] = np.stack(stds[f"{i}m_above_ground"], axis=-1)
-    return means, stds
+    Returns:
+        means and standard deviations dict for forecast variables
+    """
+    return (
+        normalization.get_table("FORECAST_GROUPED_MEANS"),
+        normalization.get_table("FORECAST_GROUPED_STD"),
+    )
 
 
 class XrDataset(IterableDataset):
@@ -360,6 +247,7 @@ class XrDataset(IterableDataset):
         self.means, self.stds = get_mean_stds()
         self.landsea = xr.open_zarr("/home/bieker/Downloads/landsea.zarr", consolidated=True).load()
         self.landsea_fixed = None
+        self.solar_cache = None
 
     def __iter__(self):
         self.dataset = self.dataset.shuffle(
@@ -420,30 +308,10 @@ class XrDataset(IterableDataset):
             cos_lat_lons = np.cos(lat_lons)
             date = pd.to_datetime(data["timestamps"][0], utc=True)
 
-            solar_times = [
-                np.array(
-                    [
-                        extraterrestrial_irrad(
-                            when=date.to_pydatetime(), latitude_deg=lat, longitude_deg=lon
-                        )
-                        for lat, lon in lat_lons
-                    ]
-                )
-            ]
-            for when in pd.date_range(
-                date - pd.Timedelta("12 hours"), date + pd.Timedelta("12 hours"), freq="1H"
-            ):
-                solar_times.append(
-                    np.array(
-                        [
-                            extraterrestrial_irrad(
-                                when=when.to_pydatetime(), latitude_deg=lat, longitude_deg=lon
-                            )
-                            for lat, lon in lat_lons
-                        ]
-                    )
-                )
-            solar_times = np.array(solar_times)
+            # [26, lat * lon]: irradiance at the time and at every hour of the +-12 hours window
+            if self.solar_cache is None:
+                self.solar_cache = SolarIrradianceCache(lat_lons[:, 0], lat_lons[:, 1])
+            solar_times = self.solar_cache.window(date)
 
             # Normalize to between -1 and 1
             solar_times -= const.SOLAR_MEAN